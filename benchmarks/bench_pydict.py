@@ -0,0 +1,322 @@
+"""Benchmarks for the pydict family, compared against the builtin mappings.
+
+Run the suite, saving the results as JSON:
+    python benchmarks/bench_pydict.py run -o results.json
+    python benchmarks/bench_pydict.py run --sizes 10 1000 --key-types int --ops getitem_hit
+
+Compare two result files, exiting with status 1 if any timing regressed
+by more than the threshold (a fraction, 0.10 = 10% slower):
+    python benchmarks/bench_pydict.py compare old.json new.json --threshold 0.10
+
+Every result is the best of --repeat runs, in seconds per key.
+Once a single run for an (operation, implementation, key type) takes
+longer than --budget seconds, its larger sizes are skipped.
+"""
+
+import argparse
+import collections
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pydict as _pydict_module
+from pydict import pydict, OrderedPyDict, ShallowChainMap, DeepChainMap
+
+SIZES = (10, 100, 1000, 10_000, 100_000, 1_000_000)
+KEY_TYPES = ("int", "str", "tuple")
+CHAIN_DEPTHS = (1, 4, 16)
+
+# Lookups and other per-key operations are timed over at most this many keys
+SAMPLE = 10_000
+
+
+def make_keys(key_type, n):
+    "Return a list of n distinct keys of the given type."
+    if key_type == "int":
+        return list(range(n))
+    if key_type == "str":
+        return [f"key{i}" for i in range(n)]
+    if key_type == "tuple":
+        return [(i, str(i)) for i in range(n)]
+    raise ValueError(f"unknown key type {key_type!r}")
+
+
+def make_missing_keys(key_type, n):
+    "Return a list of n keys which make_keys(key_type, n) doesn't contain."
+    return make_keys(key_type, 2 * n)[n:]
+
+
+def timed(func):
+    "Return the seconds taken by func()."
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+##################################
+### Benchmarked operations
+##################################
+# Each operation takes (mapping type, keys, missing keys) and returns
+# (seconds, number of keys the seconds were spent on).
+
+def bench_setitem(cls, keys, missing):
+    def run():
+        d = cls()
+        for key in keys:
+            d[key] = key
+    return timed(run), len(keys)
+
+def bench_getitem_hit(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    sample = keys[:SAMPLE]
+    def run():
+        for key in sample:
+            d[key]
+    return timed(run), len(sample)
+
+def bench_getitem_miss(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    sample = missing[:SAMPLE]
+    def run():
+        for key in sample:
+            try:
+                d[key]
+            except KeyError:
+                pass
+    return timed(run), len(sample)
+
+def bench_delitem(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    sample = keys[:SAMPLE]
+    def run():
+        for key in sample:
+            del d[key]
+    return timed(run), len(sample)
+
+def bench_iter_keys(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    def run():
+        for key in d.keys():
+            pass
+    return timed(run), len(keys)
+
+def bench_iter_values(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    def run():
+        for value in d.values():
+            pass
+    return timed(run), len(keys)
+
+def bench_iter_items(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    def run():
+        for item in d.items():
+            pass
+    return timed(run), len(keys)
+
+def bench_update(cls, keys, missing):
+    source = cls(zip(keys, keys))
+    def run():
+        cls().update(source)
+    return timed(run), len(keys)
+
+def bench_copy(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    return timed(d.copy), len(keys)
+
+def bench_eq(cls, keys, missing):
+    d, other = cls(zip(keys, keys)), cls(zip(keys, keys))
+    def run():
+        d == other
+    return timed(run), len(keys)
+
+def bench_set_views(cls, keys, missing):
+    half = len(keys) // 2
+    d = cls(zip(keys, keys))
+    other = cls(zip(keys[half:] + missing[:half], keys))
+    def run():
+        a, b = d.keys(), other.keys()
+        a & b
+        a | b
+        a - b
+        a ^ b
+    return timed(run), len(keys)
+
+def bench_move_to_end(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    sample = keys[:SAMPLE]
+    def run():
+        for key in sample:
+            d.move_to_end(key)
+    return timed(run), len(sample)
+
+def bench_popitem(cls, keys, missing):
+    d = cls(zip(keys, keys))
+    count = min(len(keys), SAMPLE)
+    def run():
+        for i in range(count):
+            d.popitem()
+    return timed(run), count
+
+OPERATIONS = {
+    "setitem": bench_setitem,
+    "getitem_hit": bench_getitem_hit,
+    "getitem_miss": bench_getitem_miss,
+    "delitem": bench_delitem,
+    "iter_keys": bench_iter_keys,
+    "iter_values": bench_iter_values,
+    "iter_items": bench_iter_items,
+    "update": bench_update,
+    "copy": bench_copy,
+    "eq": bench_eq,
+    "set_views": bench_set_views,
+    "move_to_end": bench_move_to_end,
+    "popitem": bench_popitem,
+}
+
+# Implementations benchmarked for each operation
+IMPLEMENTATIONS = {
+    "pydict": pydict,
+    "dict": dict,
+}
+ORDERED_IMPLEMENTATIONS = {
+    "OrderedPyDict": OrderedPyDict,
+    "OrderedDict": collections.OrderedDict,
+}
+ORDERED_OPERATIONS = ("move_to_end", "popitem")
+
+
+def make_chain_bench(depth):
+    "Return an operation looking up keys stored in the last of depth layers."
+    def bench_chain(cls, keys, missing):
+        layers = [cls.layer() for i in range(depth - 1)]
+        chain = cls(*layers, cls.layer(zip(keys, keys)))
+        sample = keys[:SAMPLE]
+        def run():
+            for key in sample:
+                chain[key]
+        return timed(run), len(sample)
+    return bench_chain
+
+def chain_type(chain, layer):
+    "Return chain with a layer attribute, the type of its layers."
+    return type(chain.__name__, (chain,), {"layer": layer, "__slots__": ()})
+
+CHAIN_IMPLEMENTATIONS = {
+    "ShallowChainMap": chain_type(ShallowChainMap, pydict),
+    "DeepChainMap": chain_type(DeepChainMap, pydict),
+    "ChainMap": chain_type(collections.ChainMap, dict),
+}
+for depth in CHAIN_DEPTHS:
+    OPERATIONS[f"chain_depth_{depth}"] = make_chain_bench(depth)
+
+
+def implementations_for(op):
+    "Return the implementations an operation is benchmarked with."
+    if op.startswith("chain_depth_"):
+        return CHAIN_IMPLEMENTATIONS
+    if op in ORDERED_OPERATIONS:
+        return ORDERED_IMPLEMENTATIONS
+    return IMPLEMENTATIONS
+
+
+##################################
+### Commands
+##################################
+
+def run(args):
+    "Run the benchmarks, write the results as JSON."
+    results = []
+    for op in args.ops:
+        bench = OPERATIONS[op]
+        for impl, cls in implementations_for(op).items():
+            for key_type in args.key_types:
+                for size in sorted(args.sizes):
+                    keys = make_keys(key_type, size)
+                    missing = make_missing_keys(key_type, size)
+                    best = None
+                    for i in range(args.repeat):
+                        seconds, count = bench(cls, keys, missing)
+                        per_key = seconds / max(count, 1)
+                        if best is None or per_key < best:
+                            best = per_key
+                    results.append({
+                        "op": op, "impl": impl, "key_type": key_type,
+                        "size": size, "seconds_per_key": best,
+                    })
+                    print(f"{op:>16} {impl:>16} {key_type:>6} {size:>8} "
+                          f"{best * 1e9:12.1f} ns/key", flush=True)
+                    # Skip larger sizes once one run is over budget
+                    if seconds > args.budget:
+                        break
+    data = {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(),
+            "pydict": _pydict_module.__file__,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as fp:
+        json.dump(data, fp, indent=1)
+    print(f"Wrote {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args):
+    "Compare two result files. Return 1 if any timing regressed beyond the threshold."
+    def load(path):
+        with open(path) as fp:
+            data = json.load(fp)
+        return {(r["op"], r["impl"], r["key_type"], r["size"]): r["seconds_per_key"]
+                for r in data["results"]}
+    old, new = load(args.old), load(args.new)
+    regressions = 0
+    for key in sorted(old.keys() & new.keys(), key=str):
+        ratio = new[key] / old[key] if old[key] else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            flag = "  improved"
+        op, impl, key_type, size = key
+        print(f"{op:>16} {impl:>16} {key_type:>6} {size:>8} "
+              f"{old[key] * 1e9:12.1f} -> {new[key] * 1e9:12.1f} ns/key "
+              f"({ratio:5.2f}x){flag}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    run_parser.add_argument("--key-types", nargs="+", choices=KEY_TYPES, default=list(KEY_TYPES))
+    run_parser.add_argument("--ops", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS))
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--budget", type=float, default=5.0,
+                            help="skip larger sizes once one run takes longer (seconds)")
+    run_parser.add_argument("-o", "--output", default="bench_results.json")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""Asymptotic complexity checks for the pydict family.
+
+Every public operation is timed at doubling sizes, and the growth exponent
+of its time per call is fitted on a log-log scale. An operation fails when
+its exponent exceeds the bound of its complexity class plus the slack:
+    O(1) and amortized O(1) operations: 0
+    O(n) operations: 1
+An operation whose time is mostly cache misses is checked against a lookup
+paying the same misses: the exponent is fitted to the ratio of their times.
+
+    python benchmarks/complexity.py
+    python benchmarks/complexity.py --sizes 4096 8192 16384 32768 --slack 0.3 -k move_to_end
+
+Exits with status 1 if any operation fails, so it can run in CI.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydict import pydict, frozenpydict, OrderedPyDict, defaultpydict
+
+SIZES = (2 ** 12, 2 ** 13, 2 ** 14, 2 ** 15, 2 ** 16)
+
+# Constant time operations are timed over this many calls
+CALLS = 2000
+
+
+def timed(func):
+    "Return the seconds taken by func()."
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def filled(cls, n):
+    "Return an instance of cls holding the keys range(n)."
+    return cls(zip(range(n), range(n)))
+
+
+##################################
+### Operations
+##################################
+# Each operation takes a size n and returns (seconds, number of calls timed)
+
+def getitem_hit(n):
+    d = filled(pydict, n)
+    keys = range(n - CALLS, n)
+    def run():
+        for key in keys:
+            d[key]
+    return timed(run), len(keys)
+
+def getitem_miss(n):
+    d = filled(pydict, n)
+    keys = range(-CALLS, 0)
+    def run():
+        for key in keys:
+            try:
+                d[key]
+            except KeyError:
+                pass
+    return timed(run), len(keys)
+
+def contains(n):
+    d = filled(pydict, n)
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            key in d
+    return timed(run), len(keys)
+
+def contains_keys_view(n):
+    view = filled(pydict, n).keys()
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            key in view
+    return timed(run), len(keys)
+
+def contains_items_view(n):
+    view = filled(pydict, n).items()
+    items = [(key, key) for key in range(n - CALLS, n + CALLS)]
+    def run():
+        for item in items:
+            item in view
+    return timed(run), len(items)
+
+def get(n):
+    d = filled(pydict, n)
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            d.get(key)
+    return timed(run), len(keys)
+
+def get_defaultpydict(n):
+    d = defaultpydict(int, zip(range(n), range(n)))
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            d.get(key)
+    return timed(run), len(keys)
+
+def setdefault(n):
+    d = filled(pydict, n)
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            d.setdefault(key)
+    return timed(run), len(keys)
+
+def setitem_existing(n):
+    d = filled(pydict, n)
+    keys = range(n - CALLS, n)
+    def run():
+        for key in keys:
+            d[key] = None
+    return timed(run), len(keys)
+
+def setitem_new(n):
+    # Amortized: includes every resize on the way to n keys
+    def run():
+        d = pydict()
+        for key in range(n):
+            d[key] = key
+    return timed(run), n
+
+def strided(n):
+    "Return about CALLS keys of range(n), spread evenly over it."
+    return range(0, n, max(n // CALLS, 1))
+
+# The keys of a strided run are far apart in memory. At the larger sizes,
+# most of the time goes to cache misses, which grow with the size however
+# many keys are looked at. A lookup of the same keys pays the same misses,
+# so these operations are checked against it: the exponent fitted is that
+# of their time divided by the lookup's.
+def getitem_strided(n):
+    d = filled(pydict, n)
+    keys = strided(n)
+    def run():
+        for key in keys:
+            d[key]
+    return timed(run), len(keys)
+
+def delitem(n):
+    d = filled(pydict, n)
+    keys = strided(n)
+    def run():
+        for key in keys:
+            del d[key]
+    return timed(run), len(keys)
+
+# Deleting a run of neighbouring keys, which share cache lines, separates
+# the cost of the deletions from that of the cache misses of a strided run.
+def delitem_run(n):
+    d = filled(pydict, n)
+    keys = range(n // 2, n // 2 + CALLS)
+    def run():
+        for key in keys:
+            del d[key]
+    return timed(run), len(keys)
+
+def pop(n):
+    d = filled(pydict, n)
+    keys = strided(n)[::-1]
+    def run():
+        for key in keys:
+            d.pop(key)
+    return timed(run), len(keys)
+
+def pop_run(n):
+    d = filled(pydict, n)
+    keys = range(n // 2 + CALLS, n // 2, -1)
+    def run():
+        for key in keys:
+            d.pop(key)
+    return timed(run), len(keys)
+
+def popitem_last(n):
+    d = filled(OrderedPyDict, n)
+    def run():
+        for i in range(CALLS):
+            d.popitem()
+    return timed(run), CALLS
+
+def popitem_first(n):
+    d = filled(OrderedPyDict, n)
+    def run():
+        for i in range(CALLS):
+            d.popitem(last=False)
+    return timed(run), CALLS
+
+def move_to_end_last(n):
+    d = filled(OrderedPyDict, n)
+    def run():
+        for key in range(CALLS):
+            d.move_to_end(key)
+    return timed(run), CALLS
+
+def move_to_end_first(n):
+    d = filled(OrderedPyDict, n)
+    # Amortized: the first move makes room for the next n moves
+    d.move_to_end(n - 1, last=False)
+    def run():
+        for key in range(n - 2, n - 2 - CALLS, -1):
+            d.move_to_end(key, last=False)
+    return timed(run), CALLS
+
+def length(n):
+    d = filled(pydict, n)
+    def run():
+        for i in range(CALLS):
+            len(d)
+    return timed(run), CALLS
+
+def frozen_getitem(n):
+    d = filled(frozenpydict, n)
+    keys = range(n - CALLS, n)
+    def run():
+        for key in keys:
+            d[key]
+    return timed(run), len(keys)
+
+def frozen_contains(n):
+    d = filled(frozenpydict, n)
+    keys = range(n - CALLS, n + CALLS)
+    def run():
+        for key in keys:
+            key in d
+    return timed(run), len(keys)
+
+def iterate(n):
+    d = filled(pydict, n)
+    def run():
+        for item in d.items():
+            pass
+    return timed(run), 1
+
+def copy(n):
+    d = filled(pydict, n)
+    return timed(d.copy), 1
+
+def eq(n):
+    d, other = filled(pydict, n), filled(pydict, n)
+    def run():
+        d == other
+    return timed(run), 1
+
+def update(n):
+    source = filled(pydict, n)
+    def run():
+        pydict().update(source)
+    return timed(run), 1
+
+def clear(n):
+    d = filled(pydict, n)
+    return timed(d.clear), 1
+
+# (operation, bound on its growth exponent[, reference operation it's divided by])
+CONSTANT = 0
+LINEAR = 1
+OPERATIONS = [
+    (getitem_hit, CONSTANT),
+    (getitem_miss, CONSTANT),
+    (contains, CONSTANT),
+    (contains_keys_view, CONSTANT),
+    (contains_items_view, CONSTANT),
+    (get, CONSTANT),
+    (get_defaultpydict, CONSTANT),
+    (setdefault, CONSTANT),
+    (setitem_existing, CONSTANT),
+    (setitem_new, CONSTANT),
+    (delitem, CONSTANT, getitem_strided),
+    (delitem_run, CONSTANT),
+    (pop, CONSTANT, getitem_strided),
+    (pop_run, CONSTANT),
+    (popitem_last, CONSTANT),
+    (popitem_first, CONSTANT),
+    (move_to_end_last, CONSTANT),
+    (move_to_end_first, CONSTANT),
+    (length, CONSTANT),
+    (frozen_getitem, CONSTANT),
+    (frozen_contains, CONSTANT),
+    (iterate, LINEAR),
+    (copy, LINEAR),
+    (eq, LINEAR),
+    (update, LINEAR),
+    (clear, LINEAR),
+]
+
+
+def growth_exponent(sizes, times):
+    "Return the least squares slope of log(times) against log(sizes)."
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    return numerator / denominator
+
+
+def measure(operation, sizes, repeat, reference=None):
+    """Return the best time per call of operation at each size. If reference
+    is given, return instead the median ratio of the time of operation to that
+    of reference timed right after it, at the same size and so in the same
+    conditions."""
+    times = []
+    for n in sizes:
+        results = []
+        for i in range(repeat):
+            seconds, calls = operation(n)
+            per_call = seconds / calls
+            if reference is not None:
+                seconds, calls = reference(n)
+                per_call /= seconds / calls
+            results.append(per_call)
+        results.sort()
+        times.append(results[0] if reference is None else results[len(results) // 2])
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--slack", type=float, default=0.3,
+                        help="allowed growth exponent above each bound")
+    parser.add_argument("-k", dest="select", default="",
+                        help="only check operations whose name contains this")
+    args = parser.parse_args(argv)
+    sizes = sorted(args.sizes)
+    if len(sizes) < 2:
+        parser.error("at least two sizes are needed")
+
+    failures = []
+    for operation, bound, *reference in OPERATIONS:
+        name = operation.__name__
+        if args.select not in name:
+            continue
+        reference = reference[0] if reference else None
+        times = measure(operation, sizes, args.repeat, reference)
+        exponent = growth_exponent(sizes, times)
+        ok = exponent <= bound + args.slack
+        if not ok:
+            failures.append(name)
+        if reference is None:
+            timings = "us/call: " + " ".join(f"{t * 1e6:10.2f}" for t in times)
+        else:
+            timings = f"/ {reference.__name__}: " + " ".join(f"{t:6.2f}" for t in times)
+        print(f"{name:>20}  O(n^{bound})  exponent {exponent:5.2f}  "
+              f"{'ok' if ok else 'FAIL'}  {timings}", flush=True)
+    if failures:
+        print(f"{len(failures)} operation(s) grew faster than allowed: {', '.join(failures)}")
+        return 1
+    print("All operations within their complexity bounds.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Import time check for pydict.
+
+`import pydict` only defines the core types. The chain maps, the specialized
+variants, profiling and NumPy load on first use, through the package's
+module level __getattr__. This times `import pydict`, and `from pydict import *`,
+in fresh interpreters, and checks which modules they imported.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 20 --max-ms 10
+
+Exits with status 1 if the best import time exceeds --max-ms, or if the
+import loaded a module which should load lazily, so it can run in CI.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules which `import pydict` and `from pydict import *` must not import
+LAZY_MODULES = (
+    "pydict.chainmap",
+    "pydict.intpydict",
+    "pydict.sharedkeys",
+    "pydict.persistent",
+    "pydict.bipydict",
+    "pydict.sortedpydict",
+    "pydict.weak",
+    "pydict.profiling",
+    "pydict.bulk",
+    "pydict.asyncloading",
+    "pydict.jsonio",
+    "pydict.derived",
+    "numpy",
+)
+
+# Run in a fresh interpreter: time the import, report the modules it added
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+# The imports checked
+IMPORTS = ("import pydict", "from pydict import *")
+
+
+def import_pydict(env, statement=IMPORTS[0]):
+    "Run statement in a fresh interpreter. Return (seconds, modules it imported)."
+    code = CHILD.format(root=ROOT, statement=statement)
+    output = subprocess.run([sys.executable, "-c", code], env=env,
+                            check=True, capture_output=True, text=True).stdout
+    result = json.loads(output)
+    return result["seconds"], result["modules"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=10.0,
+                        help="allowed best import time (milliseconds)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache:
+        # Time imports from cached bytecode, as users see them, without
+        # writing the cache into the source tree
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        import_pydict(env)
+        results = [[import_pydict(env, statement) for i in range(args.repeat)] for statement in IMPORTS]
+
+    failures = []
+    for statement, runs in zip(IMPORTS, results):
+        times = sorted(seconds for seconds, modules in runs)
+        modules = runs[0][1]
+        print(f"{statement}: best {times[0] * 1e3:.2f} ms, "
+              f"median {times[len(times) // 2] * 1e3:.2f} ms over {len(times)} runs")
+        print(f"modules imported: {', '.join(modules)}")
+        eager = [name for name in modules if name in LAZY_MODULES]
+        if eager:
+            failures.append(f"{statement} imported modules which should load lazily: {', '.join(eager)}")
+        if times[0] * 1e3 > args.max_ms:
+            failures.append(f"{statement}: best import time {times[0] * 1e3:.2f} ms exceeds {args.max_ms} ms")
+    for failure in failures:
+        print(failure)
+    if failures:
+        return 1
+    print("Import time within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,3 @@
-import pydict
-for key in dir(pydict):
-    if "Iterator" in key:
-        eval(f"{key} = pydict.{key}")
-        eval(f"{key}.__module__ = 'iterators'")
\ No newline at end of file
+from pydict import (PyDictIterator, PyDictKeyIterator, PyDictValueIterator, PyDictItemIterator,
+                    PyDictReverseIterator, PyDictReverseKeyIterator, PyDictReverseValueIterator,
+                    PyDictReverseItemIterator)
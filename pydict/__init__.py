@@ -0,0 +1,2376 @@
+import _collections_abc
+import bisect as _bisect
+import os as _os
+import sys as _sys
+import types as _types
+
+#####################################################
+### Internal classes, constants, and variables. 
+####################################################
+
+# Minimum pydict size. Sizes are always prime, so that the bucket
+# of a hash code depends on all of its bits, not just the low ones.
+_MIN_SIZE = 11
+
+# Overflow chains this long are converted to tree bins
+_TREEIFY_THRESHOLD = 8
+
+# Tree bins this short are converted back to overflow chains
+_UNTREEIFY_THRESHOLD = 6
+
+# Tree bins this long make a pydict choose a new hash seed
+_CHAIN_LIMIT = 16
+
+# Hash tables with at least this many buckets are resized incrementally.
+# Instead of one insert moving every node to the new hash table, every
+# later insert or delete moves the nodes of a few buckets.
+_INCREMENTAL_RESIZE_SIZE = 4096
+
+# Buckets moved by each insert or delete during an incremental resize
+_REHASH_STEP = 8
+
+def _new_seed():
+    "Return a new random hash seed."
+    return int.from_bytes(_os.urandom(8), "little")
+
+# Hash seed of this process. Hash codes are XORed with a seed before
+# being trimmed to a bucket, so an attacker who knows the hash codes of
+# their keys still can't predict which keys share a bucket.
+_hash_seed = _new_seed()
+
+def _prime_at_least(n):
+    "Return the smallest prime >= n."
+    n = max(n, 2)
+    while True:
+        for d in range(2, int(n ** 0.5) + 1):
+            if n % d == 0:
+                break
+        else:
+            return n
+        n += 1
+
+# Bits of a 64 bit hash code
+_MASK64 = (1 << 64) - 1
+
+# Placeholder for a deleted key in a pydict's keys list
+_deleted = object()
+
+#Resize function. Large hash tables may be resized incrementally.
+def _resize_pydict(pd, size, incremental=False):
+    # Self is the pd
+    self = pd
+    # Finish any incremental resize first
+    if self._rehash is not None:
+        _finish_rehash(self)
+    # Get the old hash table
+    old_table = self._hash_table
+    # Double size, keeping it prime
+    self._size = size = _prime_at_least(size)
+    # Count the resize, for stats()
+    self._resizes += 1
+    # Reset hash tables
+    self._hash_table = table = [None] * self._size
+    # Leave the nodes of a large hash table where they are. Later
+    # inserts and deletes will move them, a few buckets at a time.
+    if incremental and len(old_table) >= _INCREMENTAL_RESIZE_SIZE:
+        self._rehash = _Rehash(old_table, self._seed)
+        return
+    # Move every node into its new bucket. Nodes remember their
+    # full hash code, so no key is hashed or compared again.
+    seed = self._seed
+    # Buckets which received the nodes of tree bins
+    tree_buckets = []
+    for node in old_table:
+        if node.__class__ is _TreeBin:
+            for node in node.nodes:
+                h = (node.hashcode ^ seed) % size
+                node.overflow = table[h]
+                table[h] = node
+                tree_buckets.append(h)
+            continue
+        while node is not None:
+            next_node = node.overflow
+            h = (node.hashcode ^ seed) % size
+            node.overflow = table[h]
+            table[h] = node
+            node = next_node
+    # The nodes of a tree bin may still share a bucket. Treeify it again.
+    for h in tree_buckets:
+        node = table[h]
+        length = 0
+        while node is not None:
+            length += 1
+            node = node.overflow
+        if length >= _TREEIFY_THRESHOLD:
+            _treeify(table, h)
+    
+#Move the nodes of up to count buckets of a pydict's old hash table
+#(from an incremental resize) into its new hash table
+def _rehash_step(pd, count=_REHASH_STEP):
+    rehash = pd._rehash
+    old = rehash.table
+    table, size, seed = pd._hash_table, pd._size, pd._seed
+    start = rehash.next
+    end = min(start + count, rehash.size)
+    # Buckets whose overflow chains grew
+    grown = []
+    for b in range(start, end):
+        node = old[b]
+        if node is None:
+            continue
+        old[b] = None
+        if node.__class__ is _TreeBin:
+            nodes = node.nodes
+        else:
+            nodes = []
+            while node is not None:
+                nodes.append(node)
+                node = node.overflow
+        for node in nodes:
+            h = (node.hashcode ^ seed) % size
+            first = table[h]
+            if first.__class__ is _TreeBin:
+                node.overflow = None
+                first.insert(node)
+            else:
+                node.overflow = first
+                table[h] = node
+                grown.append(h)
+    rehash.next = end
+    if end == rehash.size:
+        pd._rehash = None
+    # Convert the chains which grew too long to tree bins
+    for h in grown:
+        node = table[h]
+        length = 0
+        while node is not None:
+            length += 1
+            node = node.overflow
+        if length >= _TREEIFY_THRESHOLD:
+            _treeify(table, h)
+
+#Move every node left in a pydict's old hash table into its new hash table
+def _finish_rehash(pd):
+    _rehash_step(pd, pd._rehash.size)
+
+#Convert the overflow chain of bucket b to a tree bin
+def _treeify(table, b):
+    tree = _TreeBin()
+    node = table[b]
+    while node is not None:
+        next_node = node.overflow
+        node.overflow = None
+        tree.insert(node)
+        node = next_node
+    table[b] = tree
+    
+#Convert the tree bin of bucket b to an overflow chain
+def _untreeify(table, b):
+    first = None
+    for node in reversed(table[b].nodes):
+        node.overflow = first
+        first = node
+    table[b] = first
+    
+#Choose a new hash seed for a pydict whose bucket b has a long tree bin
+def _reseed_pydict(pd, b):
+    # Nodes with the same hash code share a bucket whatever the seed is.
+    # Only choose a new seed if it will split up enough of them.
+    if len(set(pd._hash_table[b].hashes)) < _TREEIFY_THRESHOLD:
+        return
+    # Rebuild the hash table with a seed only this pydict knows
+    pd._seed = _new_seed()
+    _resize_pydict(pd, pd._size)
+    
+#Repack the keys list of a pydict, dropping deleted keys.
+#Leave pad deleted keys at the front, for keys moved to the front.
+def _repack_pydict(pd, pad=0):
+    keys = pd._keys
+    # Find the node of every key, by its index, in both hash
+    # tables during an incremental resize
+    nodes = [None] * len(keys)
+    tables = [pd._hash_table]
+    if pd._rehash is not None:
+        tables.append(pd._rehash.table)
+    for table in tables:
+        for node in table:
+            if node.__class__ is _TreeBin:
+                for node in node.nodes:
+                    nodes[node.index] = node
+                continue
+            while node is not None:
+                nodes[node.index] = node
+                node = node.overflow
+    # Rebuild the keys list, renumbering the nodes
+    new_keys = [_deleted] * pad
+    for node in nodes:
+        if node is not None:
+            node.index = len(new_keys)
+            new_keys.append(node.key)
+    pd._keys = new_keys
+    pd._first = pad
+
+#Fill an empty pydict with distinct keys, in order, given their hash codes
+#and values. Every node is placed straight into its bucket of a hash table
+#sized for all of them, so no key is looked up or compared.
+def _place_pydict(pd, hashes, keys, values):
+    n = len(keys)
+    pd._size = size = _prime_at_least(max(_MIN_SIZE, n * 3 // 2 + 1))
+    pd._hash_table = table = [None] * size
+    seed = pd._seed
+    buckets = [(h ^ seed) % size for h in hashes]
+    for index, b, h, key, value in zip(range(n), buckets, hashes, keys, values):
+        table[b] = _Node(h, key, value, table[b], index)
+    pd._keys = list(keys)
+    pd._used = n
+    # Convert long overflow chains to tree bins, as inserting would have
+    lengths = [0] * size
+    for b in buckets:
+        lengths[b] += 1
+    long_buckets = [b for b, length in enumerate(lengths) if length >= _TREEIFY_THRESHOLD]
+    for b in long_buckets:
+        _treeify(table, b)
+    # Choose a new seed if a tree bin is too long, rebuilding the hash table once
+    for b in long_buckets:
+        if lengths[b] >= _CHAIN_LIMIT:
+            _reseed_pydict(pd, b)
+            if pd._seed != seed:
+                return
+
+# sys.getrefcount, where the interpreter has it
+_getrefcount = getattr(_sys, "getrefcount", None)
+
+#Give a pydict which shares its storage with its copies storage of its own.
+#Call before changing the keys list, hash table or nodes of a pydict whose
+#_cow isn't None.
+def _unshare_pydict(pd):
+    cow = pd._cow
+    pd._cow = None
+    # The copy-on-write token is only referenced by the _cow of the pydicts 
+    # sharing the storage, and by this call (twice). When none of them
+    # is left, the storage is pd's alone.
+    if _getrefcount is not None and _getrefcount(cow) <= 2:
+        return
+    # Copy the keys list, the hash table and every node. No key is hashed.
+    pd._keys = pd._keys[:]
+    pd._hash_table = [node if node is None else node.copy() for node in pd._hash_table]
+    rehash = pd._rehash
+    if rehash is not None:
+        pd._rehash = _Rehash([node if node is None else node.copy() for node in rehash.table], rehash.seed)
+        pd._rehash.next = rehash.next
+
+#Stats of a hash table, shared by pydict.stats and frozenpydict.stats
+def _table_stats(table, used, keys, resizes):
+    # Walk every bucket, measuring the length of its overflow chain
+    histogram = {}
+    entries_size = 0
+    tree_buckets = 0
+    for node in table:
+        length = 0
+        if isinstance(node, _TreeBin):
+            entries_size += node.__sizeof__()
+            length = len(node.nodes)
+            tree_buckets += 1
+        elif isinstance(node, _Node):
+            entries_size += node.__sizeof__()
+            while node is not None:
+                length += 1
+                node = node.overflow
+        histogram[length] = histogram.get(length, 0) + 1
+    buckets = len(table)
+    # Sort the histogram by chain length
+    chains = pydict()
+    for length in sorted(histogram):
+        chains[length] = histogram[length]
+    stats = pydict()
+    stats["length"] = used
+    stats["buckets"] = buckets
+    stats["load_factor"] = used / buckets
+    stats["empty_buckets"] = histogram.get(0, 0) / buckets
+    stats["chain_lengths"] = chains
+    stats["longest_chain"] = max(histogram)
+    stats["tree_buckets"] = tree_buckets
+    stats["resizes"] = resizes
+    memory = pydict()
+    memory["index"] = table.__sizeof__()
+    memory["entries"] = entries_size
+    memory["order"] = keys.__sizeof__()
+    stats["memory"] = memory
+    return stats
+
+#Find the nodes of many keys in a hash table, in one loop. None for missing keys.
+#rehash is the old hash table of an incremental resize, if any, and hashes
+#the hash codes of the keys, if known.
+def _find_nodes(table, size, seed, keys, rehash=None, hashes=None):
+    nodes = []
+    append = nodes.append
+    if hashes is None:
+        hashes = map(hash, keys)
+    for key, h in zip(keys, hashes):
+        node = first = table[(h ^ seed) % size]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                break
+            node = node.overflow
+        else:
+            # A tree bin's nodes aren't in its overflow. Search it.
+            if first.__class__ is _TreeBin:
+                node = first.find(h, key)
+            if node is None and rehash is not None:
+                node = rehash.find(h, key)
+        append(node)
+    return nodes
+
+#Keys given to a batch method, as a list, and whether they were a NumPy array.
+#NumPy is optional, and never imported here: if it isn't imported yet, keys
+#can't be an array.
+def _batch_keys(keys):
+    np = _sys.modules.get("numpy")
+    if np is not None and isinstance(keys, np.ndarray):
+        # Python scalars hash and compare faster than NumPy scalars
+        return keys.tolist(), True
+    if not isinstance(keys, (list, tuple)):
+        keys = list(keys)
+    return keys, False
+
+#Results of a batch method, as a NumPy array if its keys were one
+def _batch_result(results, as_array):
+    if not as_array:
+        return results
+    np = _sys.modules["numpy"]
+    array = np.array(results)
+    if array.ndim != 1:
+        # Values which are sequences became rows. Keep them whole.
+        array = np.empty(len(results), dtype=object)
+        for i, value in enumerate(results):
+            array[i] = value
+    return array
+
+#Hash of one item, from its key's hash code and its value
+def _item_hash(h, value):
+    h = hash((h & _MASK64, value))
+    # Spread the bits of similar hash codes before they are summed
+    return (((h ^ 89869747) ^ (h << 16)) * 3644798167) & _MASK64
+
+#Order independent hash total of many (key hash code, value) pairs. It can be
+#changed item by item: add the _item_hash of new items, subtract old ones.
+def _items_hash_total(pairs):
+    total = 0
+    for h, value in pairs:
+        total += _item_hash(h, value)
+    return total & _MASK64
+
+#Ids of pydicts (or frozenpydicts) being repr'ed
+_repr_pydicts = set()
+        
+        
+class _Node(object):
+    # hashcode is the key's full hash code, index is the key's index in the keys list
+    __slots__ = "hashcode", "key", "value", "overflow", "index"
+    def __init__(self, hashcode, key, value, overflow=None, index=-1):
+        self.hashcode = hashcode
+        self.key = key
+        self.value = value
+        self.overflow = overflow
+        self.index = index
+        
+    def __eq__(self, other):
+        if not isinstance(other, _Node):
+            return NotImplemented
+        return (self.hashcode, self.key, self.value, self.overflow) == \
+               (other.hashcode, other.key, other.value, other.overflow)
+        
+    def __repr__(self):
+        return "pydict._Node(hashcode={}, key={}, value={}, overflow={})".format(
+            self.hashcode, repr(self.key), repr(self.value), self.overflow
+        )
+    
+    def __sizeof__(self):
+        # Note: Omit key and value because they aren't internal
+        # Get size of self and size of self's hashcode
+        size = object.__sizeof__(self) + int.__sizeof__(self.hashcode)
+        # Get the size of all overflow nodes
+        node = self
+        while node.overflow != None:
+            node = node.overflow
+            size += object.__sizeof__(node) + int.__sizeof__(node.hashcode)
+        # We are done! Return the total
+        return size
+    
+    def copy(self):
+        result = _Node(self.hashcode, self.key, self.value, self.overflow, self.index)
+        n = result
+        while isinstance(n.overflow, _Node):
+            o = n.overflow
+            n.overflow = _Node(o.hashcode, o.key, o.value, o.overflow, o.index)
+            n = n.overflow
+        return result
+    
+# Types whose instances are totally ordered by <, so tree bins can sort them
+_ORDERED_TYPES = (int, str, bytes)
+
+class _TreeBin(object):
+    """Bucket of a hash table whose overflow chain grew long.
+    
+    Its nodes are kept sorted by hash code, then by key when all of its keys
+    are of one totally ordered type, so finding one takes O(log n) comparisons.
+    To the loops searching overflow chains, a tree bin looks like the 
+    end of an empty chain.
+    """
+    __slots__ = "hashes", "nodes", "key_type"
+    
+    # Never a corresponding node, no overflow
+    hashcode = overflow = None
+    
+    def __init__(self):
+        # hashes[i] is nodes[i].hashcode
+        self.hashes = []
+        self.nodes = []
+        # The type of every key if nodes with the same hash code are
+        # sorted by key, otherwise None
+        self.key_type = None
+        
+    def __len__(self):
+        return len(self.nodes)
+    
+    def __repr__(self):
+        return f"pydict._TreeBin(nodes={self.nodes})"
+    
+    def __sizeof__(self):
+        # Note: Omit keys and values because they aren't internal
+        size = object.__sizeof__(self) + self.hashes.__sizeof__() + self.nodes.__sizeof__()
+        for node in self.nodes:
+            size += node.__sizeof__()
+        return size
+    
+    def _locate(self, h, key):
+        "Return (index of key's node or index to insert it at, whether it was found)."
+        hashes, nodes = self.hashes, self.nodes
+        # Find the nodes with hash code h
+        lo = _bisect.bisect_left(hashes, h)
+        hi = _bisect.bisect_right(hashes, h, lo)
+        if key.__class__ is self.key_type:
+            # Search them by key
+            end = hi
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if nodes[mid].key < key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < end:
+                node_key = nodes[lo].key
+                if node_key is key or node_key == key:
+                    return lo, True
+            return lo, False
+        # Search them one by one
+        for i in range(lo, hi):
+            node_key = nodes[i].key
+            if node_key is key or node_key == key:
+                return i, True
+        return hi, False
+    
+    def find(self, h, key):
+        "Return the node with hash code h and key, or None if there is none."
+        i, found = self._locate(h, key)
+        if found:
+            return self.nodes[i]
+        return None
+    
+    def insert(self, node):
+        "Insert a node whose key isn't in the tree bin."
+        key_type = node.key.__class__
+        if not self.nodes and key_type in _ORDERED_TYPES:
+            self.key_type = key_type
+        elif key_type is not self.key_type:
+            # Keys of other types can't be ordered with the rest
+            self.key_type = None
+        i, found = self._locate(node.hashcode, node.key)
+        self.hashes.insert(i, node.hashcode)
+        self.nodes.insert(i, node)
+        
+    def copy(self):
+        "Return a copy of the tree bin, with copies of its nodes."
+        tree = _TreeBin()
+        tree.hashes = self.hashes[:]
+        tree.nodes = [node.copy() for node in self.nodes]
+        tree.key_type = self.key_type
+        return tree
+        
+    def remove(self, h, key):
+        "Remove and return the node with hash code h and key, or return None if there is none."
+        i, found = self._locate(h, key)
+        if not found:
+            return None
+        del self.hashes[i]
+        return self.nodes.pop(i)
+    
+class _Rehash(object):
+    """Old hash table of a pydict being resized incrementally.
+    
+    Buckets below next have had their nodes moved to the new hash table.
+    Until all of them have, keys missing from the new hash table are
+    looked up in the old one.
+    """
+    __slots__ = "table", "size", "seed", "next"
+    
+    def __init__(self, table, seed):
+        self.table = table
+        self.size = len(table)
+        self.seed = seed
+        self.next = 0
+    
+    def __repr__(self):
+        return f"pydict._Rehash(size={self.size}, next={self.next})"
+    
+    def find(self, h, key):
+        "Return the node with hash code h and key, or None if there is none."
+        node = first = self.table[(h ^ self.seed) % self.size]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return node
+            node = node.overflow
+        if first.__class__ is _TreeBin:
+            return first.find(h, key)
+        return None
+    
+    def remove(self, h, key):
+        "Remove and return the node with hash code h and key, or return None if there is none."
+        table = self.table
+        b = (h ^ self.seed) % self.size
+        prev = None
+        node = table[b]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                if prev is not None:
+                    prev.overflow = node.overflow
+                else:
+                    table[b] = node.overflow
+                return node
+            prev = node
+            node = node.overflow
+        tree = table[b]
+        if tree.__class__ is _TreeBin:
+            return tree.remove(h, key)
+        return None
+
+_marker = object()
+
+# Passed by this module to construct views and iterators. Nobody else has it.
+_construct = object()
+
+####################################################
+### pydict
+####################################################     
+
+class pydict(object):
+    """Python implementation of builtins.dict
+    
+    pydict() -> new empty python dictionary
+    pydict(mapping) -> new python dictionary initialized from the mapping's (key, value) pairs
+    pydict(iterable) -> new python dictionary initialized via:
+        p = pydict()
+        for key, value in iterable:
+            p[key] = value
+    pydict(**kwds) -> new python dictionary initialized from the keyword arguments (name, value) pairs
+    """
+    
+    __slots__ = (
+        "_keys", "_hash_table", "_size", "_resizes", "_used", "_first", "_seed", "_rehash", "_cow",
+        "_journal"
+    )
+    
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        # Get a raw object from object.__new__
+        self = object.__new__(cls)
+        
+        # Initiate private fields
+        # _keys may contain _deleted placeholders. _used is the number of
+        # keys that aren't, and every index below _first is _deleted.
+        # _rehash is the old hash table during an incremental resize.
+        # _cow is a token shared with copies sharing the storage, or None.
+        # _journal records the changes to self and tells the derived pydicts
+        # watching self of them, or is None. See enable_journal and _watch.
+        self._keys = []
+        self._size = _MIN_SIZE
+        self._hash_table = [None] * self._size
+        self._resizes = 0
+        self._used = 0
+        self._first = 0
+        self._seed = _hash_seed
+        self._rehash = None
+        self._cow = None
+        self._journal = None
+        
+        # Update self using mapping_or_iterable and kwds
+        self.update(mapping_or_iterable, **kwds)
+        
+        # Return the modified object
+        return self
+    
+    __class_getitem__ = classmethod(_types.GenericAlias)
+    
+    def __contains__(self, key):
+        "Return key in self."
+        # Get the hash code of the key, and the first node of its bucket
+        h = hash(key)
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        # Search the overflow for a corresponding node
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return True
+            node = node.overflow
+        # A tree bin's nodes aren't in its overflow. Search it.
+        if first.__class__ is _TreeBin and first.find(h, key) is not None:
+            return True
+        # A key not yet moved by an incremental resize is in the old hash table
+        rehash = self._rehash
+        return rehash is not None and rehash.find(h, key) is not None
+    
+    def __copy__(self):
+        "Implement copy.copy(self)."
+        return self.copy()
+        
+    def __delitem__(self, key):
+        "Delete self[key]."
+        # Stop sharing storage with copies
+        if self._cow is not None:
+            _unshare_pydict(self)
+        if self._journal is not None:
+            self._journal.record_delete(self, key)
+        # Move a few more buckets during an incremental resize
+        if self._rehash is not None:
+            _rehash_step(self)
+        # Ge the hash code of the key, and its bucket.
+        h = hash(key)
+        b = (h ^ self._seed) % self._size
+        # The previous node
+        prev = None
+        # The current node
+        node = self._hash_table[b]
+        # While the current node isn't None...
+        while node is not None:
+            # Is this the corresponding node?
+            if node.hashcode == h and (node.key is key or node.key == key):
+                # If so, is there a previous node in the overflow chain?
+                if prev is not None:
+                    # If so, chain this node's overflow to the previous node's overflow
+                    prev.overflow = node.overflow
+                else:
+                    # Otherwise, the node's overflow is the new reference in the hash slot
+                    self._hash_table[b] = node.overflow
+                # Remove the key from the pydict's keys
+                self._remove_index(node.index)
+                # Avoid future iteration and the upcoming else statement
+                break
+            # Set the previous node to the current, the current to the current's overflow
+            prev = node
+            node = node.overflow
+        else:
+            # A tree bin's nodes aren't in its overflow. Search it.
+            tree = self._hash_table[b]
+            if tree.__class__ is _TreeBin:
+                node = tree.remove(h, key)
+                if node is not None:
+                    self._remove_index(node.index)
+                    # Convert the tree bin back once it is short
+                    if len(tree) <= _UNTREEIFY_THRESHOLD:
+                        _untreeify(self._hash_table, b)
+                    return
+            # A key not yet moved by an incremental resize is in the old hash table
+            if self._rehash is not None:
+                node = self._rehash.remove(h, key)
+                if node is not None:
+                    self._remove_index(node.index)
+                    return
+            # Raise KeyError
+            raise KeyError(key)    
+    
+    def __eq__(self, other):
+        "Return self==other"
+        # Are self and other the same class? If not, return NotImplemented
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        # Check false with unequal length
+        if len(self) != len(other):
+            return False
+        # Iterate over my keys
+        for key in self:
+            # If other[key] is absent or unequal to self[key]
+            # Return False
+            try:
+                if self[key] != other[key]:
+                    return False
+            except KeyError:
+                return False
+        return True
+    
+    def __getitem__(self, key):
+        "Return self[key]."
+        # Get the hash value of the key.
+        h = hash(key)
+        # Get the first node of the key's bucket. Trim the hash value
+        # to be within the size (# of buckets available)
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        # Search the overflow. Is there a correct node?
+        while node is not None:
+            # If so, return its value.
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return node.value
+            node = node.overflow
+        # A tree bin's nodes aren't in its overflow. Search it.
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+            if node is not None:
+                return node.value
+        # A key not yet moved by an incremental resize is in the old hash table
+        if self._rehash is not None:
+            node = self._rehash.find(h, key)
+            if node is not None:
+                return node.value
+        # There is no corresponding node. Probe missing.
+        return self.__missing__(key)    
+    
+    # No hash code, as we are mutable.
+    __hash__ = None
+    
+    def __ior__(self, value):
+        "Return self|=value"
+        self.update(value)
+        return self
+    
+    def __iter__(self):
+        "Return iter(self)"
+        return PyDictKeyIterator(self, _construct)
+    
+    def __len__(self):
+        "Return len(self)."
+        # Return the number of my keys.
+        return self._used
+    
+    def __missing__(self, key):
+        "Fallback method when self[key] fails. \nRaises KeyError(key) by default."
+        raise KeyError(key)
+    
+    def _find_node(self, key, h=None):
+        """Return the node of key, or None if key isn't in self.
+        h is hash(key), if known."""
+        if h is None:
+            h = hash(key)
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return node
+            node = node.overflow
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+        if node is None and self._rehash is not None:
+            return self._rehash.find(h, key)
+        return node
+    
+    def _probe(self, key):
+        "Return (number of nodes visited looking up key, self[key], or _marker if key isn't found)."
+        h = hash(key)
+        tables = [(self._hash_table, self._size, self._seed)]
+        if self._rehash is not None:
+            # The old hash table is searched after the new one
+            tables.append((self._rehash.table, self._rehash.size, self._rehash.seed))
+        probes = 0
+        for table, size, seed in tables:
+            node = table[(h ^ seed) % size]
+            if node.__class__ is _TreeBin:
+                # Count the steps of the binary search
+                probes += len(node).bit_length()
+                node = node.find(h, key)
+                if node is not None:
+                    return probes, node.value
+                continue
+            while node is not None:
+                probes += 1
+                if node.hashcode == h and (node.key is key or node.key == key):
+                    return probes, node.value
+                node = node.overflow
+        return probes, _marker
+    
+    def _cow_copy(self):
+        "Return a copy of self of the same class, sharing self's storage until either is changed."
+        if self._cow is None:
+            self._cow = object()
+        pd = object.__new__(self.__class__)
+        pd._keys, pd._hash_table, pd._size, pd._used, pd._first, pd._seed, pd._rehash, pd._cow = \
+            self._keys, self._hash_table, self._size, self._used, self._first, self._seed, self._rehash, self._cow
+        pd._resizes = 0
+        # Copies don't record their changes
+        pd._journal = None
+        return pd
+    
+    def _remove_index(self, index):
+        "Remove the key at index from the keys list, leaving _deleted in its place."
+        keys = self._keys
+        keys[index] = _deleted
+        self._used -= 1
+        # The keys list never ends with _deleted
+        while keys and keys[-1] is _deleted:
+            keys.pop()
+        if self._first > len(keys):
+            self._first = len(keys)
+        # Repack when at least half of the keys list is _deleted
+        if len(keys) - self._used > self._used + _MIN_SIZE:
+            _repack_pydict(self)
+    
+    def __ne__(self, other):
+        "Return self!=other"
+        # Return the opposite of self==other
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        return not (self == other)
+    
+    def __or__(self, value):
+        "Return self|value"
+        pd = self.copy()
+        return pd.__ior__(value)
+    
+    def __repr__(self):
+        "Return repr(self)"
+        # If within the midst of another repr call on the same object,
+        # return a filler value
+        if id(self) in _repr_pydicts:
+            return "pydict({...})"
+        # Add this object to the set of current repr calls
+        _repr_pydicts.add(id(self))
+        # A list of parts, to be joined
+        parts = []
+        # Every part is key: value
+        for key, value in self.items():
+            parts.append(": ".join([repr(key), repr(value)]))
+        # There is no opportunity left for recursion. Therefore, remove
+        # this object from the set of current repr calls
+        _repr_pydicts.remove(id(self))
+        # Join all the parts with ", " add preceeding and suceeding strings.
+        # Return the new string.
+        return "pydict({" + ", ".join(parts) + "})"    
+         
+    def __reversed__(self):
+        "Return reversed(self)."
+        return PyDictReverseKeyIterator(self, _construct)
+    
+    def __ror__(self, value):
+        "Return value|self"
+        return self.__or__(value)
+    
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        # Stop sharing storage with copies
+        if self._cow is not None:
+            _unshare_pydict(self)
+        if self._journal is not None:
+            self._journal.record_set(self, key, value)
+        # Get the key's hash code.
+        h = hash(key)
+        # Get the node at the key's slot in the hash table
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        # If there is a corresponding node, update its value
+        chain = 0
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                node.value = value
+                return
+            chain += 1
+            node = node.overflow
+        # A tree bin's nodes aren't in its overflow. Search it.
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+            if node is not None:
+                node.value = value
+                return
+        # A key not yet moved by an incremental resize is in the old hash table.
+        # Otherwise, move a few more buckets.
+        rehash = self._rehash
+        if rehash is not None:
+            node = rehash.find(h, key)
+            if node is not None:
+                node.value = value
+                return
+            _rehash_step(self)
+        self._insert_node(h, key, value, chain)
+    
+    def _insert_node(self, h, key, value, chain):
+        """Add key, which isn't in self, with hash code h and value.
+        chain is the length of the chain of its bucket."""
+        # Resize if necessary (new length will be > threshold)
+        threshold = 2 / 3
+        if (self._used + 1) / self._size > threshold:
+            _resize_pydict(self, self._size * 2, True)
+            # The chain was split up
+            chain = 0
+        # Append to keys
+        keys = self._keys
+        keys.append(key)
+        self._used += 1
+        b = (h ^ self._seed) % self._size
+        table = self._hash_table
+        first = table[b]
+        node = _Node(h, key, value, None, len(keys) - 1)
+        if first.__class__ is _TreeBin:
+            # Insert the node into the tree bin. Fall back to a new
+            # seed if the tree bin grew too long.
+            first.insert(node)
+            if len(first) % _CHAIN_LIMIT == 0:
+                _reseed_pydict(self, b)
+        else:
+            # Chain the new node in front of the slot's nodes.
+            # Convert the chain to a tree bin if it grew too long.
+            node.overflow = first
+            table[b] = node
+            if chain + 1 >= _TREEIFY_THRESHOLD:
+                _treeify(table, b)
+
+    def _watch(self, watcher):
+        """Call watcher._changed(key) before key of self is set, deleted or moved,
+        and watcher._cleared() before self is cleared, for as long as watcher lives.
+        self only holds a weak reference to watcher, and stops telling once it's gone."""
+        if self.__class__.__getitem__ is not pydict.__getitem__:
+            # A subclass storing keys its own way doesn't change them through pydict
+            raise TypeError(f"{self.__class__.__name__} can't tell of its changes")
+        from weakref import ref
+        journal = self._journal
+        if journal is None:
+            self._journal = journal = _Journal(False)
+        watchers = journal.watchers
+        if watchers is None:
+            watchers = journal.watchers = {}
+        # Watchers may be unhashable mappings. Each one's reference
+        # removes itself when it dies, without referring to self.
+        watchers[id(watcher)] = ref(watcher, lambda r, watchers=watchers, i=id(watcher): watchers.pop(i, None))
+
+    def __sizeof__(self):
+        "Size of object in memory, in bytes."
+        # Get the raw size of the object
+        size = object.__sizeof__(self)
+        # Get size of internal keys list. 
+        # Its keys aren't private, so don't calculate their sizes
+        size += self._keys.__sizeof__()
+        # Get size of the internal size counter.
+        # TODO: delete the internal size counter and use len(self._hash_table) instead
+        size += self._size.__sizeof__()
+        # Get the size of internal hash tables, the old one too
+        # during an incremental resize
+        tables = [self._hash_table]
+        if self._rehash is not None:
+            size += object.__sizeof__(self._rehash)
+            tables.append(self._rehash.table)
+        for table in tables:
+            size += table.__sizeof__()
+            # Get the size of the internal nodes 
+            for obj in table:
+                # Ignore None because None is public
+                if isinstance(obj, (_Node, _TreeBin)):
+                    # Get the size of all the nodes
+                    size += obj.__sizeof__()
+        # That's the size!
+        return size
+    
+    def apply_delta(self, delta):
+        """Apply a PyDictDelta from another pydict's changes_since to self.
+        If self held the other pydict's items at delta.since, it holds them
+        as of delta.version afterwards, in the same order."""
+        if delta.clear:
+            self.clear()
+        for key in delta.deleted:
+            self.pop(key, None)
+        # Keys which stayed in place can be set in any order, all at once
+        if delta.items:
+            self.set_many(*zip(*delta.items))
+        for key, value, last in delta.placed:
+            self[key] = value
+            self.move_to_end(key, last)
+    
+    @classmethod
+    def build_bulk(cls, mapping_or_iterable=()):
+        """
+        Create and return a new pydict, p, of type cls, like cls(mapping_or_iterable),
+        for large inputs. The distinct keys are found in one pass, then the hash
+        table is filled by placing every node straight into its bucket, so no
+        key is looked up in p. Key order is that of cls(mapping_or_iterable).
+        A subclass with its own constructor gets cls() updated with the items.
+        """
+        from pydict.bulk import _build_bulk
+        pd = _build_bulk(mapping_or_iterable)
+        if cls is pydict:
+            return pd
+        if cls.__new__ is pydict.__new__:
+            # Same storage. Take over pd's.
+            self = object.__new__(cls)
+            for name in pydict.__slots__:
+                setattr(self, name, getattr(pd, name))
+            return self
+        # A subclass builds its instances its own way, and its constructor's
+        # first argument may not be the items (defaultpydict's default_factory)
+        try:
+            self = cls()
+        except TypeError:
+            raise TypeError(f"{cls.__name__}.build_bulk() can't make a {cls.__name__} without arguments. "
+                            f"Pass pydict.build_bulk(...) to {cls.__name__}() instead.") from None
+        self.update(pd)
+        return self
+    
+    def changes_since(self, version):
+        """Return a PyDictDelta of the changes to self since version of its journal.
+        Every key changed appears once, with its last value. Raises ValueError
+        if self has no journal, or if version was trimmed or hasn't happened."""
+        journal = self._journal
+        if journal is None or not journal.recording:
+            raise ValueError("pydict has no journal. Call enable_journal() first.")
+        if not journal.start <= version <= journal.version:
+            raise ValueError(f"no changes recorded since version {version}")
+        clear = journal.cleared > version
+        deleted, items, placed = [], [], []
+        # The changes are in order of version. Read back to the first one after version.
+        for key, change in reversed(journal.changes.items()):
+            if change.version <= version:
+                break
+            if change.value is _deleted:
+                # A key deleted before a clear is gone already
+                if not clear:
+                    deleted.append(key)
+            elif change.placed > version:
+                placed.append((change.placed, key, change.value, change.last))
+            else:
+                items.append((key, change.value))
+        # Keys are put in place in the order they were
+        placed.sort(key=lambda entry: entry[0])
+        placed = [(key, value, last) for order, key, value, last in placed]
+        return PyDictDelta(version, journal.version, clear, deleted, items, placed)
+    
+    def clear(self):
+        "Remove all items from self."
+        if self._journal is not None:
+            self._journal.record_clear(self)
+        # Start over with an empty keys list and hash table
+        self._keys = []
+        self._size = _MIN_SIZE
+        self._hash_table = [None] * self._size
+        self._rehash = None
+        self._cow = None
+        self._used = 0
+        self._first = 0
+    
+    def contains_many(self, keys):
+        """Return [key in self for key in keys], looking up all the keys in one loop.
+        If keys is a NumPy array, return a NumPy array of bools instead."""
+        keys, as_array = _batch_keys(keys)
+        if self.__class__.__contains__ is pydict.__contains__:
+            nodes = _find_nodes(self._hash_table, self._size, self._seed, keys, self._rehash)
+            found = [node is not None for node in nodes]
+        else:
+            # A subclass looks up keys its own way
+            found = [key in self for key in keys]
+        return _batch_result(found, as_array)
+    
+    def contains_hashed(self, key, h):
+        """Return key in self, where h is hash(key).
+        See help(pydict.getitem_hashed)."""
+        if self.__class__.__contains__ is not pydict.__contains__:
+            # A subclass looks up keys its own way
+            return key in self
+        return self._find_node(key, h) is not None
+    
+    def copy(self):
+        """Return a shallow copy of self.
+        The copy shares self's storage until either of them is changed,
+        then the one changed copies it."""
+        cls = self.__class__
+        if cls.__new__ is not pydict.__new__ or cls.__init__ is not object.__init__:
+            # A subclass builds its instances its own way
+            return cls(self)
+        return self._cow_copy()
+    
+    def disable_journal(self):
+        "Stop recording the changes to self, and forget those recorded."
+        journal = self._journal
+        if journal is not None and journal.watchers:
+            # Keep telling the watchers of the changes
+            self._journal = _Journal(False)
+            self._journal.watchers = journal.watchers
+        else:
+            self._journal = None
+    
+    def dump_json(self, fp, **kwds):
+        """Write self as JSON to the file-like object fp, one entry at a time.
+        See help(pydict.jsonio.iter_json_chunks) for the keyword arguments."""
+        from pydict.jsonio import dump_json
+        dump_json(self, fp, **kwds)
+    
+    def enable_journal(self):
+        """Start recording the changes to self, for changes_since(), and return
+        the current version. Every change adds 1 to the version, from 0.
+        If the changes to self are recorded already, just return the version."""
+        journal = self._journal
+        if journal is None or not journal.recording:
+            if self.__class__.__getitem__ is not pydict.__getitem__:
+                # A subclass storing keys its own way doesn't change them through pydict
+                raise TypeError(f"{self.__class__.__name__} can't record its changes")
+            if journal is None:
+                self._journal = journal = _Journal()
+            journal.recording = True
+        return journal.version
+    
+    def filter(self, pred, memoize=False):
+        """Return a FilteredPyDict, a read-only mapping of the items of self for
+        which pred(key, value) is true. Nothing is copied: pred is called when
+        an item is read, so the mapping follows the changes to self. If memoize
+        is True, pred's results are kept until their items change.
+        See help(pydict.FilteredPyDict)."""
+        from pydict.derived import FilteredPyDict
+        return FilteredPyDict(self, pred, memoize)
+    
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        """
+        Create and return a new pydict, p, of type cls.
+        For every key in keys, p[key] = value.
+        """
+        pd = cls()
+        pd.update(zip(keys, [value] * len(list(keys))))
+        return pd
+    
+    def get(self, key, default=None):
+        """Return self[key] if key in self, else default."""
+        try:
+            if isinstance(self, defaultpydict):
+                if key not in self:
+                    return default
+            return self[key]
+        except KeyError:
+            return default
+    
+    def get_hashed(self, key, h, default=None):
+        """Return self[key] if key in self, else default, where h is hash(key).
+        See help(pydict.getitem_hashed)."""
+        try:
+            if isinstance(self, defaultpydict):
+                if not self.contains_hashed(key, h):
+                    return default
+            return self.getitem_hashed(key, h)
+        except KeyError:
+            return default
+    
+    def get_many(self, keys, default=None):
+        """Return [self.get(key, default) for key in keys], looking up all the keys in one loop.
+        If keys is a NumPy array, return a NumPy array instead."""
+        keys, as_array = _batch_keys(keys)
+        if self.__class__.__getitem__ is pydict.__getitem__:
+            nodes = _find_nodes(self._hash_table, self._size, self._seed, keys, self._rehash)
+            values = [default if node is None else node.value for node in nodes]
+        else:
+            # A subclass looks up keys its own way
+            get = self.get
+            values = [get(key, default) for key in keys]
+        return _batch_result(values, as_array)
+        
+    def getitem_hashed(self, key, h):
+        """Return self[key], where h is hash(key).
+        For a caller which has hashed key already, for instance to look it up in
+        several pydicts: key isn't hashed again. h must be hash(key), or the
+        result is wrong. The other *_hashed methods work the same way."""
+        if self.__class__.__getitem__ is not pydict.__getitem__:
+            # A subclass looks up keys its own way
+            return self[key]
+        node = self._find_node(key, h)
+        if node is None:
+            return self.__missing__(key)
+        return node.value
+        
+    def items(self):
+        "Return a view of self's items."
+        return PyDictItemView(self, _construct)     
+                  
+    def iter_json_chunks(self, **kwds):
+        """Return an iterator over the JSON text of self, in chunks of strings.
+        Nested pydicts are read one entry at a time, without building a dict.
+        See help(pydict.jsonio.iter_json_chunks) for the keyword arguments."""
+        from pydict.jsonio import iter_json_chunks
+        return iter_json_chunks(self, **kwds)
+    
+    @property
+    def journal_version(self):
+        "The version of self's journal: the number of changes recorded. None without a journal."
+        journal = self._journal
+        return None if journal is None or not journal.recording else journal.version
+    
+    def keys(self):
+        "Return a view for self's keys."
+        # Return a copy of the internal keys list
+        return PyDictKeyView(self, _construct)        
+        
+    def map_values(self, fn, memoize=False):
+        """Return a MappedPyDict, a read-only mapping of the keys of self to
+        fn(their values). Nothing is copied: fn is called when a value is read,
+        so the mapping follows the changes to self. If memoize is True, fn's
+        results are kept until their items change. See help(pydict.MappedPyDict)."""
+        from pydict.derived import MappedPyDict
+        return MappedPyDict(self, fn, memoize)
+    
+    def move_to_end(self, key, last=True):
+        """Move a key to the back of the pydict.
+        If last is False, move the key to the front of the pydict instead.
+        Raises KeyError if key not in the pydict.
+        """
+        # Stop sharing storage with copies
+        if self._cow is not None:
+            _unshare_pydict(self)
+        if self._journal is not None:
+            self._journal.record_move(self, key, last)
+        # Find the actual key's node (in case an equivalent was passed in)
+        node = self._find_node(key)
+        if node is None:
+            # Raise KeyError if there is no corresponding key
+            raise KeyError("Key not in pydict")
+        keys = self._keys
+        if last:
+            if node.index == len(keys) - 1:
+                return
+            # Insert the key at the back of my keys list
+            keys[node.index] = _deleted
+            node.index = len(keys)
+            keys.append(node.key)
+        else:
+            if node.index == self._first:
+                return
+            # Make room at the front of my keys list if there is none
+            if self._first == 0:
+                _repack_pydict(self, max(self._used, _MIN_SIZE))
+                keys = self._keys
+            # Insert the key at the front of my keys list
+            index = node.index
+            self._first -= 1
+            node.index = self._first
+            keys[node.index] = node.key
+            keys[index] = _deleted
+            # The keys list never ends with _deleted
+            while keys[-1] is _deleted:
+                keys.pop()
+        # Repack when at least half of the keys list is _deleted
+        if len(keys) - self._used > self._used + _MIN_SIZE:
+            _repack_pydict(self)
+        
+    
+    def pop(self, key, default=_marker):
+        """Remove key from self, return self[key]. 
+        If key is not found, return default if given, otherwise raise KeyError."""
+        try:
+            # Get the value associated with the key
+            value = self[key]
+            # Delete the key... 
+            del self[key]            
+        except KeyError:
+            # If no default provided when the key isn't present, raise KeyError
+            # However, return the default if provided
+            if default is _marker:
+                raise
+            return default
+        else:
+            #...return its value
+            return value
+    
+    def popitem(self, last=True):
+        """Removes a key, return a 2-tuple: (the key, its associated value).
+        Removes last key if last is True, otherwise first key.
+        Raises KeyError if pydict is empty."""
+        # Check if I am empty
+        if len(self) == 0:
+            raise KeyError("pydict is empty.")
+        keys = self._keys
+        if last:
+            # The key is the last key
+            key = keys[-1]
+        else:
+            # The key is the first key. Skip the _deleted keys
+            # before it, and remember they were skipped.
+            i = self._first
+            while keys[i] is _deleted:
+                i += 1
+            self._first = i
+            key = keys[i]
+        # Remove the key. Return (the key, its associated value).
+        return key, self.pop(key)
+    
+    def project(self, keys):
+        """Return a ProjectedPyDict, a read-only mapping of the items of self
+        whose keys are in keys, in the order of keys. Nothing is copied: the
+        values are read from self. See help(pydict.ProjectedPyDict)."""
+        from pydict.derived import ProjectedPyDict
+        return ProjectedPyDict(self, keys)
+    
+    def set_many(self, keys, values):
+        """For every i, set self[keys[i]] to values[i], looking up all the keys in one loop.
+        keys and values may be sequences or NumPy arrays of the same length."""
+        keys = _batch_keys(keys)[0]
+        values = _batch_keys(values)[0]
+        if len(keys) != len(values):
+            raise ValueError(f"{len(keys)} keys but {len(values)} values")
+        if self.__class__.__setitem__ is not pydict.__setitem__ or self._journal is not None:
+            # A subclass stores keys its own way. A journal records, and tells of, keys one by one.
+            for key, value in zip(keys, values):
+                self[key] = value
+            return
+        # Stop sharing storage with copies
+        if self._cow is not None:
+            _unshare_pydict(self)
+        nodes = _find_nodes(self._hash_table, self._size, self._seed, keys, self._rehash)
+        # Resize at most once, to fit all the new keys. Resizing
+        # moves nodes between buckets, so the nodes found stay valid.
+        used = self._used + nodes.count(None)
+        if used / self._size > 2 / 3:
+            _resize_pydict(self, used * 3 // 2 + 1, True)
+        setitem = self.__setitem__
+        for key, value, node in zip(keys, values, nodes):
+            if node is None:
+                # A new key. It may be repeated in keys, so insert it normally.
+                setitem(key, value)
+            else:
+                node.value = value
+    
+    def setitem_hashed(self, key, h, value):
+        """Set self[key] to value, where h is hash(key).
+        See help(pydict.getitem_hashed)."""
+        if self.__class__.__setitem__ is not pydict.__setitem__:
+            # A subclass stores keys its own way
+            self[key] = value
+            return
+        # Stop sharing storage with copies
+        if self._cow is not None:
+            _unshare_pydict(self)
+        if self._journal is not None:
+            self._journal.record_set(self, key, value)
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        chain = 0
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                node.value = value
+                return
+            chain += 1
+            node = node.overflow
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+            if node is not None:
+                node.value = value
+                return
+        rehash = self._rehash
+        if rehash is not None:
+            node = rehash.find(h, key)
+            if node is not None:
+                node.value = value
+                return
+            _rehash_step(self)
+        self._insert_node(h, key, value, chain)
+    
+    def setdefault(self, key, default=None):
+        """Set self[key] to default if key not in pydict.
+        Return self[key]."""
+        # Set self[key] to default if key not in me
+        if key not in self:
+            self[key] = default
+        # Return self[key]
+        return self[key]
+
+    
+    def stats(self):
+        """Return a pydict of statistics about self's internal hash table.
+        
+        length: number of keys
+        buckets: number of buckets in the hash table
+        load_factor: length / buckets
+        empty_buckets: fraction of buckets with no nodes
+        chain_lengths: pydict mapping overflow chain length -> number of buckets
+        longest_chain: length of the longest overflow chain
+        resizes: number of times the hash table has been resized
+        memory: pydict of bytes used by the index (hash table list),
+                the entries (nodes) and the order (keys list)
+        
+        Keys and values are never hashed or compared, so this is cheap
+        enough to call periodically on large pydicts. An incremental 
+        resize in progress is finished first.
+        """
+        if self._rehash is not None:
+            if self._cow is not None:
+                _unshare_pydict(self)
+            _finish_rehash(self)
+        return _table_stats(self._hash_table, self._used, self._keys, self._resizes)
+    
+    def trim_journal(self, version):
+        """Forget the changes to self up to version of its journal.
+        changes_since() only accepts versions from version on afterwards.
+        Raises ValueError if self has no journal or version hasn't happened."""
+        journal = self._journal
+        if journal is None or not journal.recording:
+            raise ValueError("pydict has no journal. Call enable_journal() first.")
+        if version > journal.version:
+            raise ValueError(f"version {version} hasn't happened")
+        if version <= journal.start:
+            return
+        changes = journal.changes
+        old = []
+        for key, change in changes.items():
+            if change.version > version:
+                break
+            old.append(key)
+        for key in old:
+            del changes[key]
+        journal.start = version
+    
+    def update(self, mapping_or_iterable=(), /, **kwds):
+        """p.update(Q, **R)
+    Update self from Q and R.
+    If Q is present and has a .keys() method, then does:  for k in Q: self[k] = Q[k]
+    If Q is present and lacks a .keys() method, then does:  for k, v in Q: self[k] = v
+    In either case, this is followed by: for k in R:  self[k] = R[k]
+        """
+        # Get the value associated with Q's keys attribute.
+        # If Q doesn't have a keys attribute, get None instead
+        keysfunc = getattr(mapping_or_iterable, "keys", None)
+        
+        # If the value is callable, it is the keys() method.
+        # Call it to get an iterable of Q's keys. Then, for 
+        # k in Q's keys, set self[k] to Q[k].
+        if callable(keysfunc):
+            for key in keysfunc():
+                self[key] = mapping_or_iterable[key]
+                
+        # Otherwise, for k, v in Q, set self[k] to v.
+        else:
+            for key, value in mapping_or_iterable:
+                self[key] = value
+        # For k in kwds, set self[k] to kwds[k]
+        for key in kwds:
+            self[key] = kwds[key]
+            
+    def values(self):
+        "Return a view of self's values."
+        # Iterate over the keys. Return the corresponding values.
+        return PyDictValueView(self, _construct)     
+
+_collections_abc.MutableMapping.register(pydict)
+
+#####################################################
+### frozenpydict 
+####################################################
+    
+class frozenpydict(object):
+    """Immutable version of pydict
+    
+    frozenpydict() -> new empty frozen python dictionary
+    frozenpydict(mapping) -> new frozen python dictionary initialized from the mapping's (key, value) pairs
+    frozenpydict(iterable) -> new frozen python dictionary initialized via:
+        frozendict(pydict(iterable))
+    frozenpydict(**kwds) -> new frozen python dictionary initialized from the keyword arguments (name, value) pairs
+    """
+    
+    __slots__ = "_keys", "_frozen_hash_table", "_size", "_resizes", "_seed", "_hash"
+    
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        # Make a mutable pydict with arguments, and freeze it
+        return cls._from_pydict(pydict(mapping_or_iterable, **kwds))
+    
+    @classmethod
+    def _from_pydict(cls, pd):
+        "Return a new cls with the items of pd, a pydict which nobody else refers to, and which never deleted a key."
+        # Get a raw object
+        self = object.__new__(cls)
+        
+        # Its nodes must all be in one hash table.
+        if pd._rehash is not None:
+            _finish_rehash(pd)
+        
+        # Assign self's attributes, independent but resembling pd's attributes.
+        # pd has never deleted a key, so its keys list has no _deleted keys.
+        self._keys, self._frozen_hash_table, self._size, self._resizes, self._seed = \
+            tuple(pd._keys), tuple(pd._hash_table), pd._size, pd._resizes, pd._seed
+        # Hash total of my items, computed when first needed
+        self._hash = None
+        
+        # No need to obsucre pd, as nobody else may access it.
+        # That's it! Return self.
+        return self
+    
+    def __contains__(self, key):
+        "Return key in self."
+        # Get the hash code of the key, and the first node of its bucket
+        h = hash(key)
+        node = first = self._frozen_hash_table[(h ^ self._seed) % self._size]
+        # Search the overflow for a corresponding node
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return True
+            node = node.overflow
+        # A tree bin's nodes aren't in its overflow. Search it.
+        if first.__class__ is _TreeBin:
+            return first.find(h, key) is not None
+        return False
+    
+    __class_getitem__ = classmethod(_types.GenericAlias)
+    
+    def __eq__(self, other):
+        "Return self==other"
+        # Are self and other the same class? If not, return NotImplemented
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        # Check false with unequal length
+        if len(self) != len(other):
+            return False
+        # Check false with unequal hash totals, if both are known
+        if self._hash is not None and other.__class__ in _frozen_types \
+            and other._hash is not None and self._hash != other._hash:
+            return False
+        # Iterate over my keys
+        for key in self:
+            # If other[key] is absent or unequal to self[key]
+            # Return False
+            try:
+                if self[key] != other[key]:
+                    return False
+            except KeyError:
+                return False
+        return True
+    
+    def __getitem__(self, key):
+        "Return self[key]."
+        # Get the hash value of the key.
+        h = hash(key)
+        # Get the first node of the key's bucket. Trim the hash value
+        # to be within the size (# of buckets available)
+        node = first = self._frozen_hash_table[(h ^ self._seed) % self._size]
+        # Search the overflow. Is there a correct node?
+        while node is not None:
+            # If so, return its value.
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return node.value
+            node = node.overflow
+        # A tree bin's nodes aren't in its overflow. Search it.
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+            if node is not None:
+                return node.value
+        # There is no corresponding node. Raise KeyError.
+        raise KeyError(key)    
+    
+    def __hash__(self):
+        "Return hash(self). \nIt is computed once, from the hash codes of the keys the nodes keep."
+        total = self._hash
+        if total is None:
+            pairs = []
+            for node in self._frozen_hash_table:
+                if node.__class__ is _TreeBin:
+                    pairs.extend([(node.hashcode, node.value) for node in node.nodes])
+                    continue
+                while node is not None:
+                    pairs.append((node.hashcode, node.value))
+                    node = node.overflow
+            total = self._hash = _items_hash_total(pairs)
+        return hash(total)
+    
+    # Avoid subclassing
+    __init_subclass__ = None    
+    
+    def _find_node(self, key, h):
+        "Return the node of key, whose hash code is h, or None if key isn't in self."
+        node = first = self._frozen_hash_table[(h ^ self._seed) % self._size]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return node
+            node = node.overflow
+        if first.__class__ is _TreeBin:
+            return first.find(h, key)
+        return None
+    
+    def _probe(self, key):
+        "Return (number of nodes visited looking up key, self[key], or _marker if key isn't found)."
+        h = hash(key)
+        node = self._frozen_hash_table[(h ^ self._seed) % self._size]
+        if node.__class__ is _TreeBin:
+            # Count the steps of the binary search
+            probes = len(node).bit_length()
+            node = node.find(h, key)
+            return probes, _marker if node is None else node.value
+        probes = 0
+        while node is not None:
+            probes += 1
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return probes, node.value
+            node = node.overflow
+        return probes, _marker
+    
+    def __ior__(self, value):
+        "Return self |= value"
+        raise TypeError("'|=' not supported by frozenpydict. Use '|' instead.")
+    
+    def __iter__(self):
+        "Return iter(self)"
+        return PyDictKeyIterator(self, _construct)
+    
+    def __len__(self):
+        "Return len(self)."
+        # Return the length of my keys.
+        return len(self._keys)
+    
+    def __ne__(self, other):
+        "Return self!=other"
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        # Return the opposite of self==other
+        return not (self == other)
+    
+    def __or__(self, value):
+        "Return self|value"
+        pd = pydict(self)
+        pd.update(value)
+        return frozenpydict(pd)
+    
+    def __repr__(self):
+        "Return repr(self)"
+        # If within the midst of another repr call on the same object,
+        # return a filler value
+        if id(self) in _repr_pydicts:
+            return "frozenpydict({...})"
+        # Add this object to the set of current repr calls
+        _repr_pydicts.add(id(self))
+        # A list of parts, to be joined
+        parts = []
+        # Every part is key: value
+        for key, value in self.items():
+            parts.append(": ".join([repr(key), repr(value)]))
+        # There is no opportunity left for recursion. Therefore, remove
+        # this object from the set of current repr calls
+        _repr_pydicts.remove(id(self))
+        # Join all the parts with ", " add preceeding and suceeding strings.
+        # Return the new string.
+        return "frozenpydict({" + ", ".join(parts) + "})"    
+         
+    def __reversed__(self):
+        "Return reversed(self)"
+        # Return a reverse of my iterator
+        return PyDictReverseKeyIterator(self, _construct)
+
+    def __ror__(self, value):
+        "Return value|self"
+        return self.__or__(value)
+    
+    def __sizeof__(self):
+        # Get the size of the private internal slots
+        size = object.__sizeof__(self)
+        size += self._keys.__sizeof__()
+        size += self._size.__sizeof__()
+        size += self._frozen_hash_table.__sizeof__()
+        # Get the size of the internal nodes 
+        for obj in self._frozen_hash_table:
+            if isinstance(obj, (_Node, _TreeBin)):
+                size += obj.__sizeof__()
+        # That's the size!
+        return size
+    
+    @classmethod
+    def build_bulk(cls, mapping_or_iterable=()):
+        """
+        Create and return a new frozenpydict, p, of type cls, like cls(mapping_or_iterable),
+        for large inputs. See help(pydict.build_bulk).
+        """
+        from pydict.bulk import _build_bulk
+        return cls._from_pydict(_build_bulk(mapping_or_iterable))
+    
+    def dump_json(self, fp, **kwds):
+        "Write self as JSON to the file-like object fp, one entry at a time. \nSee help(pydict.dump_json)."
+        from pydict.jsonio import dump_json
+        dump_json(self, fp, **kwds)
+    
+    def filter(self, pred, memoize=False):
+        "Return a read-only mapping of the items of self for which pred(key, value) is true. \nSee help(pydict.filter)."
+        from pydict.derived import FilteredPyDict
+        return FilteredPyDict(self, pred, memoize)
+    
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        """
+        Create and return a new frozenpydict, p.
+        For every key in keys, p[key] = value.
+        """
+        return frozenpydict(zip(keys, [value] * len(list(keys))))
+    
+    def contains_many(self, keys):
+        "Return [key in self for key in keys], looking up all the keys in one loop. \nSee help(pydict.contains_many)."
+        keys, as_array = _batch_keys(keys)
+        nodes = _find_nodes(self._frozen_hash_table, self._size, self._seed, keys)
+        return _batch_result([node is not None for node in nodes], as_array)
+    
+    def contains_hashed(self, key, h):
+        "Return key in self, where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        return self._find_node(key, h) is not None
+    
+    def get(self, key, default=None):
+        "Return self[key] if key in self, else default."
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def get_hashed(self, key, h, default=None):
+        "Return self[key] if key in self, else default, where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        node = self._find_node(key, h)
+        return default if node is None else node.value
+    
+    def getitem_hashed(self, key, h):
+        "Return self[key], where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        node = self._find_node(key, h)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+    
+    def get_many(self, keys, default=None):
+        "Return [self.get(key, default) for key in keys], looking up all the keys in one loop. \nSee help(pydict.get_many)."
+        keys, as_array = _batch_keys(keys)
+        nodes = _find_nodes(self._frozen_hash_table, self._size, self._seed, keys)
+        return _batch_result([default if node is None else node.value for node in nodes], as_array)
+        
+    def items(self):
+        "Return a view of self's items."
+        return PyDictItemView(self, _construct)      
+    
+    def stats(self):
+        "Return a pydict of statistics about self's internal hash table. \nSee help(pydict.stats)."
+        return _table_stats(self._frozen_hash_table, len(self._keys), self._keys, self._resizes)
+        
+    def iter_json_chunks(self, **kwds):
+        "Return an iterator over the JSON text of self, in chunks of strings. \nSee help(pydict.iter_json_chunks)."
+        from pydict.jsonio import iter_json_chunks
+        return iter_json_chunks(self, **kwds)
+    
+    def keys(self):
+        "Return a view for self's keys."
+        return PyDictKeyView(self, _construct)
+    
+    def map_values(self, fn, memoize=False):
+        "Return a read-only mapping of the keys of self to fn(their values). \nSee help(pydict.map_values)."
+        from pydict.derived import MappedPyDict
+        return MappedPyDict(self, fn, memoize)
+    
+    def project(self, keys):
+        "Return a read-only mapping of the items of self whose keys are in keys. \nSee help(pydict.project)."
+        from pydict.derived import ProjectedPyDict
+        return ProjectedPyDict(self, keys)
+    
+    def values(self):
+        "Return a view for self's values."
+        return PyDictValueView(self, _construct) 
+
+_collections_abc.Mapping.register(frozenpydict)
+
+# Immutable mapping types whose _hash slot caches the hash total of their
+# items, or None. Lazily imported modules add their own.
+_frozen_types = (frozenpydict,)  
+
+#####################################################
+### OrderedPyDict 
+####################################################    
+    
+class OrderedPyDict(pydict):
+    """Python dictionary that remembers insertion order.
+    See help(pydict) for signature of constructor.
+    """
+    
+    def __eq__(self, other):
+        "Return self==other"
+        if not isinstance(other, OrderedPyDict):
+            return NotImplemented
+        return tuple(self.items()) == tuple(other.items())
+    
+    __hash__ = None
+    
+    def __ne__(self, other):
+        "Return self!=other"
+        if not isinstance(other, OrderedPyDict):
+            return NotImplemented
+        return tuple(self.items()) != tuple(other.items())
+    
+    def __repr__(self):
+        "Return repr(self)"
+        if len(self) == 0:
+            return "OrderedPyDict()"        
+        if id(self) in _repr_pydicts:
+            return "OrderedPyDict([...])"
+        _repr_pydicts.add(id(self))
+        parts = []
+        for key, value in self.items():
+            parts.append(repr((key, value)))
+        _repr_pydicts.remove(id(self))
+        return "OrderedPyDict([" + ", ".join(parts) + "])"
+    
+    __slots__ = ()
+    
+#####################################################
+### defaultpydict 
+####################################################
+    
+class defaultpydict(pydict):
+    """Python dictionary with an optional default factory when __getitem__ fails due to a KeyError
+    
+    defaultpydict(default_factory[, ...]) -> new default pydict with its default factory set to default_factory
+    
+    For other combinations of constructor arguments see help(pydict).
+    """
+    
+    def __missing__(self, key):
+        "Fallback method when self[key] fails."
+        factory = self.default_factory
+        if callable(factory):
+            return factory()
+        raise KeyError(key)
+        
+    def __new__(cls, default_factory=None, mapping_or_iterable=(), /, **kwds):
+        # Get a raw pydict
+        self = pydict.__new__(cls, mapping_or_iterable, **kwds)
+        # Assign a default factory
+        self.default_factory = default_factory
+        # Return self
+        return self
+    
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "defaultpydict(..., pydict({...}))"
+        s = pydict.__repr__(self) 
+        _repr_pydicts.add(id(self))
+        s = repr(self.default_factory) + ", " + s
+        _repr_pydicts.remove(id(self))
+        return "defaultpydict(" + s + ")"
+
+    __slots__ = ("_default_factory",)
+    
+    def copy(self):
+        "Return a shallow copy of self, with the same default factory. \nSee help(pydict.copy)."
+        pd = self._cow_copy()
+        pd.default_factory = self.default_factory
+        return pd
+    
+    @property
+    def default_factory(self):
+        "Factory for default value called by __missing__"
+        return getattr(self, "_default_factory", None)
+    
+    @default_factory.setter
+    def default_factory(self, value):
+        self._default_factory = value
+    
+    
+    
+
+#####################################################
+### Change journals
+####################################################
+
+class _Change(object):
+    "The last change to a key recorded by a journal."
+    # value is _deleted if the key was deleted. placed is the version the key
+    # was last appended or moved at, or 0, and last whether it went to the back.
+    __slots__ = "version", "value", "placed", "last"
+    
+    def __init__(self, version, value, placed, last):
+        self.version = version
+        self.value = value
+        self.placed = placed
+        self.last = last
+
+class _Journal(object):
+    "Record of the changes to a pydict. See help(pydict.enable_journal)."
+    # changes has the last _Change of every key changed since start, in order
+    # of version, or since the last clear, at version cleared. Nothing is
+    # recorded unless recording is True. watchers is None, or a dict of weak
+    # references to the objects told of the changes, by id. See help(pydict._watch).
+    __slots__ = "version", "start", "cleared", "changes", "recording", "watchers"
+    
+    def __init__(self, recording=True):
+        self.version = 0
+        self.start = 0
+        self.cleared = 0
+        self.changes = pydict()
+        self.recording = recording
+        self.watchers = None
+    
+    def _tell(self, pd, key):
+        "Tell the watchers of pd that key is changing, or pd is being cleared if key is _marker."
+        watchers = self.watchers
+        if not watchers:
+            # The last watcher is gone. Stop telling, or stop altogether.
+            self.watchers = None
+            if not self.recording:
+                pd._journal = None
+            return
+        for watcher in list(watchers.values()):
+            watcher = watcher()
+            if watcher is None:
+                continue
+            if key is _marker:
+                watcher._cleared()
+            else:
+                watcher._changed(key)
+    
+    def record_set(self, pd, key, value):
+        "Record pd[key] = value, before it happens."
+        if self.watchers is not None:
+            self._tell(pd, key)
+        if not self.recording:
+            return
+        node = pydict._find_node(pd, key)
+        self.version += 1
+        changes = self.changes
+        if node is None:
+            # The key is appended. Keep the object stored as its key.
+            changes.pop(key, None)
+            changes[key] = _Change(self.version, value, self.version, True)
+            return
+        change = changes.get(key)
+        if change is None:
+            changes[key] = _Change(self.version, value, 0, True)
+        else:
+            changes.move_to_end(key)
+            change.version = self.version
+            change.value = value
+    
+    def record_delete(self, pd, key):
+        "Record del pd[key], before it happens."
+        if self.watchers is not None:
+            self._tell(pd, key)
+        if not self.recording or pydict._find_node(pd, key) is None:
+            # Nothing is deleted: KeyError is raised
+            return
+        self.version += 1
+        self.changes.pop(key, None)
+        self.changes[key] = _Change(self.version, _deleted, 0, True)
+    
+    def record_move(self, pd, key, last):
+        "Record pd.move_to_end(key, last), before it happens."
+        if self.watchers is not None:
+            self._tell(pd, key)
+        if not self.recording:
+            return
+        node = pydict._find_node(pd, key)
+        if node is None:
+            # Nothing is moved: KeyError is raised
+            return
+        self.version += 1
+        self.changes.pop(key, None)
+        self.changes[node.key] = _Change(self.version, node.value, self.version, bool(last))
+    
+    def record_clear(self, pd):
+        "Record pd.clear(), before it happens."
+        if self.watchers is not None:
+            self._tell(pd, _marker)
+        if not self.recording:
+            return
+        self.version += 1
+        self.cleared = self.version
+        # The changes before are all undone
+        self.changes = pydict()
+
+class PyDictDelta(object):
+    """Changes to a pydict between two versions of its journal
+    
+    Made by pydict.changes_since(), applied by pydict.apply_delta(). It holds
+    the changes only, as lists, so it pickles to send to other processes.
+    since and version are the versions it goes from and to. If clear is True,
+    the pydict was cleared in between. deleted lists the keys deleted,
+    items the (key, value) pairs of the keys set which stayed in place, and
+    placed the (key, value, last) triples of the keys added or moved, in
+    the order they were: each went to the back if last is True, otherwise
+    to the front.
+    """
+    
+    __slots__ = "since", "version", "clear", "deleted", "items", "placed"
+    
+    def __init__(self, since, version, clear, deleted, items, placed):
+        self.since = since
+        self.version = version
+        self.clear = clear
+        self.deleted = deleted
+        self.items = items
+        self.placed = placed
+    
+    def __len__(self):
+        "Return the number of keys changed."
+        return len(self.deleted) + len(self.items) + len(self.placed)
+    
+    def __repr__(self):
+        "Return repr(self)"
+        return f"PyDictDelta(since={self.since}, version={self.version}, clear={self.clear}, " + \
+            f"deleted={len(self.deleted)}, items={len(self.items)}, placed={len(self.placed)})"
+    
+    def __reduce__(self):
+        "Return state information for pickling."
+        return (PyDictDelta, (self.since, self.version, self.clear, self.deleted, self.items, self.placed))
+
+##################################
+### Final touches, testing
+##################################
+
+# Public names of the modules imported on first use, by name. Importing
+# pydict only defines the core types; the rest loads through __getattr__.
+_lazy_names = {
+    "ShallowChainMap": "chainmap",
+    "DeepChainMap": "chainmap",
+    "IntPyDict": "intpydict",
+    "SharedKeyPyDict": "sharedkeys",
+    "PersistentPyDict": "persistent",
+    "PersistentPyDictEvolver": "persistent",
+    "BiPyDict": "bipydict",
+    "SortedPyDict": "sortedpydict",
+    "WeakKeyPyDict": "weak",
+    "WeakValuePyDict": "weak",
+    "AsyncLoadingPyDict": "asyncloading",
+    "dump_json": "jsonio",
+    "iter_json_chunks": "jsonio",
+    "load_json": "jsonio",
+    "MappedPyDict": "derived",
+    "FilteredPyDict": "derived",
+    "ProjectedPyDict": "derived",
+    "ProfileStats": "profiling",
+    "enable_profiling": "profiling",
+    "disable_profiling": "profiling",
+}
+
+def __getattr__(name):
+    "Import the module defining a lazily loaded name, and return the name."
+    module = _lazy_names.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = f"{__name__}.{module}"
+    __import__(module)
+    value = getattr(_sys.modules[module], name)
+    # Later lookups find it in globals(), without calling __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+# The lazily loaded names stay out of __all__, so that `from pydict import *`
+# doesn't load their modules. Import them by name.
+__all__ = [i for i in globals() if i[0] != "_"]
+
+
+
+##########################################
+### End important part of module
+###########################################
+
+
+# Views and iterators. No need to export.
+####################################################
+### views
+####################################################
+
+class PyDictView(object):
+    def __contains__(self, key):
+        "Return key in self."
+        return key in list(self)
+    
+    def __iter__(self):
+        "Return iter(self)."
+        return PyDictIterator(self._mapping, _construct)
+    
+    def __len__(self):
+        "Return len(self)."
+        return len(self._mapping)
+    
+    def __new__(cls, mapping=None, key=None):
+        if key is not _construct:
+            raise TypeError(f"Cannot create {cls.__name__} instances")        
+        self = object.__new__(cls)
+        self._mapping = mapping
+        return self
+    
+    def __repr__(self):
+        "Return repr(self)."
+        return f"{self.__class__.__name__}({list(self)})"
+    
+    def __reversed__(self):
+        "Return reversed(self)."
+        return PyDictReverseIterator(self._mapping, _construct)
+    
+    __slots__ = ('_mapping',)
+    
+    @property
+    def mapping(self):
+        "Return a read-only version of the original pydict/frozenpydict."
+        if isinstance(self._mapping, _frozen_types):
+            return self._mapping
+        return frozenpydict(self._mapping)
+    
+class PyDictSetView(PyDictView):
+    "Base class of PyDictViews which implements some set functionality."
+    
+    def __and__(self, other):
+        "Return self&other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return {i for i in self if i in other}
+    
+    def __eq__(self, other):
+        "Return self==other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return self <= other and len(self) == len(other)
+    
+    def __ge__(self, other):
+        "Return self>=other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented
+        for item in other:
+            if item not in self:
+                return False
+        return True
+    
+    def __gt__(self, other):
+        "Return self>other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return self >= other and len(self) > len(other)
+    
+    __hash__ = None
+    
+    def __le__(self, other):
+        "Return self<=other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented
+        for item in self:
+            if item not in other:
+                return False
+        return True
+
+    def __lt__(self, other):
+        "Return self<other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return self <= other and len(self) < len(other)
+    
+    def __ne__(self, other):
+        "Return self!=other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented
+        return not (self == other)
+    
+    def __or__(self, other):
+        "Return self|other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return {value for value in [*self, *other]}
+
+    def __rand__(self, other):
+        "Return other&self"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented       
+        return self.__and__(other)
+    
+    def __ror__(self, other):
+        "Return other|self"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return self.__or__(other)
+    
+    def __rsub__(self, other):
+        "Return other-self"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return {i for i in other if i not in self}
+    
+    def __rxor__(self, other):
+        "Return other^self"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return self.__xor__(other)
+    
+    __slots__ = ()
+    
+    def __sub__(self, other):
+        "Return self-other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return {i for i in self if i not in other}
+    
+    def __xor__(self, other):
+        "Return self^other"
+        if not isinstance(other, _collections_abc.Iterable):
+            return NotImplemented        
+        return (self | other) - (self & other)
+    
+    def isdisjoint(self, other):
+        "Return if self and other have a null intersection."
+        if not isinstance(other, _collections_abc.Iterable):
+            raise TypeError("other arg must be iterable")
+        return (self & other) == set()
+    
+    
+class PyDictKeyView(PyDictSetView):
+    "View for the keys of a pydict/frozenpydict"
+    def __contains__(self, key):
+        "Return key in self."
+        return key in self._mapping
+    
+    def __iter__(self):
+        return PyDictKeyIterator(self._mapping, _construct)
+    
+    def __reversed__(self):
+        return PyDictReverseKeyIterator(self._mapping, _construct)
+    
+    __slots__ = ()
+    
+class PyDictValueView(PyDictView):
+    "View for the values of a pydict/frozenpydict"
+    def __iter__(self):
+        return PyDictValueIterator(self._mapping, _construct)  
+    
+    def __reversed__(self):
+        return PyDictReverseValueIterator(self._mapping, _construct)    
+    
+    __slots__ = ()
+    
+class PyDictItemView(PyDictSetView):
+    "View for the items of a pydict/frozenpydict"
+    def __contains__(self, item):
+        "Return item in self."
+        try:
+            key, value = item
+        except (TypeError, ValueError):
+            return False
+        mapping = self._mapping
+        if key not in mapping:
+            return False
+        v = mapping[key]
+        return v is value or v == value
+    
+    def __iter__(self):
+        return PyDictItemIterator(self._mapping, _construct)
+    
+    def __reversed__(self):
+        return PyDictReverseItemIterator(self._mapping, _construct)    
+    
+    __slots__ = ()
+    
+####################################################
+### iterators
+####################################################
+
+class PyDictIterator(object):
+    "Base class for iterators of pydicts and frozenpydicts"
+    
+    def __iter__(self):
+        "Return iter(self)."
+        return self
+    
+    def __next__(self):
+        "Return next(self)."
+        raise StopIteration
+    
+    def __new__(cls, mapping=None, key=None):
+        if key is not _construct:
+            raise TypeError(f"Cannot create {cls.__name__} instances")
+        self = object.__new__(cls)
+        self._count = -1
+        self._mapping = mapping
+        self._length = len(self._mapping)
+        return self
+    
+    def _next_key(self):
+        "Return the next key of the mapping. Raise IndexError if there is none."
+        if len(self._mapping) != self._length:
+            raise RuntimeError("iterable changed size during iteration")
+        keys = self._mapping._keys
+        # Skip deleted keys
+        self._count += 1
+        key = keys[self._count]
+        while key is _deleted:
+            self._count += 1
+            key = keys[self._count]
+        return key
+    
+    __slots__ = ("_count", "_length", "_mapping")
+
+class PyDictKeyIterator(PyDictIterator):
+    "Iterator for the keys of a pydict/frozenpydict"
+    
+    def __next__(self):
+        try:
+            return self._next_key()
+        except IndexError:
+            pass
+        raise StopIteration
+        
+    __slots__ = ()
+    
+class PyDictValueIterator(PyDictIterator):
+    "Iterator for the values of a pydict/frozenpydict"
+    def __next__(self):
+        try:
+            return self._mapping[self._next_key()]
+        except IndexError:
+            pass
+        raise StopIteration
+        
+    __slots__ = ()
+    
+class PyDictItemIterator(PyDictIterator):
+    "Iterator for the items of a pydict/frozenpydict"
+    def __next__(self):
+        try:
+            key = self._next_key()
+            return (key, self._mapping[key])
+        except IndexError:
+            pass
+        raise StopIteration
+        
+    __slots__ = ()
+    
+####################################################
+### reverse iterators
+####################################################
+
+class PyDictReverseIterator(PyDictIterator):
+    "Base class for reverse iterators of pydicts and frozenpydicts"
+    
+    def __new__(cls, mapping=None, key=None):
+        self = PyDictIterator.__new__(cls, mapping, key)
+        self._count = 0
+        return self
+    
+    def _next_key(self):
+        "Return the previous key of the mapping. Raise IndexError if there is none."
+        if len(self._mapping) != self._length:
+            raise RuntimeError("iterable changed size during iteration")
+        keys = self._mapping._keys
+        # Skip deleted keys
+        self._count -= 1
+        key = keys[self._count]
+        while key is _deleted:
+            self._count -= 1
+            key = keys[self._count]
+        return key
+    
+    __slots__ = ()
+    
+class PyDictReverseKeyIterator(PyDictReverseIterator, PyDictKeyIterator):
+    "Reverse iterator for the keys of a pydict/frozenpydict"
+    __slots__ = ()
+    
+class PyDictReverseValueIterator(PyDictReverseIterator, PyDictValueIterator):
+    "Reverse iterator for the values of a pydict/frozenpydict"
+    __slots__ = ()
+    
+class PyDictReverseItemIterator(PyDictReverseIterator, PyDictItemIterator):
+    "Reverse iterator for the items of a pydict/frozenpydict"
+    __slots__ = ()
+    
+# Register classes
+_collections_abc.Collection.register(PyDictView)
+_collections_abc.MappingView.register(PyDictView)
+_collections_abc.Set.register(PyDictSetView)
+_collections_abc.KeysView.register(PyDictKeyView)
+_collections_abc.ItemsView.register(PyDictItemView)
+_collections_abc.ValuesView.register(PyDictValueView)
+_collections_abc.Iterator.register(PyDictIterator)
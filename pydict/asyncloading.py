@@ -0,0 +1,188 @@
+import asyncio as _asyncio
+import functools as _functools
+import time as _time
+
+from pydict import pydict, _repr_pydicts
+
+##################################
+### AsyncLoadingPyDict
+##################################
+
+class AsyncLoadingPyDict(pydict):
+    """pydict which loads missing keys with a coroutine function
+
+    AsyncLoadingPyDict(loader[, mapping_or_iterable], *, batch_loader=None, failure_ttl=0.0)
+    -> new AsyncLoadingPyDict, with the items of mapping_or_iterable
+
+    await p.get_or_load(key) returns p[key], loading it with await loader(key)
+    if key is missing, and storing the result. Concurrent misses for the same
+    key share one load: while a key is loading, get_or_load waits for the
+    load in flight rather than starting another. Cancelling one waiter
+    doesn't cancel the load the others are waiting for.
+
+    await p.load_many(keys) does the same for many keys at once. If
+    batch_loader is given, the missing keys are loaded by a single call,
+    await batch_loader(list_of_keys), which returns a mapping of them to
+    their values.
+
+    If failure_ttl is positive, a load raising an exception is remembered
+    for failure_ttl seconds, and get_or_load raises the same exception
+    again for that key until then, instead of loading it again.
+
+    p[key] doesn't load: a missing key raises KeyError, as in a pydict.
+    Setting, deleting or clearing a key while it's loading wins over the
+    load, which then doesn't store its result.
+    """
+
+    __slots__ = ("loader", "batch_loader", "failure_ttl", "_loading", "_failures")
+
+    def __new__(cls, loader, mapping_or_iterable=(), /, *, batch_loader=None, failure_ttl=0.0):
+        # Get a raw pydict
+        self = pydict.__new__(cls)
+        self.loader = loader
+        self.batch_loader = batch_loader
+        self.failure_ttl = failure_ttl
+        # The tasks of the loads in flight, and the cached failures as
+        # (time they expire, exception), by key. A key set, deleted or
+        # cleared while loading is dropped from _loading, and its load
+        # doesn't store its result.
+        self._loading = pydict()
+        self._failures = pydict()
+        self.update(mapping_or_iterable)
+        return self
+
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "AsyncLoadingPyDict(..., pydict({...}))"
+        s = pydict.__repr__(self)
+        _repr_pydicts.add(id(self))
+        s = repr(self.loader) + ", " + s
+        _repr_pydicts.remove(id(self))
+        return "AsyncLoadingPyDict(" + s + ")"
+
+    def _check_failure(self, key):
+        "Raise the cached exception of the last load of key, if it hasn't expired."
+        failure = self._failures.get(key)
+        if failure is not None:
+            expires, exc = failure
+            if _time.monotonic() < expires:
+                # Raising the same exception again would add to its traceback
+                raise exc.with_traceback(None)
+            del self._failures[key]
+
+    def _start(self, key, batch):
+        """Start loading key, and return the task loading it.
+        If batch is not None, it is the task of a batch load including key."""
+        task = _asyncio.ensure_future(self._load(key, batch))
+        self._loading[key] = task
+        task.add_done_callback(_functools.partial(self._loaded, key))
+        return task
+
+    def _loaded(self, key, task):
+        "Forget the task which loaded key, once it is done."
+        # A task cancelled before it started never ran its own cleanup
+        if self._loading.get(key) is task:
+            del self._loading[key]
+
+    def __delitem__(self, key):
+        "Delete self[key]. A load of key in flight won't store its result."
+        pydict.__delitem__(self, key)
+        self._loading.pop(key, None)
+
+    def __setitem__(self, key, value):
+        "Set self[key] to value. A load of key in flight won't store its result."
+        pydict.__setitem__(self, key, value)
+        if self._loading:
+            self._loading.pop(key, None)
+
+    async def _load(self, key, batch):
+        """Load key, store and return its value. If key was set, deleted or cleared
+        since the load started, return self[key] if set, or else the value loaded,
+        without storing it or caching a failure."""
+        task = _asyncio.current_task()
+        try:
+            if batch is None:
+                value = await self.loader(key)
+            else:
+                # The batch is shared by the tasks of all its keys
+                values = await _asyncio.shield(batch)
+                try:
+                    value = values[key]
+                except KeyError:
+                    raise KeyError(key) from None
+        except Exception as exc:
+            if self.failure_ttl > 0 and self._loading.get(key) is task:
+                self._failures[key] = (_time.monotonic() + self.failure_ttl, exc)
+            raise
+        if self._loading.get(key) is not task:
+            node = pydict._find_node(self, key)
+            return value if node is None else node.value
+        self._failures.pop(key, None)
+        self[key] = value
+        return value
+
+    def clear(self):
+        "Remove all items and cached failures from self. The loads in flight won't store their results."
+        pydict.clear(self)
+        self._failures.clear()
+        self._loading.clear()
+
+    def copy(self):
+        "Return a shallow copy of self, with the same loaders. \nSee help(pydict.copy)."
+        pd = self._cow_copy()
+        pd.loader = self.loader
+        pd.batch_loader = self.batch_loader
+        pd.failure_ttl = self.failure_ttl
+        # Loads in flight store into self only
+        pd._loading = pydict()
+        pd._failures = self._failures.copy()
+        return pd
+
+    async def get_or_load(self, key):
+        """Return self[key], loading it first if key is missing.
+        Waits for the load in flight if key is being loaded already.
+        Raises the loader's exception if the load fails."""
+        node = pydict._find_node(self, key)
+        if node is not None:
+            return node.value
+        task = self._loading.get(key)
+        if task is None:
+            self._check_failure(key)
+            task = self._start(key, None)
+        return await _asyncio.shield(task)
+
+    def loading(self):
+        "Return a list of the keys being loaded."
+        return list(self._loading)
+
+    async def load_many(self, keys):
+        """Return [await self.get_or_load(key) for key in keys], loading the missing keys concurrently.
+        If self.batch_loader is set, the keys neither in self nor being loaded are loaded
+        by one call to it. Raises the first exception of the loads, if any fails."""
+        keys = list(keys)
+        values = pydict()
+        waiting = pydict()
+        missing = []
+        for key in keys:
+            if key in values or key in waiting:
+                continue
+            node = pydict._find_node(self, key)
+            if node is not None:
+                values[key] = node.value
+            elif key in self._loading:
+                waiting[key] = self._loading[key]
+            else:
+                self._check_failure(key)
+                # Mark the key as seen. Its task starts below.
+                waiting[key] = None
+                missing.append(key)
+        if missing:
+            batch = None
+            if self.batch_loader is not None:
+                batch = _asyncio.ensure_future(self.batch_loader(list(missing)))
+            for key in missing:
+                waiting[key] = self._start(key, batch)
+        results = await _asyncio.gather(*map(_asyncio.shield, waiting.values()))
+        values.update(zip(waiting, results))
+        return [values[key] for key in keys]
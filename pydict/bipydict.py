@@ -0,0 +1,95 @@
+from pydict import pydict, _marker, _repr_pydicts
+
+##################################
+### BiPyDict
+##################################
+
+class BiPyDict(pydict):
+    """pydict which maps its values back to their keys
+
+    BiPyDict(...) -> new BiPyDict. See help(pydict) for the signature.
+
+    Every value belongs to one key. b.inverse is a BiPyDict mapping each value
+    of b to its key, kept in step with b: a change to either changes both.
+    Finding the key of a value is a lookup in b.inverse, not a scan of b.
+    Values must be hashable. Setting a key to a value which already belongs
+    to another key raises ValueError, and leaves the BiPyDict unchanged.
+    """
+
+    __slots__ = ("_inverse",)
+
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        # Get two raw pydicts, each the inverse of the other
+        self = pydict.__new__(cls)
+        inverse = pydict.__new__(cls)
+        self._inverse, inverse._inverse = inverse, self
+        self.update(mapping_or_iterable, **kwds)
+        return self
+
+    def __delitem__(self, key):
+        "Delete self[key]."
+        node = pydict._find_node(self, key)
+        if node is None:
+            raise KeyError(key)
+        pydict.__delitem__(self._inverse, node.value)
+        pydict.__delitem__(self, key)
+
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "BiPyDict({...})"
+        return "BiPyDict(" + pydict.__repr__(self)[len("pydict("):]
+
+    def __setitem__(self, key, value):
+        """Set self[key] to value.
+        Raises ValueError if value belongs to another key."""
+        inverse = self._inverse
+        owner = pydict._find_node(inverse, value)
+        if owner is not None:
+            if not (owner.value is key or owner.value == key):
+                raise ValueError(f"value {value!r} already belongs to key {owner.value!r}")
+        else:
+            node = pydict._find_node(self, key)
+            if node is not None:
+                # The key's old value no longer maps back to it
+                pydict.__delitem__(inverse, node.value)
+        pydict.__setitem__(self, key, value)
+        pydict.__setitem__(inverse, value, key)
+
+    def clear(self):
+        "Remove all items from self."
+        pydict.clear(self)
+        pydict.clear(self._inverse)
+
+    @property
+    def inverse(self):
+        "The BiPyDict mapping each value of self to its key."
+        return self._inverse
+
+    def update(self, mapping_or_iterable=(), /, **kwds):
+        """p.update(Q, **R)
+    Update self from Q and R, like pydict.update.
+    If a value would belong to two keys, raises ValueError and leaves self unchanged.
+        """
+        keysfunc = getattr(mapping_or_iterable, "keys", None)
+        if callable(keysfunc):
+            pairs = [(key, mapping_or_iterable[key]) for key in keysfunc()]
+        else:
+            pairs = list(mapping_or_iterable)
+        pairs.extend(kwds.items())
+        # Remember the old value of every key set, to undo the update if it fails
+        undo = []
+        try:
+            for key, value in pairs:
+                node = pydict._find_node(self, key)
+                undo.append((key, _marker if node is None else node.value))
+                self[key] = value
+        except Exception:
+            # Restoring in reverse order passes back through consistent states
+            for key, value in reversed(undo):
+                if value is _marker:
+                    if key in self:
+                        del self[key]
+                else:
+                    self[key] = value
+            raise
@@ -0,0 +1,48 @@
+import gc as _gc
+
+from pydict import pydict, _place_pydict
+
+##################################
+### Bulk builds
+##################################
+
+# The build runs in this process. Worker processes could only deduplicate
+# the keys: they can't make the nodes, which must hold the very key and
+# value objects given. Sending them the keys by pickling, and merging
+# their results, costs more than the dict pass they would save.
+
+def _dedupe(keys):
+    """Return (index of the first occurrence, index of the last occurrence)
+    of every distinct key of a list, in order of first occurrence."""
+    n = len(keys)
+    # Each distinct key keeps its first position, and gets the index of its last occurrence
+    last = dict(zip(keys, range(n)))
+    first = dict(zip(reversed(keys), range(n - 1, -1, -1)))
+    return list(map(first.__getitem__, last)), list(last.values())
+
+def _build_bulk(mapping_or_iterable):
+    "Return a new pydict with the items of mapping_or_iterable. See pydict.build_bulk."
+    keysfunc = getattr(mapping_or_iterable, "keys", None)
+    if callable(keysfunc):
+        keys = list(keysfunc())
+        values = [mapping_or_iterable[key] for key in keys]
+    else:
+        pairs = list(mapping_or_iterable)
+        keys = [key for key, value in pairs]
+        values = [value for key, value in pairs]
+    hashes = list(map(hash, keys))
+    firsts, lasts = _dedupe(keys)
+
+    pd = pydict()
+    # Every new node is tracked by the cyclic garbage collector, whose passes
+    # over millions of them would take most of the time. The nodes only refer
+    # to each other and to the keys and values given, so they can't be garbage.
+    gc_enabled = _gc.isenabled()
+    _gc.disable()
+    try:
+        _place_pydict(pd, list(map(hashes.__getitem__, firsts)), list(map(keys.__getitem__, firsts)),
+                      list(map(values.__getitem__, lasts)))
+    finally:
+        if gc_enabled:
+            _gc.enable()
+    return pd
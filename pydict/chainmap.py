@@ -0,0 +1,529 @@
+import _collections_abc
+
+import pydict as _pydict
+from pydict import pydict, frozenpydict, _find_nodes, _marker, _repr_pydicts
+
+# Maps which can be given the hash code of a key, to look it up without hashing it again
+_hashed_types = (pydict, frozenpydict)
+# Maps whose nodes can be looked up directly. They have no __missing__ to call.
+_plain_types = (pydict, frozenpydict)
+
+def _contains_hashed(map, key, h):
+    "Return key in map, where h is hash(key)."
+    if isinstance(map, _hashed_types):
+        return map.contains_hashed(key, h)
+    return key in map
+
+def _search(maps, key, h):
+    "Return the value of key in the first of maps holding it, or _marker. h is hash(key)."
+    for map in maps:
+        if map.__class__ in _plain_types:
+            # A miss goes on to the next map, without raising KeyError
+            node = map._find_node(key, h)
+            if node is not None:
+                return node.value
+            continue
+        try:
+            if isinstance(map, _hashed_types):
+                return map.getitem_hashed(key, h)
+            return map[key]
+        except KeyError:
+            pass
+    return _marker
+
+def _mergeable(map):
+    """Return whether map can be merged into the index of a chain's bottom maps.
+    It must never change, or tell of its changes (see help(pydict._watch)), and
+    have no __missing__ method answering lookups of the keys it lacks."""
+    if getattr(map.__class__, "__missing__", pydict.__missing__) is not pydict.__missing__:
+        return False
+    # Read when called: more frozen types are added as their modules load
+    if isinstance(map, _pydict._frozen_types):
+        return True
+    return isinstance(map, pydict) and map.__class__.__getitem__ is pydict.__getitem__
+
+def _setitem_hashed(map, key, h, value):
+    "Set map[key] to value, where h is hash(key)."
+    if isinstance(map, pydict):
+        map.setitem_hashed(key, h, value)
+    else:
+        map[key] = value
+
+def _update_found(maps, keys, hashes, values):
+    """Set each of keys to its value in the first of maps holding it, where
+    hashes are their hash codes. Each map is searched once, for all the keys
+    not found before it. Return the keys, hashes and values not found."""
+    for mapping in maps:
+        if not keys:
+            break
+        if mapping.__class__ is pydict:
+            # Probe all the keys in one loop
+            nodes = _find_nodes(mapping._hash_table, mapping._size, mapping._seed, keys,
+                                mapping._rehash, hashes)
+            found = [node is not None for node in nodes]
+        else:
+            found = [_contains_hashed(mapping, key, h) for key, h in zip(keys, hashes)]
+        # Set the keys found, and look for the others in the next maps
+        missing = [], [], []
+        for key, h, value, hit in zip(keys, hashes, values, found):
+            if hit:
+                _setitem_hashed(mapping, key, h, value)
+            else:
+                missing[0].append(key)
+                missing[1].append(h)
+                missing[2].append(value)
+        keys, hashes, values = missing
+    return keys, hashes, values
+
+class _MapList(list):
+    "The list of a chain's maps. version counts its changes."
+    __slots__ = ("version",)
+    
+    def __init__(self, maps=()):
+        list.__init__(self, maps)
+        self.version = 0
+
+def _counted(name):
+    "Return list method name, counting the changes it makes to a _MapList."
+    method = getattr(list, name)
+    def counted(self, *args, **kwds):
+        self.version += 1
+        return method(self, *args, **kwds)
+    counted.__name__ = name
+    counted.__doc__ = method.__doc__
+    return counted
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_MapList, _name, _counted(_name))
+del _name
+
+######################################################
+### ShallowChainMap
+######################################################
+        
+class ShallowChainMap(pydict):
+    ''' A ShallowChainMap groups multiple pydicts (or other mappings) together
+    to create a single, updateable view.
+
+    The underlying mappings are stored in a list.  That list is public and can
+    be accessed or updated using the *maps* attribute.  There is no other
+    state.
+
+    Lookups search the underlying mappings successively until a key is found.
+    In contrast, writes, updates, and deletions only operate on the first
+    mapping.
+    
+    Chains grown by child() get slower to search with every map. flatten()
+    indexes the maps at the bottom in one pydict, searched instead of them,
+    and set_flatten_policy() makes that automatic. The maps stay as they are.
+    '''    
+    # _policy is (max_depth, miss_budget, depth) or None. See set_flatten_policy.
+    # _misses is the number of maps searched for missing keys since.
+    # _flat is None, or (version, start, index) from flatten(): index merges
+    # the maps from start on, while _maps.version is version. It holds
+    # _marker for the keys changed in those maps since, to be looked up again.
+    __slots__ = ("_maps", "_policy", "_misses", "_flat", "__weakref__")
+    
+    def __new__(cls, *maps):
+        self = pydict.__new__(cls)
+        
+        self._policy = None
+        self._misses = 0
+        self._flat = None
+        self.maps = list(maps) or [pydict()]
+        
+        self._keys = self._hash_table = self._size = None
+        return self
+    
+    def __getitem__(self, key):
+        # Hash the key once, for all the maps
+        return self.getitem_hashed(key, hash(key))
+    
+    def getitem_hashed(self, key, h):
+        "Return self[key], where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        start, index = self._merged()
+        if index is None:
+            value = _search(self._maps, key, h)
+        else:
+            value = _search(self._maps[:start], key, h)
+            if value is _marker:
+                value = self._find_merged(key, h)
+        if value is not _marker:
+            return value
+        self._missed()
+        return self.__missing__(key)
+    
+    def __len__(self):
+        "Return len(self): the number of distinct keys of the maps."
+        maps = self.maps
+        if len(maps) == 1:
+            return len(maps[0])
+        # A key in several maps is one key of self, as in as_pydict()
+        return len(set().union(*maps))
+    
+    def as_pydict(self):
+        "Return self as a plain pydict."
+        pd = pydict()
+        for map in reversed(self.maps):
+            pd.update(map)
+        return pd
+    
+    def __iter__(self):
+        return iter(self.as_pydict())
+    
+    def __reversed__(self):
+        return reversed(self.as_pydict())     
+    
+    def __contains__(self, key):
+        return self.contains_hashed(key, hash(key))
+    
+    def contains_hashed(self, key, h):
+        "Return key in self, where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        start, index = self._merged()
+        if any([_contains_hashed(map, key, h) for map in self._maps[:start]]):
+            return True
+        if index is not None and self._find_merged(key, h) is not _marker:
+            return True
+        self._missed()
+        return False
+    
+    def __bool__(self):
+        "Return bool(self)."
+        return any(self.maps)
+    
+    def __repr__(self):
+        if id(self) in _repr_pydicts:
+            return f"{self.__class__.__name__}(...)"
+        _repr_pydicts.add(id(self))
+        s = f"{self.__class__.__name__}({', '.join([repr(map) for map in self.maps])})"
+        _repr_pydicts.remove(id(self))
+        return s
+    
+    
+    def copy(self):
+        "Return a new ShallowChainMap or subclass. \nIts first map is copied, while other mappings remain intact."
+        return self._derive(self.maps[0].copy(), *self.maps[1:])
+    
+    def _derive(self, *maps):
+        "Return a chain of maps, of the class of self and with its flatten policy."
+        chain = self.__class__(*maps)
+        if self._policy is not None:
+            chain.set_flatten_policy(*self._policy)
+        return chain
+    
+    def _merged(self):
+        """Return (start, index): the maps of self from start on are searched in
+        index, a pydict, or one by one if index is None. First flatten self if
+        its policy allows fewer maps than it has."""
+        flat = self._flat
+        maps = self._maps
+        if flat is not None:
+            if flat[0] == maps.version:
+                return flat[1], flat[2]
+            # The maps changed. Index them again when the policy says so.
+            self._flat = None
+        policy = self._policy
+        if policy is not None and policy[0] is not None and len(maps) > policy[0]:
+            self.flatten(policy[2])
+            return self._flat[1], self._flat[2]
+        return len(maps), None
+    
+    def _find_merged(self, key, h):
+        "Return the value of key in the maps indexed by flatten(), or _marker. h is hash(key)."
+        version, start, index = self._flat
+        node = index._find_node(key, h)
+        if node is None:
+            return _marker
+        value = node.value
+        if value is _marker:
+            # key changed in the maps since it was indexed. Look it up again.
+            value = _search(self._maps[start:], key, h)
+            if value is _marker:
+                del index[key]
+            else:
+                index.setitem_hashed(key, h, value)
+        return value
+    
+    def _changed(self, key):
+        "Look key up again in the maps indexed by flatten(), which is changing in one of them."
+        flat = self._flat
+        if flat is not None and flat[2] is not None:
+            flat[2][key] = _marker
+    
+    def _cleared(self):
+        "Forget the index of flatten(), as one of its maps is being cleared."
+        self._flat = None
+    
+    def _missed(self, count=1):
+        "Count searches of all the maps for count missing keys, and flatten self if over budget."
+        policy = self._policy
+        if policy is None or policy[1] is None or self._flat is not None:
+            return
+        self._misses += count * len(self._maps)
+        if self._misses > policy[1]:
+            self.flatten(policy[2])
+    
+    def flatten(self, depth=2):
+        """Index the items of the maps of self after the first depth - 1 in one
+        new pydict, searched instead of them, so that lookups search at most
+        depth maps. By default, the first map, which writes go to, isn't indexed.
+        
+        The maps of self stay as they are, and writes and deletions reach them
+        as before. Lookups find the same values: the index is told of the changes
+        of the maps indexed (see help(pydict._watch)), and is dropped when self.maps
+        changes or one of them is cleared. So only frozen maps and pydicts using
+        pydict's storage are indexed. A map which isn't, or has a __missing__
+        method, like a defaultpydict, is searched with the maps before it.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        maps = self.maps
+        start = depth - 1
+        for i in range(len(maps) - 1, start - 1, -1):
+            if not _mergeable(maps[i]):
+                start = i + 1
+                break
+        self._misses = 0
+        if len(maps) - start < 2:
+            # Nothing to gain. Remember it, until the maps change.
+            self._flat = (maps.version, len(maps), None)
+            return
+        for map in maps[start:]:
+            if not isinstance(map, _pydict._frozen_types):
+                map._watch(self)
+        # A key takes its value from the first map holding it. One presized build.
+        pairs = []
+        for map in reversed(maps[start:]):
+            pairs.extend(map.items())
+        self._flat = (maps.version, start, pydict.build_bulk(pairs))
+    
+    def stats(self):
+        """Return a pydict of statistics about self's maps.
+        
+        length: number of distinct keys
+        depth: number of maps
+        indexed: number of maps searched in the index of flatten()
+        misses: number of maps searched for missing keys since self was last flattened
+        maps: list of the stats() of every map, or None for a map without stats()
+        """
+        stats = pydict()
+        stats["length"] = len(self)
+        stats["depth"] = len(self.maps)
+        start, index = self._merged()
+        stats["indexed"] = 0 if index is None else len(self.maps) - start
+        stats["misses"] = self._misses
+        maps = []
+        for map in self.maps:
+            statsfunc = getattr(map, "stats", None)
+            maps.append(statsfunc() if callable(statsfunc) else None)
+        stats["maps"] = maps
+        return stats
+    
+    def set_flatten_policy(self, max_depth=None, miss_budget=None, depth=2):
+        """Flatten self to depth maps automatically, whenever it has more than max_depth
+        maps, and whenever lookups of missing keys have searched more than miss_budget
+        maps in total since it was last flattened. None means no limit. See help(flatten):
+        the maps of self stay as they are, and lookups find the same values.
+        Chains made from self by child(), parent and copy() keep the policy."""
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        if max_depth is not None and max_depth < depth:
+            raise ValueError("max_depth must be at least depth")
+        if max_depth is None and miss_budget is None:
+            self._policy = None
+        else:
+            self._policy = (max_depth, miss_budget, depth)
+        self._misses = 0
+    
+    @property
+    def maps(self):
+        "A mutable list of this ShallowChainMap's maps"
+        if not hasattr(self, '_maps'):
+            self._maps = _MapList([pydict()])
+        return self._maps
+            
+    @maps.setter
+    def maps(self, value):
+        value = list(value)
+        self._flat = None
+        if not value:
+            self._maps = _MapList([pydict()])
+            return
+        for item in value:
+            if not isinstance(item, _collections_abc.Mapping):
+                raise TypeError(f"All items of maps list must be instances of collections.abc.Mapping, " + \
+                f"not {item.__class__.__module__}.{item.__class__.__name__}")
+        self._maps = _MapList(value)
+        
+    def child(self, map=None):
+        "Return PyChainMap(map, *self.maps). \nIf map not given, it defaults to an empty pydict."
+        if map is None:
+            map = pydict()
+        return self._derive(map, *self.maps)
+    
+    @property
+    def parent(self):
+        "Returns PyChainMap(*self.maps[1:])"
+        return self._derive(*self.maps[1:])
+    
+    def __setitem__(self, key, value):
+        self.maps[0][key] = value
+    
+    def setitem_hashed(self, key, h, value):
+        "Set self[key] to value, where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        _setitem_hashed(self.maps[0], key, h, value)
+        
+    def __delitem__(self, key):
+        try:
+            del self.maps[0][key]
+        except KeyError:
+            raise KeyError(f"{key} not found in the first mapping.")
+        
+    def __sizeof__(self):
+        # _keys, _hash_table, and _size are None
+        # _maps list can be accessed through maps property
+        # Therefore, no private internals to be accounted for
+        return object.__sizeof__(self)
+        
+    def popitem(self, last=True):
+        """Removes a key from the first mapping, return a 2-tuple: (the key, its associated value).
+        Raises KeyError if the first mapping is empty.
+        
+        By default, the last key is removed.
+        When the first mapping's popitem supports the last argument, if bool(last)
+        evaluates to False, the first key is removed instead."""        
+        try:
+            try:
+                return self.maps[0].popitem(last)
+            except TypeError:
+                return self.maps[0].popitem()
+        except KeyError:
+            raise KeyError("first mapping is empty.")
+        
+    def clear(self):
+        "Clear the first mapping."
+        self.maps[0].clear()
+    
+    def keys(self):
+        return self.as_pydict().keys()
+    
+    def values(self):
+        return self.as_pydict().values()
+    
+    def items(self):
+        return self.as_pydict().items()
+    
+    
+##################################
+### DeepChainMap
+##################################
+    
+class DeepChainMap(ShallowChainMap):
+    """A ShallowChainMap where writes, updates, and deletions operate
+    on all mappings, not just the first."""
+    def copy(self):
+        "Create a new DeepChainMap, with all maps copied."
+        c = []
+        for map in self.maps:
+            try:
+                c.append(map.copy())
+            except AttributeError:
+                c.append(map)
+        return self._derive(*c)
+    
+    def clear(self):
+        "Clear all mappings."
+        for map in self.maps:
+            try:
+                map.clear()
+            except Exception:
+                pass
+        
+    
+    def popitem(self, last=True):
+        """Removes a key from the first non-empty mapping, return a 2-tuple: (the key, its associated value).
+        Raises KeyError if all mappings are empty.
+        
+        By default, the last key is removed.
+        When the first non-empty mapping's popitem supports the last argument, if bool(last)
+        evaluates to False, the first key is removed instead."""
+
+        for map in self.maps:
+            try:
+                try:
+                    return map.popitem(last)
+                except TypeError:
+                    return map.popitem()    
+            except KeyError:
+                pass
+        raise KeyError("all mappings are empty.")
+    
+    def __delitem__(self, key):
+        start, index = self._merged()
+        maps = self.maps
+        if index is not None and self._find_merged(key, hash(key)) is _marker:
+            # None of the maps indexed holds key
+            maps = maps[:start]
+        for map in maps:
+            try:
+                del map[key]
+                return
+            except KeyError:
+                pass
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        # Hash the key once, for all the maps
+        self.setitem_hashed(key, hash(key), value)
+    
+    def setitem_hashed(self, key, h, value):
+        "Set self[key] to value, where h is hash(key). \nSee help(pydict.getitem_hashed)."
+        start, index = self._merged()
+        maps = self.maps
+        if index is not None and self._find_merged(key, h) is _marker:
+            # None of the maps indexed holds key
+            maps = maps[:start]
+        for mapping in maps:
+            if _contains_hashed(mapping, key, h):
+                _setitem_hashed(mapping, key, h, value)
+                return
+        self._missed()
+        _setitem_hashed(self.maps[0], key, h, value)
+    
+    def update(self, mapping_or_iterable=(), /, **kwds):
+        """d.update(Q, **R)
+    Update self from Q and R, like pydict.update: every key is set in the first
+    map holding it, or else in the first map. Each key is hashed once, and each
+    map is searched once, for all the keys not found before it.
+        """
+        keysfunc = getattr(mapping_or_iterable, "keys", None)
+        if callable(keysfunc):
+            pending = pydict((key, mapping_or_iterable[key]) for key in keysfunc())
+        else:
+            pending = pydict(mapping_or_iterable)
+        pending.update(kwds)
+        keys, values = list(pending), list(pending.values())
+        if not keys:
+            return
+        hashes = [hash(key) for key in keys]
+        start, index = self._merged()
+        maps = self.maps
+        keys, hashes, values = _update_found(maps[:start], keys, hashes, values)
+        if index is not None and keys:
+            # The keys the index lacks are in none of the maps indexed
+            indexed, absent = ([], [], []), ([], [], [])
+            for key, h, value in zip(keys, hashes, values):
+                part = absent if self._find_merged(key, h) is _marker else indexed
+                part[0].append(key)
+                part[1].append(h)
+                part[2].append(value)
+            keys, hashes, values = absent
+            _update_found(maps[start:], *indexed)
+        if keys:
+            self._missed(len(keys))
+            first = maps[0]
+            for key, h, value in zip(keys, hashes, values):
+                _setitem_hashed(first, key, h, value)
+    
+    __slots__ = ()
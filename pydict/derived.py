@@ -0,0 +1,368 @@
+import _collections_abc
+
+import pydict as _pydict
+from pydict import (pydict, PyDictKeyView, PyDictValueView, PyDictItemView, PyDictIterator,
+                    PyDictKeyIterator, PyDictValueIterator, PyDictItemIterator,
+                    _construct, _marker, _repr_pydicts)
+
+##################################
+### Derived pydicts
+##################################
+
+class _DerivedPyDict(object):
+    """Base class of MappedPyDict, FilteredPyDict and ProjectedPyDict.
+
+    A read-only mapping derived from a source mapping, computed on access.
+    Nothing is copied when it's made. Its iterators go over the keys of the
+    source, or of a projection, skipping those self leaves out.
+
+    A memoizing derived pydict keeps what it computed in _memo. It watches
+    _root, the mapping it's derived from (see help(pydict._watch)), which
+    tells it which keys change, so that it forgets what it computed for them.
+    Frozen roots never change. Other roots can't tell of their changes, and
+    can only have derived pydicts which don't memoize.
+    """
+
+    __slots__ = ("_source", "_root", "_memo", "__weakref__")
+
+    def __new__(cls, source, memoize=False):
+        self = object.__new__(cls)
+        self._source = source
+        self._root = source._root if isinstance(source, _DerivedPyDict) else source
+        self._memo = None
+        if memoize:
+            root = self._root
+            # Read when called: more frozen types are added as their modules load
+            if not isinstance(root, _pydict._frozen_types):
+                if not isinstance(root, pydict):
+                    raise TypeError(f"{root.__class__.__name__} can't tell of its changes. "
+                                    "Use memoize=False, or derive from a pydict copy.")
+                try:
+                    root._watch(self)
+                except TypeError as exc:
+                    raise TypeError(f"{exc}. Use memoize=False, or derive from a pydict copy.") from None
+            self._memo = pydict()
+        return self
+
+    def _candidates(self, reverse):
+        "Return an iterator over the keys self may have, in order or reversed."
+        return reversed(self._source) if reverse else iter(self._source)
+
+    def _changed(self, key):
+        "Forget what self computed for key, which is changing in the root."
+        self._memo.pop(key, None)
+
+    def _cleared(self):
+        "Forget all self computed, as the root is being cleared."
+        self._memo.clear()
+
+    def _includes(self, key):
+        "Return whether key, one of self's candidates, is a key of self."
+        return True
+
+    def __eq__(self, other):
+        "Return self==other"
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            try:
+                if value != other[key]:
+                    return False
+            except KeyError:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __iter__(self):
+        "Return iter(self)"
+        return DerivedPyDictKeyIterator(self, _construct)
+
+    def __ne__(self, other):
+        "Return self!=other"
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        "Return repr(self)"
+        name = self.__class__.__name__
+        if id(self) in _repr_pydicts:
+            return name + "({...})"
+        _repr_pydicts.add(id(self))
+        try:
+            return name + "({" + ", ".join([f"{key!r}: {value!r}" for key, value in self.items()]) + "})"
+        finally:
+            _repr_pydicts.remove(id(self))
+
+    def __reversed__(self):
+        "Return reversed(self)."
+        return DerivedPyDictReverseKeyIterator(self, _construct)
+
+    def filter(self, pred, memoize=False):
+        "Return a FilteredPyDict of the items of self for which pred(key, value) is true. \nSee help(pydict.filter)."
+        return FilteredPyDict(self, pred, memoize)
+
+    def get(self, key, default=None):
+        "Return self[key] if key in self, else default."
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        "Return a view of self's items."
+        return DerivedPyDictItemView(self, _construct)
+
+    def keys(self):
+        "Return a view for self's keys."
+        return DerivedPyDictKeyView(self, _construct)
+
+    def map_values(self, fn, memoize=False):
+        "Return a MappedPyDict of the keys of self to fn(their values). \nSee help(pydict.map_values)."
+        return MappedPyDict(self, fn, memoize)
+
+    def project(self, keys):
+        "Return a ProjectedPyDict of the items of self whose keys are in keys. \nSee help(pydict.project)."
+        return ProjectedPyDict(self, keys)
+
+    @property
+    def source(self):
+        "The mapping self is derived from."
+        return self._source
+
+    def values(self):
+        "Return a view of self's values."
+        return DerivedPyDictValueView(self, _construct)
+
+class MappedPyDict(_DerivedPyDict):
+    """Read-only mapping of the keys of a mapping to fn(their values)
+
+    MappedPyDict(source, fn, memoize=False), or source.map_values(fn, memoize=False)
+
+    fn(value) is called when a value is read. If memoize is True, the result
+    is kept until source[key] is set or deleted. Mutating a value in place
+    isn't a change of the source. Only pydicts storing keys the pydict way,
+    and frozen mappings, can have memoizing derived pydicts.
+    """
+
+    __slots__ = ("_fn",)
+
+    def __new__(cls, source, fn, memoize=False):
+        self = _DerivedPyDict.__new__(cls, source, memoize)
+        self._fn = fn
+        return self
+
+    def __contains__(self, key):
+        "Return key in self."
+        return key in self._source
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        memo = self._memo
+        if memo is None:
+            return self._fn(self._source[key])
+        value = memo.get(key, _marker)
+        if value is _marker:
+            value = self._fn(self._source[key])
+            memo[key] = value
+        return value
+
+    def __len__(self):
+        "Return len(self)."
+        return len(self._source)
+
+class FilteredPyDict(_DerivedPyDict):
+    """Read-only mapping of the items of a mapping for which pred(key, value) is true
+
+    FilteredPyDict(source, pred, memoize=False), or source.filter(pred, memoize=False)
+
+    pred is called when an item is read, and len() calls it for every item.
+    If memoize is True, its results, and the length, are kept until their
+    items are set or deleted. Only pydicts storing keys the pydict way, and
+    frozen mappings, can have memoizing derived pydicts.
+    """
+
+    __slots__ = ("_pred", "_len")
+
+    def __new__(cls, source, pred, memoize=False):
+        self = _DerivedPyDict.__new__(cls, source, memoize)
+        self._pred = pred
+        self._len = None
+        return self
+
+    def _changed(self, key):
+        "Forget what self computed for key, which is changing in the root."
+        _DerivedPyDict._changed(self, key)
+        self._len = None
+
+    def _cleared(self):
+        "Forget all self computed, as the root is being cleared."
+        _DerivedPyDict._cleared(self)
+        self._len = None
+
+    def _includes(self, key):
+        "Return whether key, one of self's candidates, is a key of self."
+        return self._passes(key)
+
+    def _passes(self, key, value=_marker):
+        "Return whether the item of key, a key of the source, is in self."
+        memo = self._memo
+        if memo is None:
+            if value is _marker:
+                value = self._source[key]
+            return bool(self._pred(key, value))
+        passes = memo.get(key)
+        if passes is None:
+            if value is _marker:
+                value = self._source[key]
+            passes = bool(self._pred(key, value))
+            memo[key] = passes
+        return passes
+
+    def __contains__(self, key):
+        "Return key in self."
+        return key in self._source and self._passes(key)
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        value = self._source[key]
+        if not self._passes(key, value):
+            raise KeyError(key)
+        return value
+
+    def __len__(self):
+        "Return len(self)."
+        if self._memo is None:
+            return sum([self._passes(key) for key in self._source])
+        if self._len is None:
+            self._len = sum([self._passes(key) for key in self._source])
+        return self._len
+
+class ProjectedPyDict(_DerivedPyDict):
+    """Read-only mapping of the items of a mapping whose keys are in a given set of keys
+
+    ProjectedPyDict(source, keys), or source.project(keys)
+
+    Its keys are in the order given. Keys which aren't in the source are
+    left out, until they are added to it.
+    """
+
+    __slots__ = ("_wanted",)
+
+    def __new__(cls, source, keys):
+        self = _DerivedPyDict.__new__(cls, source)
+        self._wanted = pydict.fromkeys(keys)
+        return self
+
+    def _candidates(self, reverse):
+        "Return an iterator over the keys self may have, in order or reversed."
+        return reversed(self._wanted) if reverse else iter(self._wanted)
+
+    def _includes(self, key):
+        "Return whether key, one of self's candidates, is a key of self."
+        return key in self._source
+
+    def __contains__(self, key):
+        "Return key in self."
+        return key in self._wanted and key in self._source
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        if key not in self._wanted:
+            raise KeyError(key)
+        return self._source[key]
+
+    def __len__(self):
+        "Return len(self)."
+        source = self._source
+        return sum([key in source for key in self._wanted])
+
+_collections_abc.Mapping.register(_DerivedPyDict)
+
+####################################################
+### views and iterators
+####################################################
+
+class DerivedPyDictKeyView(PyDictKeyView):
+    "View for the keys of a derived pydict"
+    def __iter__(self):
+        return DerivedPyDictKeyIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return DerivedPyDictReverseKeyIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class DerivedPyDictValueView(PyDictValueView):
+    "View for the values of a derived pydict"
+    def __iter__(self):
+        return DerivedPyDictValueIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return DerivedPyDictReverseValueIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class DerivedPyDictItemView(PyDictItemView):
+    "View for the items of a derived pydict"
+    def __iter__(self):
+        return DerivedPyDictItemIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return DerivedPyDictReverseItemIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class DerivedPyDictIterator(PyDictIterator):
+    "Base class for iterators of derived pydicts"
+
+    # True for reverse iterators
+    _reverse = False
+
+    def __new__(cls, mapping=None, key=None):
+        if key is not _construct:
+            raise TypeError(f"Cannot create {cls.__name__} instances")
+        self = object.__new__(cls)
+        self._mapping = mapping
+        # The source's own iterator raises RuntimeError if it changes size
+        self._candidates = mapping._candidates(cls._reverse)
+        return self
+
+    def _next_key(self):
+        "Return the next key of the mapping. Raise IndexError if there is none."
+        includes = self._mapping._includes
+        for key in self._candidates:
+            if includes(key):
+                return key
+        raise IndexError
+
+    __slots__ = ("_candidates",)
+
+class DerivedPyDictKeyIterator(DerivedPyDictIterator, PyDictKeyIterator):
+    "Iterator for the keys of a derived pydict"
+    __slots__ = ()
+
+class DerivedPyDictValueIterator(DerivedPyDictIterator, PyDictValueIterator):
+    "Iterator for the values of a derived pydict"
+    __slots__ = ()
+
+class DerivedPyDictItemIterator(DerivedPyDictIterator, PyDictItemIterator):
+    "Iterator for the items of a derived pydict"
+    __slots__ = ()
+
+class DerivedPyDictReverseKeyIterator(DerivedPyDictKeyIterator):
+    "Reverse iterator for the keys of a derived pydict"
+    _reverse = True
+    __slots__ = ()
+
+class DerivedPyDictReverseValueIterator(DerivedPyDictValueIterator):
+    "Reverse iterator for the values of a derived pydict"
+    _reverse = True
+    __slots__ = ()
+
+class DerivedPyDictReverseItemIterator(DerivedPyDictItemIterator):
+    "Reverse iterator for the items of a derived pydict"
+    _reverse = True
+    __slots__ = ()
@@ -0,0 +1,577 @@
+import array as _array
+import sys as _sys
+
+from pydict import pydict, _MASK64, _deleted, _marker, _batch_keys, _batch_result
+
+try:
+    import numpy as _np
+except ImportError:
+    # NumPy is optional. Without it, the batch methods take and return sequences.
+    _np = None
+
+    
+##################################
+### IntPyDict
+##################################
+
+# Minimum IntPyDict index size. Index sizes are always powers of 2.
+_INT_MIN_SIZE = 8
+
+# Index slots which hold no entry
+_EMPTY = -1
+_DUMMY = -2
+
+# Entry hash code of deleted entries. hash() never returns -1.
+_DEAD = -1
+
+# hash() of an int is its remainder modulo this prime, with the int's sign
+_HASH_MODULUS = _sys.hash_info.modulus
+
+class _IntPyDictKeys(object):
+    "Keys list of an IntPyDict, as seen by its views and iterators."
+    __slots__ = ("_mapping",)
+    
+    def __init__(self, mapping):
+        self._mapping = mapping
+        
+    def __getitem__(self, i):
+        mapping = self._mapping
+        if mapping._entry_hashes[i] == _DEAD:
+            return _deleted
+        return mapping._entry_keys[i]
+    
+    def __len__(self):
+        return len(self._mapping._entry_keys)
+    
+    def __sizeof__(self):
+        return object.__sizeof__(self)
+
+class IntPyDict(pydict):
+    """pydict specialized for int keys and int or float values
+    
+    IntPyDict() -> new empty IntPyDict with int values
+    IntPyDict(mapping_or_iterable) -> new IntPyDict initialized from a mapping or
+        an iterable of (key, value) pairs, like pydict
+    IntPyDict(..., typecode="d") -> the same, with float values
+    
+    Keys, hash codes and values are stored unboxed in array('q') and 
+    array(typecode) buffers, in insertion order, and found through an 
+    open addressing index. Keys must fit in 64 bits, values in their typecode.
+    Objects which aren't ints are never keys of an IntPyDict.
+    
+    keys_buffer() and values_buffer() export the arrays without copying.
+    Release those memoryviews before adding or deleting keys.
+    """
+    
+    __slots__ = (
+        "_index", "_entry_keys", "_entry_hashes", "_entry_values", "_fill", "_typecode"
+    )
+    
+    def __new__(cls, mapping_or_iterable=(), /, typecode="q"):
+        if typecode not in ("q", "d"):
+            raise ValueError("typecode must be 'q' (int values) or 'd' (float values)")
+        # Get a raw pydict
+        self = pydict.__new__(cls)
+        # The node hash table is unused. _keys is a view of the entries
+        # for iterators; _size is the size of the index.
+        self._hash_table = None
+        self._keys = _IntPyDictKeys(self)
+        self._typecode = typecode
+        self._reset()
+        # Update self using mapping_or_iterable
+        self.update(mapping_or_iterable)
+        return self
+    
+    def _reset(self):
+        "Empty the entries and index."
+        self._entry_keys = _array.array("q")
+        self._entry_hashes = _array.array("q")
+        self._entry_values = _array.array(self._typecode)
+        self._size = _INT_MIN_SIZE
+        self._index = _array.array("i", [_EMPTY]) * _INT_MIN_SIZE
+        self._fill = 0
+        self._used = 0
+        self._first = 0
+    
+    def _lookup(self, key, h):
+        "Return (index slot of key, its entry), or (empty slot for key, -1) if key isn't in self."
+        index, hashes, keys = self._index, self._entry_hashes, self._entry_keys
+        mask = self._size - 1
+        # Perturbation mixes the high bits of the hash code into the probe sequence
+        perturb = (h ^ self._seed) & _MASK64
+        i = perturb & mask
+        while True:
+            ix = index[i]
+            if ix == _EMPTY:
+                return i, -1
+            if ix >= 0 and hashes[ix] == h and keys[ix] == key:
+                return i, ix
+            perturb >>= 5
+            i = (i * 5 + perturb + 1) & mask
+    
+    def _resize(self, pad=0, room=0):
+        """Rebuild the entries without deleted ones, and an index to fit them
+        and room more keys. Leave pad deleted entries at the front, for keys 
+        moved to the front."""
+        keys, hashes, values = self._entry_keys, self._entry_hashes, self._entry_values
+        new_keys = _array.array("q", [0]) * pad
+        new_hashes = _array.array("q", [_DEAD]) * pad
+        new_values = _array.array(self._typecode, [0]) * pad
+        for ix in range(self._first, len(hashes)):
+            if hashes[ix] != _DEAD:
+                new_keys.append(keys[ix])
+                new_hashes.append(hashes[ix])
+                new_values.append(values[ix])
+        # The index is at least three times the number of keys
+        size = _INT_MIN_SIZE
+        while size < (self._used + room) * 3:
+            size *= 2
+        index = _array.array("i" if size < 2 ** 31 else "q", [_EMPTY]) * size
+        mask = size - 1
+        seed = self._seed
+        for ix in range(pad, len(new_hashes)):
+            perturb = (new_hashes[ix] ^ seed) & _MASK64
+            i = perturb & mask
+            while index[i] != _EMPTY:
+                perturb >>= 5
+                i = (i * 5 + perturb + 1) & mask
+            index[i] = ix
+        self._entry_keys, self._entry_hashes, self._entry_values = new_keys, new_hashes, new_values
+        self._index = index
+        self._size = size
+        self._fill = self._used
+        self._first = pad
+        self._resizes += 1
+    
+    def _lookup_many(self, keys):
+        """Return (keys, hash codes, index slots, entries) of a list of keys,
+        like _lookup. Keys which aren't ints have hash code None, and slot
+        and entry -1."""
+        index, entry_hashes, entry_keys = self._index, self._entry_hashes, self._entry_keys
+        mask = self._size - 1
+        seed = self._seed
+        ints, hashes, slots, entries = [], [], [], []
+        for key in keys:
+            if not isinstance(key, int):
+                ints.append(key)
+                hashes.append(None)
+                slots.append(-1)
+                entries.append(-1)
+                continue
+            key = int(key)
+            h = hash(key)
+            perturb = (h ^ seed) & _MASK64
+            i = perturb & mask
+            while True:
+                ix = index[i]
+                if ix == _EMPTY or ix >= 0 and entry_hashes[ix] == h and entry_keys[ix] == key:
+                    break
+                perturb >>= 5
+                i = (i * 5 + perturb + 1) & mask
+            ints.append(key)
+            hashes.append(h)
+            slots.append(i)
+            entries.append(ix)
+        return ints, hashes, slots, entries
+    
+    def _key_array(self, keys):
+        """Return keys as a NumPy array of 64 bit ints, or None if they
+        aren't all such ints or NumPy isn't installed."""
+        if _np is None:
+            return None
+        if not isinstance(keys, _np.ndarray):
+            if not keys:
+                return None
+            try:
+                keys = _np.array(keys)
+            except (TypeError, ValueError, OverflowError):
+                return None
+        kind = keys.dtype.kind
+        if keys.ndim == 1 and (kind == "i" or kind == "u" and keys.dtype.itemsize < 8):
+            return keys.astype(_np.int64, copy=False)
+        return None
+    
+    def _lookup_array(self, keys):
+        """Return (hash codes, index slots, entries) of a NumPy array of keys,
+        like _lookup. Every key is hashed and probed for at once, in NumPy."""
+        # hash() of an int, as NumPy
+        r = _np.remainder(keys, _HASH_MODULUS)
+        hashes = _np.where(keys < 0, -((_HASH_MODULUS - r) % _HASH_MODULUS), r)
+        hashes[hashes == -1] = -2
+        # Unsigned 64 bit arithmetic wraps, which the mask hides
+        perturbs = hashes.astype(_np.uint64) ^ _np.uint64(self._seed)
+        mask = _np.uint64(self._size - 1)
+        slots = perturbs & mask
+        entries = _np.full(len(keys), _EMPTY, dtype=_np.int64)
+        index = _np.frombuffer(self._index, dtype=_np.dtype(self._index.typecode))
+        entry_hashes = _np.frombuffer(self._entry_hashes, dtype=_np.int64)
+        entry_keys = _np.frombuffer(self._entry_keys, dtype=_np.int64)
+        # Each round probes one slot for every key still being looked up
+        pending = _np.arange(len(keys))
+        while len(pending):
+            ix = index[slots[pending]].astype(_np.int64)
+            hit = ix >= 0
+            live = _np.flatnonzero(hit)
+            hit[live] = (entry_hashes[ix[live]] == hashes[pending[live]]) & \
+                (entry_keys[ix[live]] == keys[pending[live]])
+            entries[pending[hit]] = ix[hit]
+            # Keys stop at their entry or an empty slot
+            pending = pending[~hit & (ix != _EMPTY)]
+            perturbs[pending] >>= _np.uint64(5)
+            slots[pending] = (slots[pending] * _np.uint64(5) + perturbs[pending] + _np.uint64(1)) & mask
+        return hashes, slots.astype(_np.int64), entries
+    
+    def _check_exports(self):
+        """Raise BufferError if a memoryview of the keys or values is alive.
+        Called before changing anything, when the arrays will shrink."""
+        # Arrays with exports can't change size. Try to grow them by one entry.
+        for entries in (self._entry_keys, self._entry_values):
+            entries.append(0)
+            entries.pop()
+    
+    def _remove_entry(self, slot, ix):
+        "Delete entry ix, found at slot of the index."
+        hashes = self._entry_hashes
+        if ix == len(hashes) - 1:
+            # The trailing deleted entries are popped below
+            self._check_exports()
+        self._index[slot] = _DUMMY
+        hashes[ix] = _DEAD
+        self._used -= 1
+        # The entries never end with a deleted entry
+        if ix == len(hashes) - 1:
+            keys, values = self._entry_keys, self._entry_values
+            while hashes and hashes[-1] == _DEAD:
+                hashes.pop()
+                keys.pop()
+                values.pop()
+            if self._first > len(hashes):
+                self._first = len(hashes)
+    
+    def __contains__(self, key):
+        "Return key in self."
+        if not isinstance(key, int):
+            return False
+        key = int(key)
+        return self._lookup(key, hash(key))[1] >= 0
+    
+    def __copy__(self):
+        "Implement copy.copy(self)."
+        return self.copy()
+    
+    def __delitem__(self, key):
+        "Delete self[key]."
+        if not isinstance(key, int):
+            raise KeyError(key)
+        k = int(key)
+        slot, ix = self._lookup(k, hash(k))
+        if ix < 0:
+            raise KeyError(key)
+        self._remove_entry(slot, ix)
+    
+    def __getitem__(self, key):
+        "Return self[key]."
+        if key.__class__ is not int:
+            if not isinstance(key, int):
+                return self.__missing__(key)
+            key = int(key)
+        h = hash(key)
+        index, hashes, keys = self._index, self._entry_hashes, self._entry_keys
+        mask = self._size - 1
+        perturb = (h ^ self._seed) & _MASK64
+        i = perturb & mask
+        while True:
+            ix = index[i]
+            if ix == _EMPTY:
+                return self.__missing__(key)
+            if ix >= 0 and hashes[ix] == h and keys[ix] == key:
+                return self._entry_values[ix]
+            perturb >>= 5
+            i = (i * 5 + perturb + 1) & mask
+    
+    def _probe(self, key):
+        "Return (number of index slots visited looking up key, self[key], or _marker if key isn't found)."
+        if not isinstance(key, int):
+            return 0, _marker
+        key = int(key)
+        h = hash(key)
+        index, hashes, keys = self._index, self._entry_hashes, self._entry_keys
+        mask = self._size - 1
+        perturb = (h ^ self._seed) & _MASK64
+        i = perturb & mask
+        probes = 1
+        while True:
+            ix = index[i]
+            if ix == _EMPTY:
+                return probes, _marker
+            if ix >= 0 and hashes[ix] == h and keys[ix] == key:
+                return probes, self._entry_values[ix]
+            perturb >>= 5
+            i = (i * 5 + perturb + 1) & mask
+            probes += 1
+    
+    def __repr__(self):
+        "Return repr(self)"
+        parts = [f"{key!r}: {value!r}" for key, value in self.items()]
+        if self._typecode == "q":
+            return "IntPyDict({" + ", ".join(parts) + "})"
+        return "IntPyDict({" + ", ".join(parts) + f"}}, typecode={self._typecode!r})"
+    
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        if key.__class__ is not int:
+            if not isinstance(key, int):
+                raise TypeError(f"IntPyDict keys must be ints, not {key.__class__.__name__}")
+            key = int(key)
+        h = hash(key)
+        slot, ix = self._lookup(key, h)
+        if ix >= 0:
+            self._entry_values[ix] = value
+            return
+        # Resize if necessary (index would be over 2/3 full)
+        if (self._fill + 1) * 3 > self._size * 2:
+            self._resize()
+            slot, ix = self._lookup(key, h)
+        # Append the entry. If the key or value doesn't fit, undo it.
+        keys, values = self._entry_keys, self._entry_values
+        keys.append(key)
+        try:
+            values.append(value)
+        except BaseException:
+            keys.pop()
+            raise
+        self._entry_hashes.append(h)
+        self._index[slot] = len(keys) - 1
+        self._fill += 1
+        self._used += 1
+        
+    def __sizeof__(self):
+        "Size of object in memory, in bytes."
+        size = object.__sizeof__(self)
+        size += self._keys.__sizeof__()
+        size += self._index.__sizeof__()
+        size += self._entry_keys.__sizeof__()
+        size += self._entry_hashes.__sizeof__()
+        size += self._entry_values.__sizeof__()
+        return size
+    
+    def __buffer__(self, flags):
+        "Return a memoryview of self's keys. See keys_buffer()."
+        return self.keys_buffer()
+    
+    def clear(self):
+        "Remove all items from self."
+        self._reset()
+        
+    def contains_many(self, keys):
+        """Return [key in self for key in keys], looking up all the keys in one loop.
+        If NumPy is installed, int keys are hashed and probed for with NumPy.
+        If keys is a NumPy array, return a NumPy array of bools instead."""
+        as_array = _np is not None and isinstance(keys, _np.ndarray)
+        if not as_array:
+            keys = _batch_keys(keys)[0]
+        array = self._key_array(keys)
+        if array is None:
+            return _batch_result([ix >= 0 for ix in self._lookup_many(keys)[3]], as_array)
+        found = self._lookup_array(array)[2] >= 0
+        return found if as_array else found.tolist()
+    
+    def copy(self):
+        "Return a shallow copy of self."
+        # Copy the arrays, without hashing any key again
+        pd = self.__class__(typecode=self._typecode)
+        pd._entry_keys = self._entry_keys[:]
+        pd._entry_hashes = self._entry_hashes[:]
+        pd._entry_values = self._entry_values[:]
+        pd._index = self._index[:]
+        pd._size, pd._fill, pd._used, pd._first, pd._seed = \
+            self._size, self._fill, self._used, self._first, self._seed
+        return pd
+    
+    def get_many(self, keys, default=None):
+        """Return [self.get(key, default) for key in keys], looking up all the keys in one loop.
+        If NumPy is installed, int keys are hashed and probed for with NumPy.
+        If keys is a NumPy array, return a NumPy array instead. Its dtype
+        is that of the values, unless a key is missing and default isn't
+        an int or float."""
+        as_array = _np is not None and isinstance(keys, _np.ndarray)
+        if not as_array:
+            keys = _batch_keys(keys)[0]
+        array = self._key_array(keys)
+        if array is None:
+            values = self._entry_values
+            entries = self._lookup_many(keys)[3]
+            return _batch_result([default if ix < 0 else values[ix] for ix in entries], as_array)
+        entries = self._lookup_array(array)[2]
+        found = entries >= 0
+        values = _np.frombuffer(self._entry_values, dtype=_np.dtype(self._typecode))
+        if found.all():
+            result = values[entries]
+            return result if as_array else result.tolist()
+        if not as_array:
+            result = [default] * len(entries)
+            for i, value in zip(_np.flatnonzero(found).tolist(), values[entries[found]].tolist()):
+                result[i] = value
+            return result
+        dtype = _np.result_type(values.dtype, default.__class__) \
+            if default.__class__ in (int, float) else object
+        result = _np.full(len(entries), default, dtype=dtype)
+        result[found] = values[entries[found]]
+        return result
+    
+    def keys_buffer(self):
+        "Return a memoryview of self's keys, in order, as 64 bit ints. No copy is made."
+        if len(self._entry_keys) != self._used:
+            self._resize()
+        return memoryview(self._entry_keys)
+    
+    def move_to_end(self, key, last=True):
+        """Move a key to the back of the IntPyDict.
+        If last is False, move the key to the front of the IntPyDict instead.
+        Raises KeyError if key not in the IntPyDict.
+        """
+        k = int(key) if isinstance(key, int) else None
+        slot, ix = self._lookup(k, hash(k)) if k is not None else (-1, -1)
+        if ix < 0:
+            raise KeyError("Key not in pydict")
+        keys, hashes, values = self._entry_keys, self._entry_hashes, self._entry_values
+        if last:
+            if ix == len(hashes) - 1:
+                return
+            # Append a copy of the entry, and point the index at it. The
+            # arrays which may be exported go first, and are undone if the
+            # next one fails, so a BufferError leaves them in step.
+            keys.append(keys[ix])
+            try:
+                values.append(values[ix])
+            except BaseException:
+                keys.pop()
+                raise
+            hashes.append(hashes[ix])
+            self._index[slot] = len(hashes) - 1
+            hashes[ix] = _DEAD
+        else:
+            if ix == self._first:
+                return
+            # Make room at the front of the entries if there is none
+            if self._first == 0:
+                self._resize(max(self._used, _INT_MIN_SIZE))
+                keys, hashes, values = self._entry_keys, self._entry_hashes, self._entry_values
+                slot, ix = self._lookup(k, hash(k))
+            if ix == len(hashes) - 1:
+                # The trailing deleted entries are popped below
+                self._check_exports()
+            # Copy the entry in front of the others, and point the index at it
+            self._first -= 1
+            first = self._first
+            keys[first], hashes[first], values[first] = keys[ix], hashes[ix], values[ix]
+            self._index[slot] = first
+            hashes[ix] = _DEAD
+            # The entries never end with a deleted entry
+            while hashes[-1] == _DEAD:
+                hashes.pop()
+                keys.pop()
+                values.pop()
+        # Rebuild when at least half of the entries are deleted
+        if len(hashes) - self._used > self._used + _INT_MIN_SIZE:
+            self._resize()
+    
+    def popitem(self, last=True):
+        """Removes a key, return a 2-tuple: (the key, its associated value).
+        Removes last key if last is True, otherwise first key.
+        Raises KeyError if IntPyDict is empty."""
+        if self._used == 0:
+            raise KeyError("pydict is empty.")
+        hashes = self._entry_hashes
+        if last:
+            ix = len(hashes) - 1
+        else:
+            # Skip the deleted entries before the first, and remember they were skipped.
+            ix = self._first
+            while hashes[ix] == _DEAD:
+                ix += 1
+            self._first = ix
+        key, value = self._entry_keys[ix], self._entry_values[ix]
+        slot, ix = self._lookup(key, hashes[ix])
+        self._remove_entry(slot, ix)
+        return key, value
+    
+    def set_many(self, keys, values):
+        """For every i, set self[keys[i]] to values[i], looking up all the keys in one loop.
+        If NumPy is installed, int keys are hashed and probed for with NumPy."""
+        if not (_np is not None and isinstance(keys, _np.ndarray)):
+            keys = _batch_keys(keys)[0]
+        values = _batch_keys(values)[0]
+        if len(keys) != len(values):
+            raise ValueError(f"{len(keys)} keys but {len(values)} values")
+        # Resize at most once, to fit all the keys
+        if (self._fill + len(keys)) * 3 > self._size * 2:
+            self._resize(room=len(keys))
+        array = self._key_array(keys)
+        if array is None:
+            keys, hashes, slots, entries = self._lookup_many(keys)
+        else:
+            hashes, slots, entries = self._lookup_array(array)
+            keys, hashes, slots, entries = array.tolist(), hashes.tolist(), slots.tolist(), entries.tolist()
+        index, entry_keys, entry_hashes, entry_values = \
+            self._index, self._entry_keys, self._entry_hashes, self._entry_values
+        for key, h, value, slot, ix in zip(keys, hashes, values, slots, entries):
+            if ix >= 0:
+                entry_values[ix] = value
+            elif h is None or index[slot] != _EMPTY:
+                # Not an int, or a key inserted by this batch took its
+                # slot (perhaps the same key). Insert it normally.
+                self[key] = value
+            else:
+                # Append the entry. If the value doesn't fit, undo it.
+                entry_keys.append(key)
+                try:
+                    entry_values.append(value)
+                except BaseException:
+                    entry_keys.pop()
+                    raise
+                entry_hashes.append(h)
+                index[slot] = len(entry_keys) - 1
+                self._fill += 1
+                self._used += 1
+    
+    def stats(self):
+        """Return a pydict of statistics about self's internal index.
+        See help(pydict.stats). chain_lengths counts the index slots 
+        probed to find each key, and memory["order"] is 0 because 
+        the entries are kept in order."""
+        histogram = {}
+        for key in self:
+            probes = self._probe(key)[0]
+            histogram[probes] = histogram.get(probes, 0) + 1
+        chains = pydict()
+        for length in sorted(histogram):
+            chains[length] = histogram[length]
+        empty = self._index.count(_EMPTY)
+        stats = pydict()
+        stats["length"] = self._used
+        stats["buckets"] = self._size
+        stats["load_factor"] = self._used / self._size
+        stats["empty_buckets"] = empty / self._size
+        stats["chain_lengths"] = chains
+        stats["longest_chain"] = max(histogram, default=0)
+        stats["tree_buckets"] = 0
+        stats["resizes"] = self._resizes
+        memory = pydict()
+        memory["index"] = self._index.__sizeof__()
+        memory["entries"] = self._entry_keys.__sizeof__() + \
+            self._entry_hashes.__sizeof__() + self._entry_values.__sizeof__()
+        memory["order"] = 0
+        stats["memory"] = memory
+        return stats
+    
+    @property
+    def typecode(self):
+        "The array typecode of self's values: 'q' for ints, 'd' for floats."
+        return self._typecode
+    
+    def values_buffer(self):
+        "Return a memoryview of self's values, in order, in self.typecode. No copy is made."
+        if len(self._entry_values) != self._used:
+            self._resize()
+        return memoryview(self._entry_values)
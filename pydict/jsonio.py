@@ -0,0 +1,295 @@
+import _collections_abc
+import json as _json
+import re as _re
+from json import decoder as _decoder, encoder as _encoder
+
+from pydict import pydict, frozenpydict, _marker
+
+##################################
+### Streaming JSON
+##################################
+
+# iter_json_chunks joins about this many pieces of JSON text into each chunk
+_JSON_CHUNK_PIECES = 4096
+
+# Objects with at least this many members are loaded by set_many, which sizes
+# the table once for all of them. Smaller objects fit the initial table.
+_JSON_PRESIZE_MIN = 8
+
+# load_json reads the document this many characters at a time
+_JSON_READ_SIZE = 1 << 16
+
+# A number or literal at the end of the text read so far may go on in the
+# next chunk. It's complete once one of these follows it.
+_JSON_DELIMITER = _re.compile(r"[\s,:\]}]")
+
+# What load_json expects next: a value, the first value of an array or a
+# value or "]", a key or "}" after "{", a key after ",", ":", or "," or the
+# close of the innermost container after a value
+_VALUE, _FIRST_VALUE, _FIRST_KEY, _KEY, _COLON, _AFTER = range(6)
+
+def _float_json(value, allow_nan):
+    "Return the JSON text of a float, as json writes it."
+    if value != value:
+        text = "NaN"
+    elif value == float("inf"):
+        text = "Infinity"
+    elif value == -float("inf"):
+        text = "-Infinity"
+    else:
+        return float.__repr__(value)
+    if not allow_nan:
+        raise ValueError("Out of range float values are not JSON compliant: " + repr(value))
+    return text
+
+def _key_json(key, skipkeys, allow_nan):
+    "Return the string a key is written as in JSON, or None to skip it."
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return _float_json(key, allow_nan)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if skipkeys:
+        return None
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+def iter_json_chunks(obj, *, ensure_ascii=True, allow_nan=True, skipkeys=False,
+                     separators=(", ", ": "), default=None):
+    """Yield the JSON text of obj, in chunks of strings.
+
+    Mappings (pydicts, frozenpydicts, dicts and any other Mapping) become
+    JSON objects and lists and tuples JSON arrays, read one entry at a time:
+    no intermediate dict or whole text is built. The arguments mean what they
+    mean to json.dumps; there is no indentation.
+    """
+    encode_str = _encoder.encode_basestring_ascii if ensure_ascii else _encoder.encode_basestring
+    item_separator, key_separator = separators
+    pieces = []
+    append = pieces.append
+    # Open containers, innermost last, as [iterator over entries, whether
+    # it's a mapping, id, whether no entry was written yet]
+    stack = []
+    markers = set()
+    # Ids of the objects given to default, since the last value written
+    defaulted = set()
+    value = obj
+    while True:
+        # Write value, or open it if it's a container
+        if value.__class__ is str:
+            append(encode_str(value))
+        elif value is None:
+            append("null")
+        elif value is True:
+            append("true")
+        elif value is False:
+            append("false")
+        elif isinstance(value, int):
+            append(int.__repr__(value))
+        elif isinstance(value, float):
+            append(_float_json(value, allow_nan))
+        elif isinstance(value, str):
+            append(encode_str(value))
+        elif isinstance(value, (list, tuple, _collections_abc.Mapping)):
+            marker = id(value)
+            if marker in markers:
+                raise ValueError("Circular reference detected")
+            markers.add(marker)
+            if isinstance(value, (list, tuple)):
+                append("[")
+                stack.append([iter(value), False, marker, True])
+            else:
+                append("{")
+                stack.append([iter(value.items()), True, marker, True])
+        else:
+            if default is None:
+                raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+            if id(value) in defaulted:
+                raise ValueError("Circular reference detected")
+            defaulted.add(id(value))
+            value = default(value)
+            continue
+        if defaulted:
+            defaulted.clear()
+        if len(pieces) >= _JSON_CHUNK_PIECES:
+            yield "".join(pieces)
+            pieces = []
+            append = pieces.append
+        # The next value is the next entry of the innermost open container
+        while stack:
+            top = stack[-1]
+            entry = next(top[0], _marker)
+            if entry is _marker:
+                stack.pop()
+                markers.discard(top[2])
+                append("}" if top[1] else "]")
+                continue
+            if top[1]:
+                key, value = entry
+                if key.__class__ is not str:
+                    key = _key_json(key, skipkeys, allow_nan)
+                    if key is None:
+                        continue
+                if top[3]:
+                    top[3] = False
+                else:
+                    append(item_separator)
+                append(encode_str(key))
+                append(key_separator)
+            else:
+                if top[3]:
+                    top[3] = False
+                else:
+                    append(item_separator)
+                value = entry
+            break
+        else:
+            break
+    if pieces:
+        yield "".join(pieces)
+
+def dump_json(obj, fp, **kwds):
+    """Write the JSON text of obj to the file-like object fp, chunk by chunk.
+    See help(iter_json_chunks) for the keyword arguments."""
+    write = fp.write
+    for chunk in iter_json_chunks(obj, **kwds):
+        write(chunk)
+
+def _presized(cls, pairs):
+    "Return a new cls, a pydict type, with the (key, value) pairs of a JSON object."
+    pd = cls()
+    if len(pairs) < _JSON_PRESIZE_MIN:
+        for key, value in pairs:
+            pd[key] = value
+    else:
+        keys, values = zip(*pairs)
+        pd.set_many(keys, values)
+    return pd
+
+def _object_hook(object_hook_type):
+    "Return the function making the objects of a JSON document."
+    if object_hook_type is frozenpydict:
+        return lambda pairs: frozenpydict._from_pydict(_presized(pydict, pairs))
+    if isinstance(object_hook_type, type) and issubclass(object_hook_type, pydict) \
+        and object_hook_type.__new__ is pydict.__new__:
+        return lambda pairs: _presized(object_hook_type, pairs)
+    # Anything else is given the list of pairs
+    return object_hook_type
+
+def load_json(fp, object_hook_type=pydict, **kwds):
+    """Read a JSON document from the file-like object fp.
+
+    The document is read in chunks and parsed as it arrives, so the whole
+    text is never held at once: only the chunk being parsed, and the
+    objects built so far. Its objects become object_hook_type instances,
+    made straight from the (key, value) pairs the parser collects, without
+    an intermediate dict. object_hook_type may be pydict, OrderedPyDict,
+    frozenpydict, or any callable taking a list of pairs. The hash tables
+    of large objects are sized once for all their members. As in JSON, the
+    last value of a repeated key wins. Other keyword arguments are passed
+    to json.JSONDecoder, which parses the values found whole in a chunk.
+    """
+    hook = _object_hook(object_hook_type)
+    scan = _json.JSONDecoder(object_pairs_hook=hook, **kwds).raw_decode
+    whitespace = _decoder.WHITESPACE.match
+    read = fp.read
+    text = ""
+    pos = 0
+    eof = False
+    # Open containers, innermost last, as [list of pairs or values, whether
+    # it's an object, key of the value being read]
+    stack = []
+    expect = _VALUE
+    while True:
+        pos = whitespace(text, pos).end()
+        if pos == len(text) or expect in (_VALUE, _FIRST_VALUE) and text[pos] not in "{[\"]" \
+                and not eof and _JSON_DELIMITER.search(text, pos) is None:
+            # Read on: nothing is left, or a number or literal may go on
+            if eof:
+                if pos == len(text):
+                    raise _json.JSONDecodeError("Expecting value", text, pos)
+            else:
+                chunk = read(_JSON_READ_SIZE)
+                if chunk:
+                    text = text[pos:] + chunk
+                    pos = 0
+                else:
+                    eof = True
+                continue
+        char = text[pos]
+        if expect == _AFTER:
+            top = stack[-1]
+            if char == ",":
+                pos += 1
+                expect = _KEY if top[1] else _VALUE
+                continue
+            if char != ("}" if top[1] else "]"):
+                raise _json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos += 1
+            stack.pop()
+            value = hook(top[0]) if top[1] else top[0]
+        elif expect == _COLON:
+            if char != ":":
+                raise _json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+            pos += 1
+            expect = _VALUE
+            continue
+        elif (char == "{" or char == "[") and expect <= _FIRST_VALUE:
+            try:
+                # Most containers end in the text read so far. Parse them whole.
+                value, pos = scan(text, pos)
+            except _json.JSONDecodeError:
+                # Open it, and parse it piece by piece, reading on
+                pos += 1
+                stack.append([[], char == "{", None])
+                expect = _FIRST_KEY if char == "{" else _FIRST_VALUE
+                continue
+        elif char == "}" and expect == _FIRST_KEY or char == "]" and expect == _FIRST_VALUE:
+            pos += 1
+            top = stack.pop()
+            value = hook(top[0]) if top[1] else top[0]
+        else:
+            if expect >= _FIRST_KEY and char != '"':
+                raise _json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+            try:
+                value, end = scan(text, pos)
+            except _json.JSONDecodeError:
+                if eof:
+                    raise
+                # A string may end in the next chunk
+                chunk = read(_JSON_READ_SIZE)
+                if chunk:
+                    text = text[pos:] + chunk
+                    pos = 0
+                else:
+                    eof = True
+                continue
+            pos = end
+            if expect >= _FIRST_KEY:
+                stack[-1][2] = value
+                expect = _COLON
+                continue
+        # A value was read. Add it to its container, or return it.
+        if not stack:
+            break
+        top = stack[-1]
+        if top[1]:
+            top[0].append((top[2], value))
+        else:
+            top[0].append(value)
+        expect = _AFTER
+    # Only whitespace may follow the document
+    while True:
+        pos = whitespace(text, pos).end()
+        if pos < len(text):
+            raise _json.JSONDecodeError("Extra data", text, pos)
+        text = read(_JSON_READ_SIZE)
+        pos = 0
+        if not text:
+            return value
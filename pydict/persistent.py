@@ -0,0 +1,561 @@
+import _collections_abc
+import types as _types
+
+import pydict as _pydict
+from pydict import (frozenpydict, PyDictKeyView, PyDictValueView, PyDictItemView,
+                    PyDictKeyIterator, PyDictReverseKeyIterator, _MASK64, _construct,
+                    _item_hash, _items_hash_total, _repr_pydicts)
+
+##################################
+### PersistentPyDict
+##################################
+
+# Bits of a hash code consumed by each level of a hash array mapped trie
+_HAMT_BITS = 5
+_HAMT_MASK = (1 << _HAMT_BITS) - 1
+
+class _HamtLeaf(object):
+    # hash is the key's hash code as 64 unsigned bits, seq orders leaves by insertion
+    __slots__ = "hash", "key", "value", "seq"
+    def __init__(self, hash, key, value, seq):
+        self.hash = hash
+        self.key = key
+        self.value = value
+        self.seq = seq
+        
+    def __repr__(self):
+        return f"pydict._HamtLeaf(key={self.key!r}, value={self.value!r})"
+    
+class _HamtCollision(object):
+    # Leaves of keys with the same 64 bit hash code
+    __slots__ = "hash", "leaves", "owner"
+    def __init__(self, hash, leaves, owner):
+        self.hash = hash
+        self.leaves = leaves
+        self.owner = owner
+        
+    def __repr__(self):
+        return f"pydict._HamtCollision(leaves={self.leaves})"
+
+class _HamtNode(object):
+    """Node of a hash array mapped trie.
+    
+    array holds a child (a leaf, collision or node) for every set bit of 
+    bitmap, in order. A node may be changed in place only by its owner,
+    the token of the PersistentPyDictEvolver that made it. Other nodes
+    are shared between PersistentPyDicts, and never change.
+    """
+    __slots__ = "bitmap", "array", "owner"
+    def __init__(self, bitmap, array, owner):
+        self.bitmap = bitmap
+        self.array = array
+        self.owner = owner
+        
+    def __repr__(self):
+        return f"pydict._HamtNode(array={self.array})"
+    
+    def __sizeof__(self):
+        # Note: Omit keys and values because they aren't internal
+        size = object.__sizeof__(self) + self.array.__sizeof__()
+        for child in self.array:
+            if child.__class__ is _HamtCollision:
+                size += object.__sizeof__(child) + child.leaves.__sizeof__()
+                size += sum([object.__sizeof__(leaf) for leaf in child.leaves])
+            else:
+                size += child.__sizeof__()
+        return size
+    
+#Return the leaf of key in a trie, or None if there is none
+def _hamt_find(node, h, key):
+    shift = 0
+    while True:
+        bit = 1 << ((h >> shift) & _HAMT_MASK)
+        bitmap = node.bitmap
+        if not bitmap & bit:
+            return None
+        node = node.array[(bitmap & (bit - 1)).bit_count()]
+        cls = node.__class__
+        if cls is _HamtLeaf:
+            if node.hash == h and (node.key is key or node.key == key):
+                return node
+            return None
+        if cls is _HamtCollision:
+            if node.hash == h:
+                for leaf in node.leaves:
+                    if leaf.key is key or leaf.key == key:
+                        return leaf
+            return None
+        shift += _HAMT_BITS
+        
+#Return a trie of two leaves or collisions whose hash codes differ, at shift
+def _hamt_pair(shift, a, b, owner):
+    ia = (a.hash >> shift) & _HAMT_MASK
+    ib = (b.hash >> shift) & _HAMT_MASK
+    if ia == ib:
+        return _HamtNode(1 << ia, [_hamt_pair(shift + _HAMT_BITS, a, b, owner)], owner)
+    if ia > ib:
+        a, b = b, a
+    return _HamtNode((1 << ia) | (1 << ib), [a, b], owner)
+
+#Set the key of a leaf in the trie node at shift. Return (the new node, the leaf
+#replaced or None). The leaf's seq is kept only for a new key. Nodes owned
+#by owner are changed in place, others are copied.
+def _hamt_assoc(node, shift, leaf, owner):
+    h = leaf.hash
+    bit = 1 << ((h >> shift) & _HAMT_MASK)
+    bitmap = node.bitmap
+    pos = (bitmap & (bit - 1)).bit_count()
+    in_place = owner is not None and node.owner is owner
+    if not bitmap & bit:
+        # An empty slot. Put the leaf in it.
+        array = node.array if in_place else node.array[:]
+        array.insert(pos, leaf)
+        if in_place:
+            node.bitmap |= bit
+            return node, None
+        return _HamtNode(bitmap | bit, array, owner), None
+    child = node.array[pos]
+    cls = child.__class__
+    old = None
+    if cls is _HamtNode:
+        new_child, old = _hamt_assoc(child, shift + _HAMT_BITS, leaf, owner)
+    elif child.hash != h:
+        new_child = _hamt_pair(shift + _HAMT_BITS, child, leaf, owner)
+    elif cls is _HamtLeaf:
+        if child.key is leaf.key or child.key == leaf.key:
+            old = child
+            new_child = child if child.value is leaf.value else \
+                _HamtLeaf(h, child.key, leaf.value, child.seq)
+        else:
+            new_child = _HamtCollision(h, [child, leaf], owner)
+    else:
+        leaves = child.leaves
+        for i, other in enumerate(leaves):
+            if other.key is leaf.key or other.key == leaf.key:
+                old = other
+                leaf = _HamtLeaf(h, other.key, leaf.value, other.seq)
+                break
+        else:
+            i = len(leaves)
+        if owner is not None and child.owner is owner:
+            leaves[i:i + 1] = [leaf]
+            new_child = child
+        else:
+            leaves = leaves[:]
+            leaves[i:i + 1] = [leaf]
+            new_child = _HamtCollision(h, leaves, owner)
+    if new_child is child:
+        return node, old
+    if in_place:
+        node.array[pos] = new_child
+        return node, old
+    array = node.array[:]
+    array[pos] = new_child
+    return _HamtNode(bitmap, array, owner), old
+
+#Remove key from the trie node at shift. Return (the new node, the leaf removed
+#or None). The new node is None if it would be empty, and its only child if
+#that is a leaf or collision, so that tries stay shallow.
+def _hamt_dissoc(node, shift, h, key, owner):
+    bit = 1 << ((h >> shift) & _HAMT_MASK)
+    bitmap = node.bitmap
+    if not bitmap & bit:
+        return node, None
+    array = node.array
+    pos = (bitmap & (bit - 1)).bit_count()
+    child = array[pos]
+    cls = child.__class__
+    if cls is _HamtNode:
+        new_child, old = _hamt_dissoc(child, shift + _HAMT_BITS, h, key, owner)
+    elif child.hash != h:
+        return node, None
+    elif cls is _HamtLeaf:
+        if not (child.key is key or child.key == key):
+            return node, None
+        new_child, old = None, child
+    else:
+        leaves = child.leaves
+        for i, old in enumerate(leaves):
+            if old.key is key or old.key == key:
+                break
+        else:
+            return node, None
+        if len(leaves) == 2:
+            new_child = leaves[1 - i]
+        else:
+            new_child = _HamtCollision(h, leaves[:i] + leaves[i + 1:], owner)
+    if old is None:
+        return node, None
+    if new_child is None:
+        if len(array) == 1:
+            return None, old
+        if len(array) == 2 and array[1 - pos].__class__ is not _HamtNode:
+            return array[1 - pos], old
+    elif len(array) == 1 and new_child.__class__ is not _HamtNode:
+        return new_child, old
+    if owner is None or node.owner is not owner:
+        node = _HamtNode(bitmap, array[:], owner)
+    if new_child is None:
+        del node.array[pos]
+        node.bitmap ^= bit
+    else:
+        node.array[pos] = new_child
+    return node, old
+
+#Return the root node of a trie from what _hamt_dissoc returned for the root
+def _hamt_root(node, owner):
+    if node is None:
+        return _HamtNode(0, [], owner)
+    if node.__class__ is not _HamtNode:
+        return _HamtNode(1 << (node.hash & _HAMT_MASK), [node], owner)
+    return node
+
+#Return every leaf of a trie
+def _hamt_leaves(node):
+    leaves = []
+    stack = [node]
+    while stack:
+        for child in stack.pop().array:
+            cls = child.__class__
+            if cls is _HamtLeaf:
+                leaves.append(child)
+            elif cls is _HamtCollision:
+                leaves.extend(child.leaves)
+            else:
+                stack.append(child)
+    return leaves
+
+# Root of every empty trie
+_hamt_empty = _HamtNode(0, [], None)
+
+class PersistentPyDict(object):
+    """Immutable pydict whose changed versions share structure with it
+    
+    PersistentPyDict() -> new empty PersistentPyDict
+    PersistentPyDict(mapping_or_iterable, **kwds) -> new PersistentPyDict.
+        See help(frozenpydict) for the arguments.
+    
+    Items are kept in a hash array mapped trie. set(), delete(), update()
+    and | return a new PersistentPyDict in O(log n) time per changed key,
+    sharing every unchanged node of the trie with self. For many changes,
+    evolver() returns a mutable PersistentPyDictEvolver.
+    Keys are iterated in insertion order, like a frozenpydict's.
+    """
+    
+    __slots__ = "_root", "_len", "_seq", "_order", "_hash"
+    
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        if cls is PersistentPyDict and mapping_or_iterable.__class__ is PersistentPyDict and not kwds:
+            return mapping_or_iterable
+        evolver = _persistent_pydict_empty.evolver()
+        evolver.update(mapping_or_iterable, **kwds)
+        return evolver.persistent()
+    
+    @classmethod
+    def _from_trie(cls, root, length, seq):
+        "Return a new PersistentPyDict from a trie, its number of keys, and the next seq."
+        self = object.__new__(cls)
+        self._root = root
+        self._len = length
+        self._seq = seq
+        # Keys in insertion order, and the hash total of the items,
+        # made when first needed
+        self._order = None
+        self._hash = None
+        return self
+    
+    __class_getitem__ = classmethod(_types.GenericAlias)
+    
+    # Avoid subclassing
+    __init_subclass__ = None
+    
+    def __contains__(self, key):
+        "Return key in self."
+        return _hamt_find(self._root, hash(key) & _MASK64, key) is not None
+    
+    def __eq__(self, other):
+        "Return self==other"
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        # Unequal hash totals, if both are known, mean unequal items
+        if self._hash is not None and other.__class__ in (frozenpydict, PersistentPyDict) \
+            and other._hash is not None and self._hash != other._hash:
+            return False
+        for leaf in _hamt_leaves(self._root):
+            try:
+                if leaf.value != other[leaf.key]:
+                    return False
+            except KeyError:
+                return False
+        return True
+    
+    def __getitem__(self, key):
+        "Return self[key]."
+        leaf = _hamt_find(self._root, hash(key) & _MASK64, key)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf.value
+    
+    def __hash__(self):
+        "Return hash(self). \nEqual to the hash of an equal frozenpydict. Computed once, and kept up to date by set() and delete()."
+        total = self._hash
+        if total is None:
+            total = self._hash = _items_hash_total([(leaf.hash, leaf.value) for leaf in _hamt_leaves(self._root)])
+        return hash(total)
+    
+    def __ior__(self, value):
+        "Return self |= value"
+        raise TypeError("'|=' not supported by PersistentPyDict. Use '|' instead.")
+    
+    def __iter__(self):
+        "Return iter(self)"
+        return PyDictKeyIterator(self, _construct)
+    
+    def __len__(self):
+        "Return len(self)."
+        return self._len
+    
+    def __ne__(self, other):
+        "Return self!=other"
+        if not isinstance(other, _collections_abc.Mapping):
+            return NotImplemented
+        return not (self == other)
+    
+    def __or__(self, value):
+        "Return self|value"
+        if not isinstance(value, _collections_abc.Mapping):
+            return NotImplemented
+        return self.update(value)
+    
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "PersistentPyDict({...})"
+        _repr_pydicts.add(id(self))
+        parts = [f"{key!r}: {value!r}" for key, value in self.items()]
+        _repr_pydicts.remove(id(self))
+        return "PersistentPyDict({" + ", ".join(parts) + "})"
+    
+    def __reversed__(self):
+        "Return reversed(self)"
+        return PyDictReverseKeyIterator(self, _construct)
+    
+    def __ror__(self, value):
+        "Return value|self"
+        if not isinstance(value, _collections_abc.Mapping):
+            return NotImplemented
+        return PersistentPyDict(value).update(self)
+    
+    def __sizeof__(self):
+        "Size of object in memory, in bytes. \nNodes shared with other PersistentPyDicts are counted too."
+        size = object.__sizeof__(self) + self._root.__sizeof__()
+        if self._order is not None:
+            size += self._order.__sizeof__()
+        return size
+    
+    @property
+    def _keys(self):
+        "self's keys in insertion order, for views and iterators."
+        order = self._order
+        if order is None:
+            leaves = _hamt_leaves(self._root)
+            leaves.sort(key=lambda leaf: leaf.seq)
+            order = self._order = tuple([leaf.key for leaf in leaves])
+        return order
+    
+    def copy(self):
+        "Return self, as it is immutable."
+        return self
+    
+    def delete(self, key):
+        """Return a PersistentPyDict like self, without key.
+        Raises KeyError if key not in self."""
+        root, old = _hamt_dissoc(self._root, 0, hash(key) & _MASK64, key, None)
+        if old is None:
+            raise KeyError(key)
+        pd = PersistentPyDict._from_trie(_hamt_root(root, None), self._len - 1, self._seq)
+        if self._hash is not None:
+            pd._hash = (self._hash - _item_hash(old.hash, old.value)) & _MASK64
+        return pd
+    
+    def evolver(self):
+        "Return a PersistentPyDictEvolver, to make many changes to a copy of self."
+        return PersistentPyDictEvolver(self)
+    
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        """
+        Create and return a new PersistentPyDict, p.
+        For every key in keys, p[key] = value.
+        """
+        evolver = _persistent_pydict_empty.evolver()
+        for key in keys:
+            evolver[key] = value
+        return evolver.persistent()
+    
+    def get(self, key, default=None):
+        "Return self[key] if key in self, else default."
+        leaf = _hamt_find(self._root, hash(key) & _MASK64, key)
+        if leaf is None:
+            return default
+        return leaf.value
+    
+    def items(self):
+        "Return a view of self's items."
+        return PyDictItemView(self, _construct)
+    
+    def keys(self):
+        "Return a view for self's keys."
+        return PyDictKeyView(self, _construct)
+    
+    def set(self, key, value):
+        "Return a PersistentPyDict like self, with key set to value."
+        leaf = _HamtLeaf(hash(key) & _MASK64, key, value, self._seq)
+        root, old = _hamt_assoc(self._root, 0, leaf, None)
+        if old is None:
+            pd = PersistentPyDict._from_trie(root, self._len + 1, self._seq + 1)
+        elif root is self._root:
+            return self
+        else:
+            # The keys are unchanged. So is their order.
+            pd = PersistentPyDict._from_trie(root, self._len, self._seq)
+            pd._order = self._order
+        # Keep the hash total up to date, if the new value is hashable
+        if self._hash is not None:
+            try:
+                total = self._hash + _item_hash(leaf.hash, value)
+            except TypeError:
+                pass
+            else:
+                if old is not None:
+                    total -= _item_hash(old.hash, old.value)
+                pd._hash = total & _MASK64
+        return pd
+    
+    def update(self, mapping_or_iterable=(), /, **kwds):
+        """Return a PersistentPyDict like self, updated from a mapping or
+        iterable and keyword arguments. See help(pydict.update)."""
+        evolver = self.evolver()
+        evolver.update(mapping_or_iterable, **kwds)
+        return evolver.persistent()
+    
+    def values(self):
+        "Return a view for self's values."
+        return PyDictValueView(self, _construct)
+
+_collections_abc.Mapping.register(PersistentPyDict)
+
+# Let frozenpydicts compare hash totals with PersistentPyDicts
+_pydict._frozen_types += (PersistentPyDict,)
+
+_persistent_pydict_empty = PersistentPyDict._from_trie(_hamt_empty, 0, 0)
+
+class PersistentPyDictEvolver(object):
+    """Mutable copy of a PersistentPyDict, for making many changes to it
+    
+    PersistentPyDictEvolver(persistent_pydict) -> new evolver of persistent_pydict
+    
+    Nodes of the trie made by an evolver are changed in place by later 
+    changes, until persistent() is called. persistent() returns a 
+    PersistentPyDict of the evolver's items in O(1) time.
+    """
+    
+    __slots__ = "_root", "_len", "_seq", "_owner", "_order"
+    
+    def __init__(self, persistent_pydict):
+        if not isinstance(persistent_pydict, PersistentPyDict):
+            raise TypeError(f"PersistentPyDictEvolver needs a PersistentPyDict, not {persistent_pydict.__class__.__name__}")
+        self._root = persistent_pydict._root
+        self._len = persistent_pydict._len
+        self._seq = persistent_pydict._seq
+        # Token owning the nodes this evolver made
+        self._owner = object()
+        # Keys in insertion order, while they are unchanged
+        self._order = persistent_pydict._order
+        
+    # Avoid subclassing
+    __init_subclass__ = None
+    
+    def __contains__(self, key):
+        "Return key in self."
+        return _hamt_find(self._root, hash(key) & _MASK64, key) is not None
+    
+    def __delitem__(self, key):
+        "Delete self[key]."
+        root, old = _hamt_dissoc(self._root, 0, hash(key) & _MASK64, key, self._owner)
+        if old is None:
+            raise KeyError(key)
+        self._root = _hamt_root(root, self._owner)
+        self._len -= 1
+        self._order = None
+    
+    def __getitem__(self, key):
+        "Return self[key]."
+        leaf = _hamt_find(self._root, hash(key) & _MASK64, key)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf.value
+    
+    __hash__ = None
+    
+    def __iter__(self):
+        "Return iter(self)"
+        return iter(self.persistent())
+    
+    def __len__(self):
+        "Return len(self)."
+        return self._len
+    
+    def __repr__(self):
+        "Return repr(self)"
+        return f"PersistentPyDictEvolver({self.persistent()!r})"
+    
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        leaf = _HamtLeaf(hash(key) & _MASK64, key, value, self._seq)
+        self._root, old = _hamt_assoc(self._root, 0, leaf, self._owner)
+        if old is None:
+            self._len += 1
+            self._seq += 1
+            self._order = None
+    
+    def delete(self, key):
+        "Delete self[key]. Return self."
+        del self[key]
+        return self
+    
+    def get(self, key, default=None):
+        "Return self[key] if key in self, else default."
+        leaf = _hamt_find(self._root, hash(key) & _MASK64, key)
+        if leaf is None:
+            return default
+        return leaf.value
+    
+    def persistent(self):
+        "Return a PersistentPyDict of self's items."
+        pd = PersistentPyDict._from_trie(self._root, self._len, self._seq)
+        pd._order = self._order
+        # The PersistentPyDict shares my nodes. Stop changing them in place.
+        self._owner = object()
+        return pd
+    
+    def set(self, key, value):
+        "Set self[key] to value. Return self."
+        self[key] = value
+        return self
+    
+    def update(self, mapping_or_iterable=(), /, **kwds):
+        "Update self from a mapping or iterable and keyword arguments. \nSee help(pydict.update)."
+        keysfunc = getattr(mapping_or_iterable, "keys", None)
+        if callable(keysfunc):
+            for key in keysfunc():
+                self[key] = mapping_or_iterable[key]
+        else:
+            for key, value in mapping_or_iterable:
+                self[key] = value
+        for key in kwds:
+            self[key] = kwds[key]
+    
+_collections_abc.MutableMapping.register(PersistentPyDictEvolver)
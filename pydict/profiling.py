@@ -0,0 +1,202 @@
+import sys as _sys
+import time as _time
+
+import pydict as _pydict
+from pydict import pydict, frozenpydict, PyDictView, PyDictIterator, _construct, _marker
+
+##################################
+### Profiling
+##################################
+
+class ProfileStats(object):
+    """Aggregating sink for enable_profiling.
+    
+    ProfileStats() -> sink that sums every event into its counters
+    ProfileStats(callback, interval) -> sink that also calls callback(snapshot)
+        and resets its counters once at least interval seconds have passed
+    
+    Counters:
+    lookups, probes: number of profiled lookups and nodes visited by them
+    stores, store_probes: number of profiled stores and nodes visited by them
+    misses: lookups that fell through to __missing__
+    resizes, resize_time: number of resizes and seconds spent in them
+    iterators: number of iterators created
+    view_scans, view_scan_length: view membership tests and items scanned by them
+    """
+    
+    _counters = (
+        "lookups", "probes", "stores", "store_probes", "misses", 
+        "resizes", "resize_time", "iterators", "view_scans", "view_scan_length"
+    )
+    
+    __slots__ = _counters + ("callback", "interval", "_last_flush", "_flushing")
+    
+    def __init__(self, callback=None, interval=None):
+        self.callback = callback
+        self.interval = interval
+        self._flushing = False
+        self.reset()
+        
+    def __call__(self, event, value):
+        "Record an event reported by the profiler."
+        if event == "lookup":
+            self.lookups += 1
+            self.probes += value
+        elif event == "store":
+            self.stores += 1
+            self.store_probes += value
+        elif event == "missing":
+            self.misses += 1
+        elif event == "resize":
+            self.resizes += 1
+            self.resize_time += value
+        elif event == "iterator":
+            self.iterators += 1
+        elif event == "view_scan":
+            self.view_scans += 1
+            self.view_scan_length += value
+        # Report and restart the aggregate when the interval has passed.
+        # Events caused by the flush itself must not flush again.
+        if self.interval is not None and not self._flushing and \
+           _time.perf_counter() - self._last_flush >= self.interval:
+            self.flush()
+            
+    def __repr__(self):
+        "Return repr(self)"
+        parts = [f"{name}={getattr(self, name)!r}" for name in self._counters]
+        return f"ProfileStats({', '.join(parts)})"
+        
+    def flush(self):
+        "Call the callback (if any) with a snapshot, then reset the counters."
+        self._flushing = True
+        try:
+            snapshot = self.snapshot()
+            self.reset()
+            if self.callback is not None:
+                self.callback(snapshot)
+        finally:
+            self._flushing = False
+        
+    def reset(self):
+        "Set all counters to zero."
+        for name in self._counters:
+            setattr(self, name, 0)
+        self._last_flush = _time.perf_counter()
+        
+    def snapshot(self):
+        "Return a pydict of the current counters."
+        return pydict((name, getattr(self, name)) for name in self._counters)
+    
+
+# The current sink, and the original (uninstrumented) attributes being replaced
+_profile_sink = None
+_unprofiled = {}
+
+def _profiled_getitem(getitem):
+    # Make an instrumented variant of a __getitem__ method.
+    # It counts the nodes visited by the one lookup it makes.
+    def __getitem__(self, key):
+        probes, value = self._probe(key)
+        _profile_sink("lookup", probes)
+        if value is _marker:
+            _profile_sink("missing", 1)
+            if isinstance(self, pydict):
+                return self.__missing__(key)
+            raise KeyError(key)
+        return value
+    __getitem__.__doc__ = getitem.__doc__
+    return __getitem__
+
+def _profiled_setitem(setitem):
+    # Make an instrumented variant of a __setitem__ method
+    def __setitem__(self, key, value):
+        _profile_sink("store", self._probe(key)[0])
+        setitem(self, key, value)
+    __setitem__.__doc__ = setitem.__doc__
+    return __setitem__
+
+def _profiled_resize(resize):
+    # Make an instrumented variant of _resize_pydict
+    def _resize_pydict(pd, size, incremental=False):
+        start = _time.perf_counter()
+        resize(pd, size, incremental)
+        _profile_sink("resize", _time.perf_counter() - start)
+    return _resize_pydict
+
+def _profiled_iterator_new(new):
+    # Make an instrumented variant of PyDictIterator.__new__
+    def __new__(cls, mapping=None, key=None):
+        if key is not _construct:
+            raise TypeError(f"Cannot create {cls.__name__} instances")
+        _profile_sink("iterator", 1)
+        return new(cls, mapping, key)
+    return __new__
+
+def _profiled_view_contains(contains):
+    # Make an instrumented variant of PyDictView.__contains__
+    def __contains__(self, key):
+        _profile_sink("view_scan", len(self))
+        return contains(self, key)
+    __contains__.__doc__ = contains.__doc__
+    return __contains__
+
+def enable_profiling(sink=None):
+    """Start reporting hot path events of the pydict family to sink, and return sink.
+    
+    sink is called as sink(event, value), where (event, value) is one of:
+        ("lookup", nodes visited), ("store", nodes visited), ("missing", 1),
+        ("resize", seconds spent), ("iterator", 1), ("view_scan", items scanned)
+    If sink is not given, it defaults to a new ProfileStats().
+    
+    Profiling works by replacing methods with instrumented variants, so
+    disabled profiling adds no code to any hot path. IntPyDict and
+    SharedKeyPyDict are profiled if their modules are loaded; call
+    enable_profiling again to profile those loaded since.
+    """
+    global _profile_sink
+    if sink is None:
+        sink = ProfileStats()
+    if not callable(sink):
+        raise TypeError("sink must be callable")
+    variants = [
+        (pydict, "__getitem__", _profiled_getitem),
+        (pydict, "__setitem__", _profiled_setitem),
+        (frozenpydict, "__getitem__", _profiled_getitem),
+        (PyDictIterator, "__new__", _profiled_iterator_new),
+        (PyDictView, "__contains__", _profiled_view_contains),
+    ]
+    # Don't import them: IntPyDict's module imports NumPy
+    for module, name in (("pydict.intpydict", "IntPyDict"), ("pydict.sharedkeys", "SharedKeyPyDict")):
+        if module in _sys.modules:
+            cls = getattr(_sys.modules[module], name)
+            variants.append((cls, "__getitem__", _profiled_getitem))
+            variants.append((cls, "__setitem__", _profiled_setitem))
+    # Swap in the instrumented variants, only once
+    for cls, name, make_variant in variants:
+        if (cls, name) in _unprofiled:
+            continue
+        original = cls.__dict__[name]
+        _unprofiled[cls, name] = original
+        if isinstance(original, staticmethod):
+            original = original.__func__
+        variant = make_variant(original)
+        if name == "__new__":
+            variant = staticmethod(variant)
+        setattr(cls, name, variant)
+    if (None, "_resize_pydict") not in _unprofiled:
+        # pydict's methods look _resize_pydict up in the package's globals
+        _unprofiled[None, "_resize_pydict"] = _pydict._resize_pydict
+        _pydict._resize_pydict = _profiled_resize(_pydict._resize_pydict)
+    _profile_sink = sink
+    return sink
+    
+def disable_profiling():
+    "Stop profiling, restoring the uninstrumented methods."
+    global _profile_sink
+    for (cls, name), original in _unprofiled.items():
+        if cls is None:
+            setattr(_pydict, name, original)
+        else:
+            setattr(cls, name, original)
+    _unprofiled.clear()
+    _profile_sink = None
@@ -0,0 +1,261 @@
+from pydict import (pydict, _MIN_SIZE, _TreeBin, _hash_seed, _prime_at_least,
+                    _finish_rehash, _find_nodes, _batch_keys, _batch_result, _marker, _repr_pydicts)
+
+##################################
+### SharedKeyPyDict
+##################################
+
+# Shared key indexes of SharedKeyPyDicts, oldest first: by the keys and
+# their types, and by the id of a key tuple they were made or found for,
+# with that tuple. An index evicted from the caches lives on in the
+# instances using it.
+_shared_keys_cache = {}
+_shared_keys_by_id = {}
+_SHARED_KEYS_CACHE_SIZE = 1024
+
+def _cache(cache, key, value):
+    "Add key: value to a shared key index cache, evicting its oldest entry if it's full."
+    if len(cache) >= _SHARED_KEYS_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+def _shared_keys(keys):
+    """Return (keys, hash table, size, seed) of the shared key index for a key sequence.
+    The nodes of the hash table hold the position of their key as their value."""
+    found = _shared_keys_by_id.get(id(keys))
+    if found is not None and found[0] is keys:
+        # A tuple seen before. Nothing to hash or compare.
+        return found[1]
+    given = keys
+    keys = tuple(keys)
+    # Equal keys of different types, like True and 1, don't share an index,
+    # so that every instance gets the very key objects it was given.
+    typed = keys, tuple(map(type, keys))
+    shared = _shared_keys_cache.get(typed)
+    if shared is None:
+        pd = pydict(zip(keys, range(len(keys))))
+        if len(pd) != len(keys):
+            raise ValueError("keys must not contain duplicates")
+        if pd._rehash is not None:
+            _finish_rehash(pd)
+        shared = keys, tuple(pd._hash_table), pd._size, pd._seed
+        _cache(_shared_keys_cache, typed, shared)
+        _cache(_shared_keys_by_id, id(keys), (keys, shared))
+    if given.__class__ is tuple and given is not shared[0]:
+        # Tuples can't change. Keep it, so its id stays its own.
+        _cache(_shared_keys_by_id, id(given), (given, shared))
+    return shared
+
+class SharedKeyPyDict(pydict):
+    """pydict which shares its keys with other SharedKeyPyDicts that have the same keys
+    
+    SharedKeyPyDict.fromvalues(keys, values) -> new SharedKeyPyDict p, where p[keys[i]] = values[i]
+    SharedKeyPyDict(...) -> new SharedKeyPyDict. See help(pydict) for the signature.
+    
+    Instances with the same key sequence share one immutable key index (a
+    split table), and each stores only a list of values. This makes records
+    with a common set of keys small and cheap to create.
+    An instance converts itself to an independent table, like a pydict's,
+    when a key is added, deleted or moved.
+    """
+    
+    __slots__ = ("_values",)
+    
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        if not kwds:
+            if isinstance(mapping_or_iterable, SharedKeyPyDict) and mapping_or_iterable._values is not None:
+                # Share its keys. Nothing to hash.
+                return cls.fromvalues(mapping_or_iterable._keys, mapping_or_iterable._values)
+            keysfunc = getattr(mapping_or_iterable, "keys", None)
+            if callable(keysfunc):
+                # A mapping's keys are distinct: look up their index straight away
+                keys = tuple(keysfunc())
+                if mapping_or_iterable.__class__ is dict:
+                    values = list(mapping_or_iterable.values())
+                else:
+                    values = [mapping_or_iterable[key] for key in keys]
+                return cls.fromvalues(keys, values)
+        # Build the items with a plain pydict, dropping repeated keys, then share its keys
+        pd = pydict(mapping_or_iterable, **kwds)
+        return cls.fromvalues(pd._keys, [pd[key] for key in pd._keys])
+    
+    @classmethod
+    def fromvalues(cls, keys, values):
+        """
+        Create and return a new SharedKeyPyDict, p, of type cls.
+        For every i, p[keys[i]] = values[i].
+        Every SharedKeyPyDict created with equal keys of the same types
+        shares their index. If keys is the key_layout of a SharedKeyPyDict,
+        or a tuple given before, no key is hashed or compared.
+        """
+        keys, table, size, seed = _shared_keys(keys)
+        values = list(values)
+        if len(values) != len(keys):
+            raise ValueError(f"{len(keys)} keys but {len(values)} values")
+        self = object.__new__(cls)
+        self._keys, self._hash_table, self._size, self._seed = keys, table, size, seed
+        self._values = values
+        self._used = len(keys)
+        self._resizes = self._first = 0
+        self._rehash = self._cow = self._journal = None
+        return self
+    
+    def _combine(self):
+        "Convert self from a split table to an independent table."
+        keys, values = self._keys, self._values
+        self._values = None
+        self._keys = []
+        self._used = self._first = 0
+        self._seed = _hash_seed
+        # Make room for every key up front
+        self._size = _prime_at_least(max(_MIN_SIZE, len(keys) * 3 // 2 + 1))
+        self._hash_table = [None] * self._size
+        for key, value in zip(keys, values):
+            pydict.__setitem__(self, key, value)
+            
+    def __contains__(self, key):
+        "Return key in self."
+        if self._values is None:
+            return pydict.__contains__(self, key)
+        return pydict._find_node(self, key) is not None
+    
+    def __delitem__(self, key):
+        "Delete self[key]."
+        if self._values is not None:
+            if pydict._find_node(self, key) is None:
+                raise KeyError(key)
+            self._combine()
+        pydict.__delitem__(self, key)
+        
+    def __getitem__(self, key):
+        "Return self[key]."
+        values = self._values
+        if values is None:
+            return pydict.__getitem__(self, key)
+        # Find the key's node in the shared index. Its value is the key's position.
+        h = hash(key)
+        node = first = self._hash_table[(h ^ self._seed) % self._size]
+        while node is not None:
+            if node.hashcode == h and (node.key is key or node.key == key):
+                return values[node.value]
+            node = node.overflow
+        if first.__class__ is _TreeBin:
+            node = first.find(h, key)
+            if node is not None:
+                return values[node.value]
+        return self.__missing__(key)
+    
+    def _probe(self, key):
+        "Return (number of nodes visited looking up key, self[key], or _marker if key isn't found)."
+        probes, value = pydict._probe(self, key)
+        # The shared index holds positions in the values
+        if self._values is not None and value is not _marker:
+            value = self._values[value]
+        return probes, value
+    
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "SharedKeyPyDict({...})"
+        return "SharedKeyPyDict(" + pydict.__repr__(self)[len("pydict("):]
+    
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        values = self._values
+        if values is not None:
+            node = pydict._find_node(self, key)
+            if node is not None:
+                values[node.value] = value
+                return
+            # A new key. Stop sharing keys.
+            self._combine()
+        pydict.__setitem__(self, key, value)
+        
+    def __sizeof__(self):
+        "Size of object in memory, in bytes. \nA shared key index belongs to no instance, and isn't counted."
+        if self._values is None:
+            return pydict.__sizeof__(self)
+        return object.__sizeof__(self) + self._values.__sizeof__()
+    
+    def clear(self):
+        "Remove all items from self."
+        self._values = None
+        self._hash_table = [None] * _MIN_SIZE
+        self._seed = _hash_seed
+        pydict.clear(self)
+        
+    def contains_many(self, keys):
+        "Return [key in self for key in keys], looking up all the keys in one loop. \nSee help(pydict.contains_many)."
+        keys, as_array = _batch_keys(keys)
+        nodes = _find_nodes(self._hash_table, self._size, self._seed, keys, self._rehash)
+        return _batch_result([node is not None for node in nodes], as_array)
+    
+    def copy(self):
+        "Return a shallow copy of self. \nA copy of a split table shares its keys."
+        if self._values is None:
+            return pydict.copy(self)
+        pd = object.__new__(self.__class__)
+        pd._keys, pd._hash_table, pd._size, pd._seed = \
+            self._keys, self._hash_table, self._size, self._seed
+        pd._values = self._values[:]
+        pd._used = self._used
+        pd._resizes = pd._first = 0
+        pd._rehash = pd._cow = pd._journal = None
+        return pd
+    
+    def get_many(self, keys, default=None):
+        "Return [self.get(key, default) for key in keys], looking up all the keys in one loop. \nSee help(pydict.get_many)."
+        values = self._values
+        if values is None:
+            return pydict.get_many(self, keys, default)
+        keys, as_array = _batch_keys(keys)
+        nodes = _find_nodes(self._hash_table, self._size, self._seed, keys)
+        return _batch_result([default if node is None else values[node.value] for node in nodes], as_array)
+    
+    def move_to_end(self, key, last=True):
+        """Move a key to the back of the pydict.
+        If last is False, move the key to the front of the pydict instead.
+        Raises KeyError if key not in the pydict.
+        """
+        if self._values is not None:
+            if pydict._find_node(self, key) is None:
+                raise KeyError("Key not in pydict")
+            self._combine()
+        pydict.move_to_end(self, key, last)
+    
+    def popitem(self, last=True):
+        """Removes a key, return a 2-tuple: (the key, its associated value).
+        Removes last key if last is True, otherwise first key.
+        Raises KeyError if pydict is empty."""
+        if self._values is not None and self._used:
+            self._combine()
+        return pydict.popitem(self, last)
+    
+    def set_many(self, keys, values):
+        "For every i, set self[keys[i]] to values[i], looking up all the keys in one loop. \nSee help(pydict.set_many)."
+        own_values = self._values
+        if own_values is not None:
+            keys = _batch_keys(keys)[0]
+            values = _batch_keys(values)[0]
+            nodes = _find_nodes(self._hash_table, self._size, self._seed, keys)
+            if None in nodes:
+                # A new key. Stop sharing keys.
+                self._combine()
+            elif len(keys) != len(values):
+                raise ValueError(f"{len(keys)} keys but {len(values)} values")
+            else:
+                for value, node in zip(values, nodes):
+                    own_values[node.value] = value
+                return
+        pydict.set_many(self, keys, values)
+    
+    @property
+    def key_layout(self):
+        """The tuple of keys whose index self shares, or None if self doesn't share keys.
+        fromvalues(p.key_layout, values) makes a SharedKeyPyDict sharing it, without hashing."""
+        return self._keys if self._values is not None else None
+    
+    @property
+    def shares_keys(self):
+        "Whether self is a split table, sharing its keys with other SharedKeyPyDicts."
+        return self._values is not None
@@ -0,0 +1,332 @@
+import bisect as _bisect
+
+from pydict import pydict, _marker, _repr_pydicts
+
+##################################
+### SortedPyDict
+##################################
+
+# Sorted sublists of a SortedPyDict's index are split once they are twice
+# this long, and merged with a neighbour once they are half this long.
+_SORTED_LOAD = 1000
+
+class _SortedPyDictKeys(object):
+    "Keys list of a SortedPyDict, in sorted order, as seen by its views and iterators."
+    # _list and _start cache the last sublist read, and the position of its first key,
+    # so that reading the keys one after another doesn't search the index every time.
+    __slots__ = ("_mapping", "_list", "_start")
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+        self._list = None
+        self._start = 0
+
+    def __getitem__(self, i):
+        mapping = self._mapping
+        if i < 0:
+            i += len(mapping._table)
+        lst, start = self._list, self._start
+        if lst is not None and start <= i < start + len(lst):
+            return lst[i - start]
+        if not 0 <= i < len(mapping._table):
+            raise IndexError("SortedPyDict index out of range")
+        j, offset = mapping._locate(i)
+        lst = self._list = mapping._lists[j]
+        self._start = i - offset
+        return lst[offset]
+
+    def __len__(self):
+        return len(self._mapping._table)
+
+    def __sizeof__(self):
+        return object.__sizeof__(self)
+
+class SortedPyDict(pydict):
+    """pydict which keeps its keys in sorted order
+
+    SortedPyDict(...) -> new SortedPyDict. See help(pydict) for the signature.
+
+    Lookups go through a hash table, as in a pydict, while a sorted index of
+    the keys (a list of sorted sublists) gives iteration in key order, and
+    range queries in O(log n): irange(), bisect_left(), bisect_right(),
+    peekitem(), floor() and ceiling(). Keys must be comparable with each other.
+    popitem() removes the greatest (or least) key. Keys can't be moved.
+    """
+
+    __slots__ = ("_table", "_lists", "_maxes", "_tree")
+
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        # Get a raw pydict
+        self = pydict.__new__(cls)
+        # The node hash table is unused: _table holds the items, and
+        # _keys is a view of the sorted index for iterators.
+        self._hash_table = None
+        self._keys = _SortedPyDictKeys(self)
+        # _lists are the sorted sublists of the index, _maxes their last keys,
+        # and _tree a Fenwick tree of their lengths, to find positions.
+        self._table = pydict(mapping_or_iterable, **kwds)
+        self._build(sorted(self._table))
+        return self
+
+    def _build(self, keys):
+        "Make the index from a sorted list of keys."
+        self._lists = [keys[i:i + _SORTED_LOAD] for i in range(0, len(keys), _SORTED_LOAD)]
+        self._maxes = [lst[-1] for lst in self._lists]
+        self._build_tree()
+
+    def _build_tree(self):
+        "Make the Fenwick tree of the sublists' lengths."
+        tree = [0]
+        tree.extend(map(len, self._lists))
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._keys._list = None
+
+    def _grow(self, j, delta):
+        "Add delta to the length of sublist j in the Fenwick tree."
+        tree = self._tree
+        size = len(tree)
+        j += 1
+        while j < size:
+            tree[j] += delta
+            j += j & -j
+        self._keys._list = None
+
+    def _offset(self, j):
+        "Return the number of keys in the sublists before sublist j."
+        tree = self._tree
+        total = 0
+        while j:
+            total += tree[j]
+            j &= j - 1
+        return total
+
+    def _locate(self, i):
+        "Return (sublist, position in the sublist) of the key at position i of the index."
+        tree = self._tree
+        size = len(tree)
+        j = 0
+        bit = 1 << (size - 1).bit_length() >> 1
+        while bit:
+            k = j + bit
+            if k < size and tree[k] <= i:
+                j = k
+                i -= tree[k]
+            bit >>= 1
+        return j, i
+
+    def _insert_key(self, key):
+        "Insert a key which isn't in self into the index."
+        lists, maxes = self._lists, self._maxes
+        if not maxes:
+            lists.append([key])
+            maxes.append(key)
+            self._build_tree()
+            return
+        j = _bisect.bisect_left(maxes, key)
+        if j == len(maxes):
+            # The greatest key yet goes at the end of the last sublist
+            j -= 1
+            lst = lists[j]
+            lst.append(key)
+            maxes[j] = key
+        else:
+            lst = lists[j]
+            _bisect.insort(lst, key)
+        if len(lst) > 2 * _SORTED_LOAD:
+            # Split the sublist in half
+            lists.insert(j + 1, lst[_SORTED_LOAD:])
+            del lst[_SORTED_LOAD:]
+            maxes[j] = lst[-1]
+            maxes.insert(j + 1, lists[j + 1][-1])
+            self._build_tree()
+        else:
+            self._grow(j, 1)
+
+    def _remove_key(self, key):
+        "Remove a key of self from the index."
+        lists, maxes = self._lists, self._maxes
+        j = _bisect.bisect_left(maxes, key)
+        lst = lists[j]
+        del lst[_bisect.bisect_left(lst, key)]
+        if not lst:
+            del lists[j], maxes[j]
+            self._build_tree()
+        elif len(lst) * 2 < _SORTED_LOAD and len(lists) > 1:
+            # Merge the sublist with a neighbour, and split the result if it's too long
+            if j == 0:
+                j = 1
+            lst = lists[j - 1]
+            lst.extend(lists[j])
+            del lists[j], maxes[j]
+            if len(lst) > 2 * _SORTED_LOAD:
+                half = len(lst) // 2
+                lists.insert(j, lst[half:])
+                del lst[half:]
+                maxes.insert(j, lists[j][-1])
+            maxes[j - 1] = lst[-1]
+            self._build_tree()
+        else:
+            maxes[j] = lst[-1]
+            self._grow(j, -1)
+
+    def __contains__(self, key):
+        "Return key in self."
+        return key in self._table
+
+    def __delitem__(self, key):
+        "Delete self[key]."
+        del self._table[key]
+        self._remove_key(key)
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        node = self._table._find_node(key)
+        if node is None:
+            return self.__missing__(key)
+        return node.value
+
+    def __len__(self):
+        "Return len(self)."
+        return len(self._table)
+
+    def __repr__(self):
+        "Return repr(self)"
+        if id(self) in _repr_pydicts:
+            return "SortedPyDict({...})"
+        return "SortedPyDict(" + pydict.__repr__(self)[len("pydict("):]
+
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        table = self._table
+        if key not in table:
+            # Index the key first: if it can't be compared, self is unchanged
+            self._insert_key(key)
+        table[key] = value
+
+    def __sizeof__(self):
+        "Size of object in memory, in bytes."
+        return object.__sizeof__(self) + self._table.__sizeof__() + self._index_sizeof()
+
+    def _index_sizeof(self):
+        "Return the size of the index in memory, in bytes."
+        size = self._lists.__sizeof__() + self._maxes.__sizeof__() + self._tree.__sizeof__()
+        return size + sum(lst.__sizeof__() for lst in self._lists)
+
+    def bisect_left(self, key):
+        "Return the position in self's keys where key would be inserted, before any equal key."
+        maxes = self._maxes
+        j = _bisect.bisect_left(maxes, key)
+        if j == len(maxes):
+            return len(self._table)
+        return self._offset(j) + _bisect.bisect_left(self._lists[j], key)
+
+    def bisect_right(self, key):
+        "Return the position in self's keys where key would be inserted, after any equal key."
+        maxes = self._maxes
+        j = _bisect.bisect_right(maxes, key)
+        if j == len(maxes):
+            return len(self._table)
+        return self._offset(j) + _bisect.bisect_right(self._lists[j], key)
+
+    def ceiling(self, key, default=_marker):
+        """Return the least key of self >= key.
+        If there is none, return default if given, otherwise raise KeyError."""
+        i = self.bisect_left(key)
+        if i == len(self._table):
+            if default is _marker:
+                raise KeyError(key)
+            return default
+        return self._keys[i]
+
+    def clear(self):
+        "Remove all items from self."
+        self._table.clear()
+        self._build([])
+
+    def contains_many(self, keys):
+        """Return [key in self for key in keys], looking up all the keys in one loop.
+        If keys is a NumPy array, return a NumPy array of bools instead."""
+        return self._table.contains_many(keys)
+
+    def copy(self):
+        "Return a shallow copy of self."
+        # Copy the index, without comparing any key again
+        pd = self.__class__()
+        pd._table = self._table.copy()
+        pd._lists = [lst[:] for lst in self._lists]
+        pd._maxes = self._maxes[:]
+        pd._tree = self._tree[:]
+        return pd
+
+    def floor(self, key, default=_marker):
+        """Return the greatest key of self <= key.
+        If there is none, return default if given, otherwise raise KeyError."""
+        i = self.bisect_right(key)
+        if i == 0:
+            if default is _marker:
+                raise KeyError(key)
+            return default
+        return self._keys[i - 1]
+
+    def get_many(self, keys, default=None):
+        """Return [self.get(key, default) for key in keys], looking up all the keys in one loop.
+        If keys is a NumPy array, return a NumPy array instead."""
+        return self._table.get_many(keys, default)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """Return an iterator over the keys of self from lo to hi, in sorted order.
+        lo and hi default to no bound. inclusive is a pair of bools: whether
+        keys equal to lo and hi are included. If reverse is True, the keys
+        are iterated over from hi down to lo instead."""
+        if lo is None:
+            start = 0
+        else:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        if hi is None:
+            stop = len(self._table)
+        else:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        return self._iter_positions(start, stop, reverse)
+
+    def _iter_positions(self, start, stop, reverse):
+        "Yield the keys of self at positions start to stop - 1 of the index."
+        length = len(self._table)
+        keys = self._keys
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for i in positions:
+            if len(self._table) != length:
+                raise RuntimeError("SortedPyDict changed size during iteration")
+            yield keys[i]
+
+    def move_to_end(self, key, last=True):
+        "SortedPyDict keys are kept in sorted order, and can't be moved."
+        raise TypeError("SortedPyDict keys are kept in sorted order, and can't be moved")
+
+    def peekitem(self, i=-1):
+        """Return the (key, value) pair at position i of self's keys, in sorted order.
+        Raises IndexError if i is out of range."""
+        key = self._keys[i]
+        return key, self._table[key]
+
+    def popitem(self, last=True):
+        """Removes a key, return a 2-tuple: (the key, its associated value).
+        Removes the greatest key if last is True, otherwise the least key.
+        Raises KeyError if self is empty."""
+        if not self._table:
+            raise KeyError("SortedPyDict is empty.")
+        key = self._lists[-1][-1] if last else self._lists[0][0]
+        value = self._table.pop(key)
+        self._remove_key(key)
+        return key, value
+
+    def stats(self):
+        """Return a pydict of statistics about self's hash table. See pydict.stats.
+        The index counts as memory of the order."""
+        stats = self._table.stats()
+        stats["memory"]["order"] = self._index_sizeof()
+        return stats
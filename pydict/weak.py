@@ -0,0 +1,337 @@
+import weakref as _weakref
+
+from pydict import (pydict, PyDictKeyView, PyDictValueView, PyDictItemView, PyDictIterator,
+                    _deleted, _construct, _repr_pydicts)
+
+##################################
+### Weak pydicts
+##################################
+
+class _WeakPyDict(pydict):
+    """Base class of WeakKeyPyDict and WeakValuePyDict.
+
+    Entries hold weak references. When a referent dies, the weakref's callback
+    only queues the reference in _pending; the queued entries are removed all
+    at once by the next mutation. Until then, lookups and iteration skip them.
+    """
+
+    __slots__ = ("_pending", "_remove", "__weakref__")
+
+    def __new__(cls, mapping_or_iterable=(), /, **kwds):
+        self = pydict.__new__(cls)
+        self._pending = []
+        # The callback of every weakref self makes. It refers to self weakly,
+        # so that self's weakrefs don't keep self alive.
+        def _remove(ref, selfref=_weakref.ref(self)):
+            self = selfref()
+            if self is not None:
+                self._pending.append(ref)
+        self._remove = _remove
+        self.update(mapping_or_iterable, **kwds)
+        return self
+
+    def _purge(self):
+        "Remove the entries queued by weakref callbacks."
+        pending = self._pending
+        if pending:
+            # Callbacks run by the removals queue on a new list
+            self._pending = []
+            for ref in pending:
+                self._remove_dead(ref)
+
+    def __iter__(self):
+        "Return iter(self)"
+        return WeakPyDictKeyIterator(self, _construct)
+
+    def __len__(self):
+        "Return len(self)."
+        # Every queued entry is still in the hash table
+        return self._used - len(self._pending)
+
+    def __repr__(self):
+        "Return repr(self)"
+        name = self.__class__.__name__
+        if id(self) in _repr_pydicts:
+            return name + "({...})"
+        return name + "(" + pydict.__repr__(self)[len("pydict("):]
+
+    def __reversed__(self):
+        "Return reversed(self)."
+        return WeakPyDictReverseKeyIterator(self, _construct)
+
+    def clear(self):
+        "Remove all items from self."
+        pydict.clear(self)
+        self._pending = []
+
+    def items(self):
+        "Return a view of self's items."
+        return WeakPyDictItemView(self, _construct)
+
+    def keys(self):
+        "Return a view for self's keys."
+        return WeakPyDictKeyView(self, _construct)
+
+    def popitem(self, last=True):
+        """Removes a key, return a 2-tuple: (the key, its associated value).
+        Removes last key if last is True, otherwise first key.
+        Raises KeyError if self is empty."""
+        self._purge()
+        items = self.items()
+        try:
+            # Holding the item keeps both its key and value alive
+            key, value = next(reversed(items) if last else iter(items))
+        except StopIteration:
+            raise KeyError(f"{self.__class__.__name__} is empty.") from None
+        del self[key]
+        return key, value
+
+    def values(self):
+        "Return a view of self's values."
+        return WeakPyDictValueView(self, _construct)
+
+class WeakKeyPyDict(_WeakPyDict):
+    """pydict which refers to its keys weakly
+
+    WeakKeyPyDict(...) -> new WeakKeyPyDict. See help(pydict) for the signature.
+
+    An entry disappears once nothing else refers to its key, which makes it
+    suitable for caching data about objects owned by other code. Keys must
+    be hashable and weakly referenceable. Entries whose key died are removed
+    in one batch by the next change to the WeakKeyPyDict.
+    """
+
+    __slots__ = ()
+
+    def _live_item(self, ref):
+        "Return (key, value) of an entry, given its key's weakref, or _deleted if the key died."
+        key = ref()
+        if key is None:
+            return _deleted
+        return key, pydict._find_node(self, ref).value
+
+    def _live_key(self, ref):
+        "Return the key of an entry, given its weakref, or _deleted if it died."
+        key = ref()
+        return _deleted if key is None else key
+
+    def _remove_dead(self, ref):
+        "Remove the entry of a dead key's weakref."
+        # A dead weakref keeps its hash code, and only equals itself
+        try:
+            pydict.__delitem__(self, ref)
+        except KeyError:
+            pass
+
+    def __contains__(self, key):
+        "Return key in self."
+        try:
+            ref = _weakref.ref(key)
+        except TypeError:
+            return False
+        return pydict.__contains__(self, ref)
+
+    def __delitem__(self, key):
+        "Delete self[key]."
+        self._purge()
+        try:
+            pydict.__delitem__(self, _weakref.ref(key))
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        node = pydict._find_node(self, _weakref.ref(key))
+        if node is None:
+            return self.__missing__(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        self._purge()
+        pydict.__setitem__(self, _weakref.ref(key, self._remove), value)
+
+    def move_to_end(self, key, last=True):
+        """Move a key to the back of self.
+        If last is False, move the key to the front of self instead.
+        Raises KeyError if key not in self.
+        """
+        self._purge()
+        pydict.move_to_end(self, _weakref.ref(key), last)
+
+class WeakValuePyDict(_WeakPyDict):
+    """pydict which refers to its values weakly
+
+    WeakValuePyDict(...) -> new WeakValuePyDict. See help(pydict) for the signature.
+
+    An entry disappears once nothing else refers to its value. Values must
+    be weakly referenceable. Entries whose value died are removed in one
+    batch by the next change to the WeakValuePyDict.
+    """
+
+    __slots__ = ()
+
+    def _live_item(self, key):
+        "Return (key, value) of an entry, or _deleted if its value died."
+        value = pydict._find_node(self, key).value()
+        if value is None:
+            return _deleted
+        return key, value
+
+    def _live_key(self, key):
+        "Return the key of an entry, or _deleted if its value died."
+        if pydict._find_node(self, key).value() is None:
+            return _deleted
+        return key
+
+    def _remove_dead(self, ref):
+        "Remove the entry of a dead value's weakref."
+        # The key may have been given a new value since
+        node = pydict._find_node(self, ref.key)
+        if node is not None and node.value is ref:
+            pydict.__delitem__(self, ref.key)
+
+    def __contains__(self, key):
+        "Return key in self."
+        node = pydict._find_node(self, key)
+        return node is not None and node.value() is not None
+
+    def __delitem__(self, key):
+        "Delete self[key]."
+        self._purge()
+        pydict.__delitem__(self, key)
+
+    def __getitem__(self, key):
+        "Return self[key]."
+        node = pydict._find_node(self, key)
+        if node is not None:
+            value = node.value()
+            if value is not None:
+                return value
+        return self.__missing__(key)
+
+    def __setitem__(self, key, value):
+        "Set self[key] to value."
+        self._purge()
+        pydict.__setitem__(self, key, _weakref.KeyedRef(value, self._remove, key))
+
+    def move_to_end(self, key, last=True):
+        """Move a key to the back of self.
+        If last is False, move the key to the front of self instead.
+        Raises KeyError if key not in self.
+        """
+        self._purge()
+        pydict.move_to_end(self, key, last)
+
+####################################################
+### views and iterators
+####################################################
+
+class WeakPyDictKeyView(PyDictKeyView):
+    "View for the keys of a WeakKeyPyDict/WeakValuePyDict"
+    def __iter__(self):
+        return WeakPyDictKeyIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return WeakPyDictReverseKeyIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class WeakPyDictValueView(PyDictValueView):
+    "View for the values of a WeakKeyPyDict/WeakValuePyDict"
+    def __iter__(self):
+        return WeakPyDictValueIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return WeakPyDictReverseValueIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class WeakPyDictItemView(PyDictItemView):
+    "View for the items of a WeakKeyPyDict/WeakValuePyDict"
+    def __iter__(self):
+        return WeakPyDictItemIterator(self._mapping, _construct)
+
+    def __reversed__(self):
+        return WeakPyDictReverseItemIterator(self._mapping, _construct)
+
+    __slots__ = ()
+
+class WeakPyDictIterator(PyDictIterator):
+    "Base class for iterators of WeakKeyPyDicts and WeakValuePyDicts"
+
+    # 1 for forward iterators, -1 for reverse iterators
+    _step = 1
+
+    def __new__(cls, mapping=None, key=None):
+        self = PyDictIterator.__new__(cls, mapping, key)
+        # Referents dying leaves the hash table as it is. Only count changes to it.
+        self._length = mapping._used
+        self._count = mapping._first - 1 if cls._step > 0 else 0
+        return self
+
+    def _next_entry(self, live):
+        """Return live(key) for the next key of the mapping where it isn't _deleted.
+        Raise IndexError if there is none."""
+        mapping = self._mapping
+        if mapping._used != self._length:
+            raise RuntimeError("iterable changed size during iteration")
+        keys = mapping._keys
+        step = self._step
+        while True:
+            self._count += step
+            key = keys[self._count]
+            if key is not _deleted:
+                entry = live(key)
+                if entry is not _deleted:
+                    return entry
+
+    __slots__ = ()
+
+class WeakPyDictKeyIterator(WeakPyDictIterator):
+    "Iterator for the keys of a WeakKeyPyDict/WeakValuePyDict"
+    def __next__(self):
+        try:
+            return self._next_entry(self._mapping._live_key)
+        except IndexError:
+            pass
+        raise StopIteration
+
+    __slots__ = ()
+
+class WeakPyDictValueIterator(WeakPyDictIterator):
+    "Iterator for the values of a WeakKeyPyDict/WeakValuePyDict"
+    def __next__(self):
+        try:
+            return self._next_entry(self._mapping._live_item)[1]
+        except IndexError:
+            pass
+        raise StopIteration
+
+    __slots__ = ()
+
+class WeakPyDictItemIterator(WeakPyDictIterator):
+    "Iterator for the items of a WeakKeyPyDict/WeakValuePyDict"
+    def __next__(self):
+        try:
+            return self._next_entry(self._mapping._live_item)
+        except IndexError:
+            pass
+        raise StopIteration
+
+    __slots__ = ()
+
+class WeakPyDictReverseKeyIterator(WeakPyDictKeyIterator):
+    "Reverse iterator for the keys of a WeakKeyPyDict/WeakValuePyDict"
+    _step = -1
+    __slots__ = ()
+
+class WeakPyDictReverseValueIterator(WeakPyDictValueIterator):
+    "Reverse iterator for the values of a WeakKeyPyDict/WeakValuePyDict"
+    _step = -1
+    __slots__ = ()
+
+class WeakPyDictReverseItemIterator(WeakPyDictItemIterator):
+    "Reverse iterator for the items of a WeakKeyPyDict/WeakValuePyDict"
+    _step = -1
+    __slots__ = ()
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from pydict import AsyncLoadingPyDict
+from pydict import asyncloading
+
+
+class Loader(object):
+    "Coroutine function recording its calls, which waits until released"
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = fail
+        # Events bind to the running loop when first waited on
+        self.release = asyncio.Event()
+
+    async def __call__(self, key):
+        self.calls.append(key)
+        await self.release.wait()
+        if key in self.fail:
+            raise LookupError(key)
+        return key * 2
+
+
+def test_concurrent_misses_share_one_load():
+    async def main():
+        loader = Loader()
+        d = AsyncLoadingPyDict(loader)
+        waiters = [asyncio.ensure_future(d.get_or_load(3)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert d.loading() == [3]
+        loader.release.set()
+        assert await asyncio.gather(*waiters) == [6] * 5
+        assert loader.calls == [3] and d == {3: 6} and d.loading() == []
+        assert await d.get_or_load(3) == 6 and loader.calls == [3]
+    asyncio.run(main())
+
+
+def test_cancelling_a_waiter_keeps_the_load():
+    async def main():
+        loader = Loader()
+        d = AsyncLoadingPyDict(loader)
+        first = asyncio.ensure_future(d.get_or_load(1))
+        second = asyncio.ensure_future(d.get_or_load(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        loader.release.set()
+        assert await second == 2
+        assert first.cancelled() and d[1] == 2
+    asyncio.run(main())
+
+
+def test_getitem_doesnt_load():
+    d = AsyncLoadingPyDict(Loader(), {1: "one"})
+    assert d[1] == "one"
+    with pytest.raises(KeyError):
+        d[2]
+    assert repr(d).startswith("AsyncLoadingPyDict(")
+
+
+def test_failures_are_cached_for_their_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(asyncloading._time, "monotonic", lambda: now[0])
+
+    async def main():
+        loader = Loader(fail=(1,))
+        loader.release.set()
+        d = AsyncLoadingPyDict(loader, failure_ttl=5)
+        for i in range(2):
+            with pytest.raises(LookupError):
+                await d.get_or_load(1)
+        assert loader.calls == [1]
+        now[0] += 5
+        with pytest.raises(LookupError):
+            await d.get_or_load(1)
+        assert loader.calls == [1, 1]
+        d.clear()
+        loader.fail = ()
+        assert await d.get_or_load(1) == 2
+    asyncio.run(main())
+
+
+def test_cached_failures_dont_grow_their_traceback():
+    def depth(exc):
+        tb, n = exc.__traceback__, 0
+        while tb is not None:
+            tb, n = tb.tb_next, n + 1
+        return n
+
+    async def main():
+        loader = Loader(fail=(1,))
+        loader.release.set()
+        d = AsyncLoadingPyDict(loader, failure_ttl=60)
+        depths = []
+        for i in range(4):
+            with pytest.raises(LookupError) as info:
+                await d.get_or_load(1)
+            depths.append(depth(info.value))
+        assert loader.calls == [1]
+        assert depths[1] == depths[2] == depths[3]
+    asyncio.run(main())
+
+
+def test_set_or_delete_during_a_load_wins():
+    async def main():
+        loader = Loader()
+        d = AsyncLoadingPyDict(loader)
+        first = asyncio.ensure_future(d.get_or_load(1))
+        second = asyncio.ensure_future(d.get_or_load(2))
+        await asyncio.sleep(0)
+        d[1] = "set"
+        d[2] = "gone"
+        del d[2]
+        assert d.loading() == []
+        loader.release.set()
+        assert await first == "set" and await second == 4
+        assert d == {1: "set"}
+    asyncio.run(main())
+
+
+def test_clear_during_a_load_drops_its_result():
+    async def main():
+        loader = Loader(fail=(2,))
+        d = AsyncLoadingPyDict(loader, failure_ttl=60)
+        loads = asyncio.ensure_future(d.load_many([1, 2]))
+        await asyncio.sleep(0)
+        d.clear()
+        assert d.loading() == []
+        loader.release.set()
+        with pytest.raises(LookupError):
+            await loads
+        await asyncio.sleep(0)
+        assert d == {} and d._failures == {}
+        loader.fail = ()
+        assert await d.get_or_load(2) == 4 and d == {2: 4}
+    asyncio.run(main())
+
+
+def test_load_many_with_a_batch_loader():
+    batches = []
+
+    async def batch_loader(keys):
+        batches.append(keys)
+        return {key: -key for key in keys if key != 4}
+
+    async def main():
+        d = AsyncLoadingPyDict(Loader(), {1: "one"}, batch_loader=batch_loader)
+        assert await d.load_many([1, 2, 3, 2]) == ["one", -2, -3, -2]
+        assert batches == [[2, 3]]
+        with pytest.raises(KeyError):
+            await d.load_many([4, 5])
+        assert 5 in d and 4 not in d
+    asyncio.run(main())
+
+
+def test_load_many_without_a_batch_loader():
+    async def main():
+        loader = Loader()
+        d = AsyncLoadingPyDict(loader)
+        pending = asyncio.ensure_future(d.load_many([1, 2, 1]))
+        await asyncio.sleep(0)
+        loader.release.set()
+        assert await pending == [2, 4, 2]
+        assert sorted(loader.calls) == [1, 2]
+        c = d.copy()
+        assert c.loader is loader and c == d and c.loading() == []
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict, defaultpydict, OrderedPyDict
+
+MAKERS = [
+    PyDict,
+    frozenpydict,
+    OrderedPyDict,
+    lambda items: defaultpydict(list, items),
+    lambda items: pydict.SharedKeyPyDict(items),
+    lambda items: pydict.IntPyDict(items),
+    lambda items: pydict.SortedPyDict(items),
+]
+
+
+@pytest.mark.parametrize("make", MAKERS)
+def test_get_and_contains_many(make):
+    d = make({1: 10, 2: 20, 3: 30})
+    keys = [3, 4, 1, 1]
+    assert d.get_many(keys) == [30, None, 10, 10]
+    assert d.get_many(iter(keys), -1) == [30, -1, 10, 10]
+    assert d.contains_many(tuple(keys)) == [True, False, True, True]
+    assert d.get_many([]) == [] and d.contains_many([]) == []
+
+
+@pytest.mark.parametrize("make", [PyDict, OrderedPyDict, lambda items: pydict.SharedKeyPyDict(items),
+                                  lambda items: pydict.IntPyDict(items)])
+def test_set_many(make):
+    d = make({1: 10, 2: 20})
+    expected = dict(d)
+    keys, values = [2, 5, 6, 5], [21, 50, 60, 51]
+    d.set_many(keys, values)
+    expected.update(zip(keys, values))
+    assert list(d.items()) == list(expected.items())
+    with pytest.raises(ValueError):
+        d.set_many([1, 2], [1])
+
+
+def test_set_many_grows_once_and_keeps_order():
+    d = PyDict()
+    d.set_many(range(1000), range(1000, 2000))
+    assert list(d.items()) == list(zip(range(1000), range(1000, 2000)))
+    assert d.stats()["resizes"] <= 1
+
+
+def test_batches_during_an_incremental_resize():
+    d = PyDict.fromkeys(range(5000), 0)
+    assert d._rehash is not None
+    assert d.contains_many([0, 4999, 5000]) == [True, True, False]
+    assert d.get_many(range(5000)) == [0] * 5000
+    d.set_many([0, 4999, 5000], [1, 2, 3])
+    assert (d[0], d[4999], d[5000]) == (1, 2, 3)
+
+
+def test_subclasses_look_keys_up_their_own_way():
+    class Upper(PyDict):
+        def __getitem__(self, key):
+            return PyDict.__getitem__(self, key.upper())
+
+        def __contains__(self, key):
+            return PyDict.__contains__(self, key.upper())
+
+        def __setitem__(self, key, value):
+            PyDict.__setitem__(self, key.upper(), value)
+
+    d = Upper()
+    d.set_many(["a", "b"], [1, 2])
+    assert list(d) == ["A", "B"]
+    assert d.get_many(["a", "c"]) == [1, None]
+    assert d.contains_many(["b", "c"]) == [True, False]
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    d = PyDict({1: 1.5, 2: 2.5})
+    keys = np.array([2, 3])
+    assert d.get_many(keys, 0.0).tolist() == [2.5, 0.0]
+    assert d.contains_many(keys).dtype == bool
+    d.set_many(np.array([3]), np.array([3.5]))
+    assert d[3] == 3.5 and type(list(d)[2]) is int
@@ -0,0 +1,62 @@
+import pytest
+
+from pydict import BiPyDict
+
+
+def check(b):
+    "Check that b and its inverse are each other's inverse."
+    assert dict(b.inverse) == {value: key for key, value in b.items()}
+    assert b.inverse.inverse is b
+    assert len(b) == len(b.inverse)
+
+
+def test_inverse_lookups():
+    b = BiPyDict(a=1, b=2)
+    assert b.inverse[2] == "b" and 3 not in b.inverse
+    assert list(b.inverse.items()) == [(1, "a"), (2, "b")]
+    assert repr(b.inverse) == "BiPyDict({1: 'a', 2: 'b'})"
+    check(b)
+
+
+@pytest.mark.parametrize("change", [
+    lambda b: b.__setitem__("a", 10),
+    lambda b: b.__setitem__("c", 3),
+    lambda b: b.__setitem__("a", 1),
+    lambda b: b.__delitem__("b"),
+    lambda b: b.pop("a"),
+    lambda b: b.popitem(),
+    lambda b: b.popitem(last=False),
+    lambda b: b.setdefault("d", 4),
+    lambda b: b.update([("e", 5)], a=0),
+    lambda b: b.clear(),
+    lambda b: b.inverse.__setitem__(7, "c"),
+    lambda b: b.inverse.__delitem__(1),
+])
+def test_changes_keep_both_in_step(change):
+    b = BiPyDict(a=1, b=2)
+    change(b)
+    check(b)
+
+
+def test_values_belong_to_one_key():
+    b = BiPyDict(a=1, b=2)
+    with pytest.raises(ValueError):
+        b["c"] = 1
+    with pytest.raises(ValueError):
+        b.update([("c", 3), ("d", 3)])
+    with pytest.raises(ValueError):
+        b.update(a=5, b=5)
+    assert list(b.items()) == [("a", 1), ("b", 2)]
+    check(b)
+    with pytest.raises(TypeError):
+        b["c"] = []
+    check(b)
+
+
+def test_swapping_values():
+    b = BiPyDict(a=1, b=2)
+    b["a"] = 3
+    b["b"] = 1
+    b["a"] = 2
+    assert b == {"a": 2, "b": 1}
+    check(b)
@@ -0,0 +1,43 @@
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict, OrderedPyDict, defaultpydict
+
+
+def test_build_bulk_matches_constructor():
+    pairs = [(i % 7, i) for i in range(50)] + [("x", 1), ("y", 2), ("x", 3)]
+    built = PyDict.build_bulk(pairs)
+    expected = PyDict(pairs)
+    assert built == expected
+    assert list(built) == list(expected)
+    assert built.stats()["length"] == len(expected)
+    built["z"] = 0
+    assert built["z"] == 0
+
+
+def test_build_bulk_from_mapping():
+    source = PyDict(a=1, b=2)
+    assert list(PyDict.build_bulk(source).items()) == [("a", 1), ("b", 2)]
+    frozen = frozenpydict.build_bulk(source)
+    assert isinstance(frozen, frozenpydict) and frozen == source
+
+
+def test_build_bulk_subclasses():
+    ordered = OrderedPyDict.build_bulk([("a", 1), ("b", 2)])
+    assert type(ordered) is OrderedPyDict and list(ordered) == ["a", "b"]
+    default = defaultpydict.build_bulk([("a", 1)])
+    assert type(default) is defaultpydict
+    assert default == {"a": 1} and default.default_factory is None
+    assert list(pydict.SortedPyDict.build_bulk([(2, "b"), (1, "a")])) == [1, 2]
+
+
+def test_build_bulk_rejects_subclasses_needing_arguments():
+    with pytest.raises(TypeError, match="without arguments"):
+        pydict.AsyncLoadingPyDict.build_bulk([("a", 1)])
+
+
+def test_build_bulk_large_input():
+    pairs = [(str(i % 60000), i) for i in range(70000)]
+    built = PyDict.build_bulk(pairs)
+    assert built == PyDict(pairs)
+    assert list(built)[:3] == ["0", "1", "2"]
@@ -0,0 +1,157 @@
+import pytest
+
+from pydict import pydict as PyDict, defaultpydict, ShallowChainMap, DeepChainMap
+
+
+def layers():
+    return [PyDict(a=1, b=2), PyDict(b=20, c=30), PyDict(c=300, d=400)]
+
+
+@pytest.mark.parametrize("cls", [ShallowChainMap, DeepChainMap])
+def test_length_counts_distinct_keys(cls):
+    chain = cls(*layers())
+    assert len(chain) == 4 == len(chain.as_pydict())
+    assert len(cls(PyDict(a=1))) == 1
+
+
+@pytest.mark.parametrize("cls", [ShallowChainMap, DeepChainMap])
+def test_flatten_keeps_lookups_and_length(cls):
+    maps = layers()
+    chain = cls(*maps)
+    before = chain.as_pydict()
+    length = len(chain)
+    chain.flatten()
+    assert chain.maps == maps and all(a is b for a, b in zip(chain.maps, maps))
+    assert chain.stats()["indexed"] == 2
+    assert len(chain) == length
+    assert chain.as_pydict() == before
+    assert list(chain) == list(before)
+    for key, value in before.items():
+        assert chain[key] == value and key in chain
+    assert "z" not in chain
+    chain.flatten(1)
+    assert chain.stats()["indexed"] == 3 and len(chain) == length
+    assert chain["b"] == 2 and chain["c"] == 30
+
+
+@pytest.mark.parametrize("cls", [ShallowChainMap, DeepChainMap])
+def test_flatten_follows_changes_of_the_maps(cls):
+    maps = layers()
+    chain = cls(*maps)
+    chain.flatten()
+    maps[2]["e"] = 5
+    maps[1]["c"] = 3
+    del maps[1]["b"]
+    assert chain["e"] == 5 and chain["c"] == 3 and chain["b"] == 2
+    del maps[0]["b"]
+    assert "b" not in chain
+    maps[2].clear()
+    assert "d" not in chain and "e" not in chain and chain["c"] == 3
+    assert chain.stats()["indexed"] == 0
+    chain.flatten()
+    chain.maps.append(PyDict(f=6))
+    assert chain["f"] == 6 and chain.stats()["indexed"] == 0
+    chain.maps = [PyDict(g=7)]
+    assert chain["g"] == 7 and "c" not in chain
+
+
+def test_deep_writes_reach_the_maps_flattened():
+    maps = layers()
+    chain = DeepChainMap(*maps)
+    chain.flatten()
+    chain["c"] = 0
+    chain["e"] = 5
+    assert maps[1]["c"] == 0 and maps[2]["c"] == 300 and maps[0]["e"] == 5
+    chain.update({"d": 4, "f": 6})
+    assert maps[2]["d"] == 4 and maps[0]["f"] == 6
+    del chain["c"]
+    assert "c" not in maps[1] and chain["c"] == 300
+    del chain["c"]
+    with pytest.raises(KeyError):
+        del chain["c"]
+    assert chain.as_pydict() == {"d": 4, "b": 2, "a": 1, "e": 5, "f": 6}
+
+
+def test_flatten_keeps_maps_with_missing():
+    fallback = defaultpydict(int, a=0)
+    chain = ShallowChainMap(PyDict(), PyDict(b=1), fallback, PyDict(c=2), PyDict(d=3))
+    chain.flatten()
+    assert chain.maps[2] is fallback and chain.stats()["indexed"] == 2
+    assert chain["x"] == 0 and chain["b"] == 1 and "d" in chain
+    unwatched = ShallowChainMap(PyDict(), PyDict(b=1), {"c": 2})
+    unwatched.flatten()
+    assert unwatched.stats()["indexed"] == 0 and unwatched["c"] == 2
+
+
+def test_stats():
+    chain = ShallowChainMap(*layers())
+    stats = chain.stats()
+    assert stats["length"] == 4 and stats["depth"] == 3 and stats["indexed"] == 0
+    assert [s["length"] for s in stats["maps"]] == [2, 2, 2]
+    chain.flatten()
+    stats = chain.stats()
+    assert stats["depth"] == 3 and stats["indexed"] == 2 and stats["misses"] == 0
+    assert ShallowChainMap(PyDict(), {"a": 1}).stats()["maps"][1] is None
+
+
+def test_flatten_policy():
+    chain = ShallowChainMap(PyDict(a=1))
+    chain.set_flatten_policy(max_depth=3)
+    for i in range(5):
+        chain = chain.child(PyDict({i: i}))
+        assert chain[i] == i
+        assert chain.stats()["indexed"] == (0 if i < 2 else len(chain.maps) - 1)
+    assert len(chain.maps) == 6
+    assert chain.as_pydict() == {"a": 1, 0: 0, 1: 1, 2: 2, 3: 3, 4: 4}
+    bottom = chain.maps[-1]
+    bottom["b"] = 2
+    assert chain["b"] == 2
+    budget = ShallowChainMap(PyDict(), PyDict(a=1), PyDict(b=2))
+    budget.set_flatten_policy(miss_budget=5)
+    for i in range(3):
+        assert i not in budget
+    assert len(budget.maps) == 3 and budget.stats()["indexed"] == 2
+    budget.maps[2]["c"] = 3
+    assert budget["b"] == 2 and budget["c"] == 3
+
+
+def test_shallow_writes_go_to_first_map():
+    first, second = PyDict(), PyDict(a=1)
+    chain = ShallowChainMap(first, second)
+    chain["a"] = 2
+    assert first == {"a": 2} and second == {"a": 1}
+    del chain["a"]
+    with pytest.raises(KeyError):
+        del chain["a"]
+    with pytest.raises(KeyError):
+        chain.popitem()
+
+
+def test_deep_writes_go_to_the_map_holding_the_key():
+    maps = layers()
+    chain = DeepChainMap(*maps)
+    chain["c"] = 0
+    chain["e"] = 5
+    assert maps[1]["c"] == 0 and maps[2]["c"] == 300 and maps[0]["e"] == 5
+    chain.update({"d": 4, "b": 0, "f": 6})
+    assert maps[2]["d"] == 4 and maps[0]["b"] == 0 and maps[0]["f"] == 6
+    assert maps[1]["b"] == 20
+
+
+def test_deep_delete_and_popitem_raise_key_error():
+    chain = DeepChainMap(PyDict(a=1), PyDict(b=2))
+    del chain["b"]
+    with pytest.raises(KeyError):
+        del chain["b"]
+    assert chain.popitem() == ("a", 1)
+    with pytest.raises(KeyError):
+        chain.popitem()
+
+
+def test_hashed_lookups():
+    chain = ShallowChainMap(PyDict(a=1), {"b": 2})
+    assert chain.getitem_hashed("b", hash("b")) == 2
+    assert chain.contains_hashed("a", hash("a"))
+    assert not chain.contains_hashed("z", hash("z"))
+    chain.setitem_hashed("c", hash("c"), 3)
+    assert chain.maps[0]["c"] == 3
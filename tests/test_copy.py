@@ -0,0 +1,109 @@
+import copy
+import gc
+
+import pytest
+
+from pydict import pydict as PyDict, defaultpydict, OrderedPyDict
+
+CHANGES = [
+    lambda d: d.__setitem__("a", 0),
+    lambda d: d.__setitem__("new", 0),
+    lambda d: d.__delitem__("b"),
+    lambda d: d.pop("a"),
+    lambda d: d.popitem(),
+    lambda d: d.popitem(last=False),
+    lambda d: d.move_to_end("a"),
+    lambda d: d.move_to_end("c", last=False),
+    lambda d: d.clear(),
+    lambda d: d.update(x=1, a=2),
+    lambda d: d.setdefault("y", 3),
+    lambda d: d.set_many(["a", "z"], [5, 6]),
+    lambda d: d.setitem_hashed("h", hash("h"), 7),
+    lambda d: d.__ior__({"a": 8}),
+]
+
+
+def items():
+    return [("a", 1), ("b", 2), ("c", 3)]
+
+
+def test_copies_share_storage_until_changed():
+    d = PyDict(items())
+    c = d.copy()
+    assert c._hash_table is d._hash_table and c._keys is d._keys
+    assert c == d and list(c.items()) == items()
+    c["a"] = 10
+    assert c._hash_table is not d._hash_table
+    assert d["a"] == 1 and c["a"] == 10
+
+
+@pytest.mark.parametrize("change", CHANGES)
+def test_changing_a_copy_leaves_the_original(change):
+    d = PyDict(items())
+    c = d.copy()
+    # A pydict sharing no storage
+    expected = PyDict(items())
+    change(c)
+    change(expected)
+    assert list(c.items()) == list(expected.items())
+    assert list(d.items()) == items()
+
+
+@pytest.mark.parametrize("change", CHANGES)
+def test_changing_the_original_leaves_copies(change):
+    d = PyDict(items())
+    copies = [d.copy(), copy.copy(d)]
+    copies.append(copies[0].copy())
+    change(d)
+    for c in copies:
+        assert list(c.items()) == items()
+        assert all(c[key] == value for key, value in items())
+
+
+def test_last_owner_keeps_the_storage():
+    d = PyDict(items())
+    c = d.copy()
+    table = d._hash_table
+    del c
+    gc.collect()
+    d["d"] = 4
+    assert d._hash_table is table
+
+
+def test_or_copies_lazily():
+    d = PyDict(items())
+    merged = d | {"c": 30, "d": 4}
+    assert list(merged.items()) == [("a", 1), ("b", 2), ("c", 30), ("d", 4)]
+    assert list(d.items()) == items()
+
+
+def test_subclass_copies():
+    d = defaultpydict(list, items())
+    c = d.copy()
+    assert c.default_factory is list and c["new"] == []
+    assert "new" not in d
+    o = OrderedPyDict(items())
+    assert type(o.copy()) is OrderedPyDict and o.copy() == o
+
+    class Tagged(PyDict):
+        "pydict subclass with its own constructor"
+        def __init__(self, mapping=(), tag="t"):
+            self.tag = tag
+
+    t = Tagged(items(), tag="x")
+    assert type(t.copy()) is Tagged and t.copy() == t
+
+
+def test_copy_during_an_incremental_resize():
+    d = PyDict()
+    for i in range(5000):
+        d[i] = i
+    assert d._rehash is not None
+    c = d.copy()
+    for i in range(5000, 5100):
+        c[i] = i
+    del d[0]
+    assert len(c) == 5100 and c[0] == 0
+    assert len(d) == 4999 and 5000 not in d
+    assert all(c[i] == i for i in range(5100))
+    assert all(d[i] == i for i in range(1, 5000))
@@ -0,0 +1,193 @@
+import gc
+import weakref
+
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict
+
+
+class Key(object):
+    "Weakly referenceable key"
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Key({self.name!r})"
+
+
+def counting(fn):
+    "Return fn, and a list of the arguments it gets called with."
+    calls = []
+    def wrapper(*args):
+        calls.append(args)
+        return fn(*args)
+    return wrapper, calls
+
+
+def test_map_values_is_lazy_and_follows_source():
+    d = PyDict(a=1, b=2, c=3)
+    square, calls = counting(lambda v: v * v)
+    m = d.map_values(square)
+    assert calls == []
+    assert m["b"] == 4
+    assert list(m.items()) == [("a", 1), ("b", 4), ("c", 9)]
+    assert list(reversed(m.values())) == [9, 4, 1]
+    d["d"] = 4
+    assert m["d"] == 16 and len(m) == 4
+    with pytest.raises(KeyError):
+        m["x"]
+
+
+def test_filter_and_project():
+    d = PyDict(a=1, b=2, c=3, d=4)
+    f = d.filter(lambda k, v: v % 2 == 0)
+    assert list(f) == ["b", "d"] and len(f) == 2
+    assert "a" not in f and "b" in f
+    with pytest.raises(KeyError):
+        f["a"]
+    assert list(reversed(f.items())) == [("d", 4), ("b", 2)]
+    assert repr(f) == "FilteredPyDict({'b': 2, 'd': 4})"
+    p = d.project(["d", "x", "a"])
+    assert list(p.items()) == [("d", 4), ("a", 1)] and len(p) == 2
+    d["x"] = 9
+    assert list(p) == ["d", "x", "a"]
+    assert p == {"d": 4, "x": 9, "a": 1}
+
+
+def test_chained_views():
+    d = PyDict(a=3, b=10, c=9)
+    c = d.map_values(lambda v: v * 10).filter(lambda k, v: v > 50).project(["c", "a", "b"])
+    assert list(c.items()) == [("c", 90), ("b", 100)]
+
+
+def test_iteration_raises_if_source_changes_size():
+    d = PyDict(a=1, b=2, c=3)
+    it = iter(d.filter(lambda k, v: True))
+    next(it)
+    d["d"] = 4
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_memoized_values_are_forgotten_per_key():
+    d = PyDict(a=1, b=2)
+    square, calls = counting(lambda v: v * v)
+    m = d.map_values(square, memoize=True)
+    assert m["a"] == 1 and m["a"] == 1 and m["b"] == 4
+    assert len(calls) == 2
+    d["a"] = 7
+    assert m["a"] == 49 and m["b"] == 4
+    assert len(calls) == 3
+    del d["b"]
+    with pytest.raises(KeyError):
+        m["b"]
+    d.clear()
+    d["a"] = 3
+    assert m["a"] == 9
+
+
+def test_memoized_filter_length_follows_changes():
+    d = PyDict(a=1, b=5, c=9)
+    pred, calls = counting(lambda k, v: v > 2)
+    f = d.filter(pred, memoize=True)
+    assert len(f) == 2 and len(f) == 2
+    assert list(f) == ["b", "c"]
+    assert len(calls) == 3
+    d["a"] = 10
+    assert len(f) == 3
+    assert len(calls) == 4
+
+
+def test_memoizing_doesnt_journal_the_source():
+    d = PyDict.fromkeys(range(1000), 0)
+    m = d.map_values(str, memoize=True)
+    assert m[5] == "0"
+    assert d.journal_version is None
+    for key in range(1000):
+        del d[key]
+    assert d._journal.changes == {}
+
+
+def test_source_stops_telling_collected_views():
+    d = PyDict(a=1)
+    m = d.map_values(str, memoize=True)
+    assert d._journal is not None
+    ref = weakref.ref(m)
+    del m
+    gc.collect()
+    assert ref() is None
+    d["a"] = 2
+    assert d._journal is None
+
+
+def test_memoizing_view_keeps_a_journal_working():
+    d = PyDict(a=1)
+    version = d.enable_journal()
+    m = d.map_values(str, memoize=True)
+    d["a"] = 2
+    assert m["a"] == "2"
+    assert list(d.changes_since(version).items) == [("a", 2)]
+    d.disable_journal()
+    assert d.journal_version is None
+    d["a"] = 3
+    assert m["a"] == "3"
+
+
+def test_weak_sources():
+    keys = [Key("a"), Key("b")]
+    d = pydict.WeakKeyPyDict(zip(keys, [1, 2]))
+    assert list(d.map_values(lambda v: -v).items()) == [(keys[0], -1), (keys[1], -2)]
+    assert list(d.filter(lambda k, v: v > 1)) == [keys[1]]
+    values = [Key("x"), Key("y")]
+    w = pydict.WeakValuePyDict(a=values[0], b=values[1])
+    assert list(w.map_values(lambda v: v.name).values()) == ["x", "y"]
+
+
+@pytest.mark.parametrize("source", [
+    lambda: pydict.IntPyDict({1: 10, 2: 20}),
+    lambda: pydict.SharedKeyPyDict({1: 10, 2: 20}),
+    lambda: pydict.SortedPyDict({2: 20, 1: 10}),
+    lambda: pydict.ShallowChainMap(PyDict({1: 10}), PyDict({2: 20})),
+    lambda: pydict.DeepChainMap(PyDict({1: 10}), PyDict({2: 20})),
+])
+def test_sources_storing_keys_their_own_way(source):
+    d = source()
+    assert dict(d.map_values(lambda v: v + 1).items()) == {1: 11, 2: 21}
+    assert list(d.filter(lambda k, v: v > 10)) == [2]
+    assert list(d.project([2, 3])) == [2]
+    with pytest.raises(TypeError, match="memoize=False"):
+        d.map_values(str, memoize=True)
+    with pytest.raises(TypeError, match="memoize=False"):
+        d.filter(lambda k, v: True, memoize=True)
+
+
+def test_weak_sources_dont_memoize():
+    key = Key("a")
+    with pytest.raises(TypeError, match="memoize=False"):
+        pydict.WeakKeyPyDict({key: 1}).map_values(str, memoize=True)
+    with pytest.raises(TypeError, match="memoize=False"):
+        pydict.WeakValuePyDict(a=key).map_values(str, memoize=True)
+
+
+def test_frozen_sources_memoize():
+    f = frozenpydict(a=1, b=2)
+    assert f.map_values(str, memoize=True) == {"a": "1", "b": "2"}
+    assert f.filter(lambda k, v: k == "b", memoize=True) == {"b": 2}
+    p = pydict.PersistentPyDict(a=1)
+    m = pydict.MappedPyDict(p, str, memoize=True)
+    assert m["a"] == "1"
+    with pytest.raises(TypeError, match="memoize=False"):
+        pydict.MappedPyDict({"a": 1}, str, memoize=True)
+
+
+def test_views_as_chain_map_layers():
+    base = PyDict(x=1, y=2)
+    chain = pydict.ShallowChainMap(PyDict(), base.map_values(lambda v: -v))
+    assert chain["x"] == -1 and "y" in chain
+    chain["x"] = 5
+    assert chain["x"] == 5 and base["x"] == 1
+    deep = pydict.DeepChainMap(PyDict(z=0), base.filter(lambda k, v: v > 1))
+    assert "x" not in deep and deep["y"] == 2
+    deep.flatten(1)
+    assert deep.as_pydict() == {"z": 0, "y": 2}
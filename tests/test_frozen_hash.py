@@ -0,0 +1,57 @@
+import pytest
+
+from pydict import frozenpydict, PersistentPyDict
+
+
+class CountedKey(object):
+    "Key counting how often it's hashed"
+    hashes = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        CountedKey.hashes += 1
+        return hash(self.name)
+
+    def __eq__(self, other):
+        return isinstance(other, CountedKey) and self.name == other.name
+
+
+def test_hash_ignores_order():
+    a = frozenpydict([("x", 1), ("y", 2), ("z", 3)])
+    b = frozenpydict([("z", 3), ("x", 1), ("y", 2)])
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, frozenpydict(x=1, y=2, z=3)}) == 1
+    assert hash(frozenpydict()) == hash(frozenpydict())
+
+
+def test_hash_depends_on_items():
+    a = frozenpydict(x=1, y=2)
+    assert hash(a) != hash(frozenpydict(x=2, y=1))
+    assert hash(a) != hash(frozenpydict(x=1, y=3))
+    assert hash(a) != hash(frozenpydict(x=1))
+
+
+def test_hash_is_computed_once_without_hashing_keys():
+    f = frozenpydict.fromkeys([CountedKey(i) for i in range(10)], 0)
+    CountedKey.hashes = 0
+    first = hash(f)
+    assert f._hash is not None
+    assert hash(f) == first and CountedKey.hashes == 0
+
+
+def test_unhashable_values():
+    f = frozenpydict(a=[1])
+    with pytest.raises(TypeError):
+        hash(f)
+    assert f._hash is None
+    assert f == {"a": [1]}
+
+
+def test_known_hashes_settle_inequality():
+    a, b = frozenpydict(x=1), frozenpydict(x=2)
+    hash(a), hash(b)
+    assert a != b
+    assert frozenpydict(x=1) == PersistentPyDict(x=1)
+    assert hash(frozenpydict(x=1)) == hash(PersistentPyDict(x=1))
@@ -0,0 +1,81 @@
+import pytest
+
+from pydict import pydict as PyDict, frozenpydict, defaultpydict, ShallowChainMap, DeepChainMap
+
+
+class CountedKey(object):
+    "Key counting how often it's hashed"
+    hashes = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        CountedKey.hashes += 1
+        return hash(self.name)
+
+    def __eq__(self, other):
+        return isinstance(other, CountedKey) and self.name == other.name
+
+
+def test_keys_hashed_once_for_many_pydicts():
+    keys = [CountedKey(i) for i in range(20)]
+    maps = [PyDict.fromkeys(keys[i::2], i) for i in range(2)] + [frozenpydict.fromkeys(keys, 2)]
+    CountedKey.hashes = 0
+    key = CountedKey(3)
+    h = hash(key)
+    assert [m.contains_hashed(key, h) for m in maps] == [False, True, True]
+    assert [m.get_hashed(key, h, "none") for m in maps] == ["none", 1, 2]
+    assert maps[2].getitem_hashed(key, h) == 2
+    maps[0].setitem_hashed(key, h, 0)
+    assert maps[0][key] == 0
+    assert CountedKey.hashes == 2
+
+
+def test_misses():
+    d = PyDict(a=1)
+    with pytest.raises(KeyError):
+        d.getitem_hashed("b", hash("b"))
+    with pytest.raises(KeyError):
+        frozenpydict(a=1).getitem_hashed("b", hash("b"))
+    dd = defaultpydict(list)
+    assert dd.getitem_hashed("x", hash("x")) == []
+    assert dd.get_hashed("y", hash("y")) is None
+
+
+def test_setitem_hashed_grows_and_resizes():
+    d = PyDict()
+    for i in range(5000):
+        d.setitem_hashed(i, hash(i), -i)
+    assert d._rehash is not None
+    d.setitem_hashed(10, hash(10), "ten")
+    assert len(d) == 5000 and d[10] == "ten"
+    assert all(d.getitem_hashed(i, hash(i)) == -i for i in range(11, 5000))
+
+
+def test_subclasses_look_keys_up_their_own_way():
+    class Upper(PyDict):
+        def __getitem__(self, key):
+            return PyDict.__getitem__(self, key.upper())
+
+        def __contains__(self, key):
+            return PyDict.__contains__(self, key.upper())
+
+        def __setitem__(self, key, value):
+            PyDict.__setitem__(self, key.upper(), value)
+
+    d = Upper()
+    d.setitem_hashed("a", hash("a"), 1)
+    assert list(d) == ["A"]
+    assert d.getitem_hashed("a", hash("a")) == 1
+    assert d.contains_hashed("a", hash("a"))
+
+
+@pytest.mark.parametrize("cls", [ShallowChainMap, DeepChainMap])
+def test_chain_maps_hash_once(cls):
+    keys = [CountedKey(i) for i in range(6)]
+    chain = cls(PyDict.fromkeys(keys[:2], 0), frozenpydict.fromkeys(keys[2:4], 1), PyDict.fromkeys(keys, 2))
+    CountedKey.hashes = 0
+    assert chain[CountedKey(5)] == 2
+    assert CountedKey(4) in chain
+    assert CountedKey.hashes == 2
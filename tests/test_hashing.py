@@ -0,0 +1,71 @@
+import pydict
+from pydict import pydict as PyDict
+
+
+class Hashed(object):
+    "Key with a given hash code"
+    def __init__(self, hashcode):
+        self.hashcode = hashcode
+
+    def __hash__(self):
+        return self.hashcode
+
+    def __eq__(self, other):
+        return isinstance(other, Hashed) and self.hashcode == other.hashcode
+
+
+class Same(Hashed):
+    "Key equal only to itself"
+    __hash__ = Hashed.__hash__
+    __eq__ = object.__eq__
+
+
+def colliding_keys(d, count):
+    "Return count keys with distinct hash codes, which all go to one bucket of d as it is now."
+    size, seed = d._size, d._seed
+    # Multiples of the size sharing the seed's top bits, so that the hash
+    # codes are small enough for hash() to keep them as they are
+    top = seed >> 58 << 58
+    first = -(-top // size) * size
+    return [Hashed((first + i * size) ^ seed) for i in range(count)]
+
+
+def test_pydicts_start_with_the_process_seed():
+    assert PyDict()._seed == pydict._hash_seed
+    assert PyDict(a=1)._seed == PyDict(b=2)._seed
+
+
+def test_multiples_of_the_size_are_spread_out():
+    # Without a seed, keys whose hash codes are multiples of the size share a bucket
+    d = PyDict.fromkeys(range(1000))
+    size = d._size
+    keys = [Hashed(i * size) for i in range(1, 8)]
+    d.update(dict.fromkeys(keys))
+    assert d._size == size
+    assert d.stats()["longest_chain"] < 7
+
+
+def test_reseeds_on_a_long_bin_of_distinct_hash_codes():
+    d = PyDict.fromkeys(range(2000))
+    size, seed = d._size, d._seed
+    keys = colliding_keys(d, pydict._CHAIN_LIMIT)
+    assert len({(hash(key) ^ seed) % size for key in keys}) == 1
+    assert len({hash(key) for key in keys}) == len(keys)
+    for key in keys:
+        d[key] = key.hashcode
+    assert d._size == size
+    assert d._seed != seed
+    assert d.stats()["longest_chain"] < pydict._TREEIFY_THRESHOLD
+    assert all(d[key] == key.hashcode for key in keys)
+    assert list(d)[2000:] == keys
+
+
+def test_equal_hash_codes_dont_reseed():
+    d = PyDict.fromkeys(range(2000))
+    seed = d._seed
+    # Distinct keys, all with the hash code 7
+    keys = [Same(7) for i in range(40)]
+    for key in keys:
+        d[key] = 1
+    assert d._seed == seed
+    assert len(d) == 2040 and all(key in d for key in keys)
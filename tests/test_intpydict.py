@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from pydict import IntPyDict, pydict as PyDict
+
+
+def test_int_pydict_behaves_like_pydict():
+    d = IntPyDict()
+    expected = PyDict()
+    for i in range(200):
+        d[i * 7 - 300] = i
+        expected[i * 7 - 300] = i
+    for key in list(expected)[::3]:
+        del d[key]
+        del expected[key]
+    assert list(d.items()) == list(expected.items())
+    assert len(d) == len(expected)
+    assert "a" not in d and 1.5 not in d
+    with pytest.raises(TypeError):
+        d["a"] = 1
+
+
+def test_int_pydict_float_values_and_order():
+    d = IntPyDict({3: 1.5, 1: 2.5}, typecode="d")
+    d.move_to_end(3)
+    assert list(d) == [1, 3]
+    d.move_to_end(3, last=False)
+    assert list(d) == [3, 1]
+    assert d.popitem() == (1, 2.5)
+    assert d.popitem(last=False) == (3, 1.5)
+    assert len(d) == 0
+
+
+def test_buffers_export_without_copying():
+    d = IntPyDict({1: 10, 2: 20, 3: 30})
+    del d[2]
+    keys = d.keys_buffer()
+    assert keys.tolist() == [1, 3]
+    assert d.values_buffer().tolist() == [10, 30]
+    keys.release()
+
+
+@pytest.mark.parametrize("export", ["keys_buffer", "values_buffer"])
+@pytest.mark.parametrize("change, raises", [
+    (lambda d: d.__delitem__(3), True),
+    (lambda d: d.popitem(), True),
+    (lambda d: d.move_to_end(1), True),
+    (lambda d: d.__setitem__(4, 40), True),
+    # Moving to the front rebuilds the arrays first
+    (lambda d: d.move_to_end(3, last=False), False),
+])
+def test_changes_while_exported_leave_the_arrays_in_step(export, change, raises):
+    d = IntPyDict({1: 10, 2: 20, 3: 30})
+    expected = PyDict(d.items())
+    view = getattr(d, export)()
+    if raises:
+        with pytest.raises(BufferError):
+            change(d)
+        assert len(d._entry_keys) == len(d._entry_hashes) == len(d._entry_values)
+        assert list(d.items()) == list(expected.items())
+        view.release()
+    change(d)
+    change(expected)
+    assert len(d._entry_keys) == len(d._entry_hashes) == len(d._entry_values)
+    assert list(d.items()) == list(expected.items())
+    for key in expected:
+        assert d[key] == expected[key]
+
+
+def test_against_a_dict():
+    rng = random.Random(2)
+    d, expected = IntPyDict(), {}
+    for i in range(5000):
+        key = rng.randrange(-500, 500) * (1 << 40)
+        if key in expected and rng.random() < 0.4:
+            assert d.pop(key) == expected.pop(key)
+        else:
+            d[key] = i
+            expected[key] = i
+    assert list(d.items()) == list(expected.items())
+    assert all(d[key] == value for key, value in expected.items())
+    stats = d.stats()
+    assert stats["length"] == len(expected) and stats["memory"]["order"] == 0
+
+
+def test_keys_are_ints():
+    d = IntPyDict({True: 1, 2: 2})
+    assert list(d) == [1, 2] and type(list(d)[0]) is int
+    assert d[True] == 1 and 2.0 not in d and "2" not in d
+    with pytest.raises(KeyError):
+        d[2.0]
+    with pytest.raises(OverflowError):
+        d[1 << 64] = 1
+    with pytest.raises(TypeError):
+        d[3] = 1.5
+    with pytest.raises(ValueError):
+        IntPyDict(typecode="f")
+    assert repr(IntPyDict({1: 0.5}, typecode="d")) == "IntPyDict({1: 0.5}, typecode='d')"
+
+
+def test_copy_clear_and_batches():
+    d = IntPyDict((i, i * i) for i in range(100))
+    c = d.copy()
+    c[0] = -1
+    assert d[0] == 0 and type(c) is IntPyDict
+    assert d.get_many([3, 200, "x"], -1) == [9, -1, -1]
+    assert d.contains_many([99, 100]) == [True, False]
+    d.set_many([1, 100], [7, 8])
+    assert d[1] == 7 and d[100] == 8 and list(d)[-1] == 100
+    d.clear()
+    assert len(d) == 0 and list(d) == [] and 1 not in d
+    d[5] = 5
+    assert list(d.items()) == [(5, 5)]
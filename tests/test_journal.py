@@ -0,0 +1,131 @@
+import pickle
+import random
+
+import pytest
+
+from pydict import pydict as PyDict, OrderedPyDict, PyDictDelta
+
+
+def random_change(d, rng):
+    "Make a random change to d."
+    key = rng.randrange(40)
+    choice = rng.randrange(12)
+    if choice == 0:
+        d.pop(key, None)
+    elif choice == 1 and d:
+        d.popitem(last=rng.random() < 0.5)
+    elif choice == 2 and key in d:
+        d.move_to_end(key, last=rng.random() < 0.5)
+    elif choice == 3:
+        d.setdefault(key, -key)
+    elif choice == 4:
+        d.update({key: "u", key + 1: "v"})
+    elif choice == 5:
+        d.set_many([key, key + 2], ["m", "n"])
+    elif choice == 6:
+        d.setitem_hashed(key, hash(key), "h")
+    elif choice == 7 and rng.random() < 0.1:
+        d.clear()
+    elif choice == 8 and key in d:
+        del d[key]
+    else:
+        d[key] = rng.randrange(1000)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replaying_deltas_reproduces_the_pydict(seed):
+    rng = random.Random(seed)
+    primary = PyDict((i, i) for i in range(20))
+    version = primary.enable_journal()
+    replica = PyDict(primary)
+    for round in range(30):
+        for i in range(rng.randrange(1, 15)):
+            random_change(primary, rng)
+        delta = primary.changes_since(version)
+        # Deltas pickle, to be sent to other processes
+        delta = pickle.loads(pickle.dumps(delta))
+        replica.apply_delta(delta)
+        assert list(replica.items()) == list(primary.items())
+        assert delta.since == version and delta.version == primary.journal_version
+        version = delta.version
+
+
+def test_deltas_from_any_version():
+    d = PyDict(a=1, b=2)
+    start = d.enable_journal()
+    d["c"] = 3
+    middle = d.journal_version
+    d["a"] = 10
+    del d["b"]
+    d.move_to_end("a")
+    for since, before in [(start, {"a": 1, "b": 2}), (middle, {"a": 1, "b": 2, "c": 3})]:
+        copy = PyDict(before)
+        copy.apply_delta(d.changes_since(since))
+        assert list(copy.items()) == [("c", 3), ("a", 10)]
+    delta = d.changes_since(middle)
+    assert delta.deleted == ["b"] and delta.items == [] and delta.placed == [("a", 10, True)]
+    assert len(delta) == 2 and isinstance(delta, PyDictDelta)
+    assert len(d.changes_since(d.journal_version)) == 0
+
+
+def test_each_key_appears_once():
+    d = PyDict()
+    d.enable_journal()
+    for i in range(100):
+        d["k"] = i
+    assert d.journal_version == 100
+    delta = d.changes_since(0)
+    assert delta.placed == [("k", 99, True)] and len(d._journal.changes) == 1
+
+
+def test_trim_and_errors():
+    d = PyDict()
+    with pytest.raises(ValueError):
+        d.changes_since(0)
+    assert d.journal_version is None
+    d.enable_journal()
+    d["a"] = 1
+    d["b"] = 2
+    assert d.enable_journal() == 2
+    with pytest.raises(ValueError):
+        d.changes_since(3)
+    d.trim_journal(1)
+    with pytest.raises(ValueError):
+        d.changes_since(0)
+    assert d.changes_since(1).placed == [("b", 2, True)]
+    with pytest.raises(ValueError):
+        d.trim_journal(5)
+    d.disable_journal()
+    assert d.journal_version is None and d._journal is None
+    with pytest.raises(ValueError):
+        d.trim_journal(1)
+
+
+def test_clear_is_replayed():
+    d = PyDict(a=1)
+    version = d.enable_journal()
+    del d["a"]
+    d["b"] = 2
+    d.clear()
+    d["c"] = 3
+    delta = d.changes_since(version)
+    assert delta.clear and delta.deleted == []
+    replica = PyDict(a=1, z=0)
+    replica.apply_delta(delta)
+    assert list(replica.items()) == [("c", 3)]
+
+
+def test_copies_and_subclasses():
+    d = OrderedPyDict(a=1)
+    d.enable_journal()
+    copy = d.copy()
+    assert copy.journal_version is None
+    copy["b"] = 2
+    assert d.journal_version == 0
+
+    class Upper(PyDict):
+        def __getitem__(self, key):
+            return PyDict.__getitem__(self, key.upper())
+
+    with pytest.raises(TypeError):
+        Upper().enable_journal()
@@ -0,0 +1,134 @@
+import io
+import json
+import math
+
+import pytest
+
+from pydict import pydict as PyDict, frozenpydict, OrderedPyDict, dump_json, iter_json_chunks, load_json
+
+
+def dumps(obj, **kwds):
+    fp = io.StringIO()
+    dump_json(obj, fp, **kwds)
+    return fp.getvalue()
+
+
+DOCUMENTS = [
+    {"a": 1, "b": [1, 2.5, None, True, False], "c": {"d": "é\n\"", "e": {}}},
+    [],
+    [{"x": -1e300}, "text", 0, -0.0],
+    {1: "one", 2.5: "float", True: "bool", None: "null"},
+    "just a string",
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("kwds", [{}, {"ensure_ascii": False}, {"separators": (",", ":")}])
+def test_dump_json_matches_json_dumps(document, kwds):
+    assert dumps(document, **kwds) == json.dumps(document, **kwds)
+
+
+def test_dump_json_writes_pydicts():
+    d = PyDict(a=PyDict(b=[1, frozenpydict(c=2)]))
+    assert dumps(d) == '{"a": {"b": [1, {"c": 2}]}}'
+    assert "".join(d.iter_json_chunks()) == dumps(d)
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_out_of_range_floats(value):
+    assert dumps({value: value}) == json.dumps({value: value})
+    for document in ({value: 1}, {"a": value}, [value]):
+        with pytest.raises(ValueError):
+            json.dumps(document, allow_nan=False)
+        with pytest.raises(ValueError):
+            dumps(document, allow_nan=False)
+
+
+def test_skipkeys_default_and_errors():
+    assert dumps({(1, 2): 1, "a": 2}, skipkeys=True) == json.dumps({(1, 2): 1, "a": 2}, skipkeys=True)
+    with pytest.raises(TypeError):
+        dumps({(1, 2): 1})
+    assert dumps({"s": {1, 2}}, default=sorted) == '{"s": [1, 2]}'
+    with pytest.raises(TypeError):
+        dumps(object())
+    loop = PyDict()
+    loop["self"] = loop
+    with pytest.raises(ValueError):
+        dumps(loop)
+
+
+def test_chunks_are_bounded():
+    document = [{"i": i} for i in range(5000)]
+    chunks = list(iter_json_chunks(document))
+    assert len(chunks) > 1
+    assert "".join(chunks) == json.dumps(document)
+
+
+class ChunkedReader(object):
+    "File-like object which records the sizes read"
+    def __init__(self, text):
+        self.file = io.StringIO(text)
+        self.sizes = []
+
+    def read(self, size=-1):
+        self.sizes.append(size)
+        return self.file.read(size)
+
+
+LOAD_DOCUMENTS = [
+    '{"a": 1, "b": [1, 2.5e3, null, true, false, -Infinity, NaN], "c": {"d": "\\u00e9\\n\\"", "e": {}}, "a": 2}',
+    '[]',
+    '  [ {} , [ ] , "x" ] ',
+    '12',
+    '"s"',
+    '{"k": {"k": {"k": [{"z": -0.5}]}}}',
+]
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 7, 1 << 16])
+@pytest.mark.parametrize("document", LOAD_DOCUMENTS)
+def test_load_json_matches_json_loads(monkeypatch, read_size, document):
+    monkeypatch.setattr("pydict.jsonio._JSON_READ_SIZE", read_size)
+    loaded = load_json(io.StringIO(document))
+    assert repr(loaded) == repr(json.loads(document, object_pairs_hook=PyDict))
+
+
+def test_load_json_reads_in_chunks(monkeypatch):
+    monkeypatch.setattr("pydict.jsonio._JSON_READ_SIZE", 100)
+    document = json.dumps([{"id": i, "name": f"item{i}"} for i in range(1000)])
+    reader = ChunkedReader(document)
+    loaded = load_json(reader)
+    assert len(reader.sizes) > 100 and set(reader.sizes) == {100}
+    assert loaded == json.loads(document)
+    assert type(loaded[0]) is PyDict
+
+
+@pytest.mark.parametrize("document", ['{"a" 1}', '[1,]', '{"a":1,}', '[1 2]', '[1', '{"a":1} x',
+                                      '', 'tru', '{1:2}', '"abc'])
+@pytest.mark.parametrize("read_size", [1, 4, 1 << 16])
+def test_load_json_rejects_what_json_rejects(monkeypatch, document, read_size):
+    monkeypatch.setattr("pydict.jsonio._JSON_READ_SIZE", read_size)
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError):
+        load_json(io.StringIO(document))
+
+
+def test_load_json_object_types(monkeypatch):
+    monkeypatch.setattr("pydict.jsonio._JSON_READ_SIZE", 5)
+    document = json.dumps({"big": {str(i): i for i in range(20)}, "small": {"a": 1}})
+    frozen = load_json(io.StringIO(document), frozenpydict)
+    assert type(frozen) is frozenpydict and type(frozen["big"]) is frozenpydict
+    assert hash(frozen["small"]) == hash(frozenpydict(a=1))
+    ordered = load_json(io.StringIO(document), OrderedPyDict)
+    assert type(ordered["big"]) is OrderedPyDict and list(ordered["big"]) == [str(i) for i in range(20)]
+    assert load_json(io.StringIO(document), dict) == json.loads(document)
+    assert load_json(io.StringIO("[1.5]"), parse_float=str) == ["1.5"]
+
+
+def test_round_trip():
+    document = PyDict(a=[1, PyDict(b=None)], c="☃")
+    fp = io.StringIO()
+    document.dump_json(fp)
+    fp.seek(0)
+    assert load_json(fp) == document
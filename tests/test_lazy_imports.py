@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pydict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code):
+    "Run code in a fresh interpreter, and return what it printed, as JSON."
+    code = f"import json, sys\nsys.path.insert(0, {ROOT!r})\n{code}"
+    output = subprocess.run([sys.executable, "-c", code], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def test_import_loads_no_submodule():
+    loaded = run("import pydict\n"
+                 "print(json.dumps(sorted(m for m in sys.modules if m.startswith('pydict.') or m == 'numpy')))")
+    assert loaded == []
+
+
+def test_first_use_loads_only_its_module():
+    loaded = run("import pydict\n"
+                 "pydict.BiPyDict\n"
+                 "print(json.dumps(sorted(m for m in sys.modules if m.startswith('pydict.'))))")
+    assert loaded == ["pydict.bipydict"]
+
+
+def test_star_import_loads_no_submodule():
+    result = run("from pydict import *\n"
+                 "print(json.dumps([sorted(name for name in dir() if not name.startswith('_')),\n"
+                 "                  sorted(m for m in sys.modules if m.startswith('pydict.'))]))")
+    names, loaded = result
+    assert "pydict" in names and "frozenpydict" in names
+    assert not set(pydict._lazy_names) & set(names)
+    assert loaded == []
+
+
+@pytest.mark.parametrize("name", sorted(pydict._lazy_names))
+def test_lazy_names(name):
+    assert name in dir(pydict) and name not in pydict.__all__
+    value = getattr(pydict, name)
+    assert getattr(sys.modules["pydict." + pydict._lazy_names[name]], name) is value
+    # Later lookups skip __getattr__
+    assert vars(pydict)[name] is value
+
+
+def test_unknown_names():
+    with pytest.raises(AttributeError):
+        pydict.NoSuchPyDict
+    with pytest.raises(ImportError):
+        from pydict import NoSuchPyDict
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from pydict import frozenpydict, PersistentPyDict, PersistentPyDictEvolver
+
+
+class Colliding(object):
+    "Key whose hash code is always 0"
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and self.name == other.name
+
+
+def test_changes_return_new_versions():
+    p = PersistentPyDict(a=1, b=2)
+    q = p.set("c", 3)
+    r = q.delete("a")
+    s = r.set("b", 20)
+    assert list(p.items()) == [("a", 1), ("b", 2)]
+    assert list(q.items()) == [("a", 1), ("b", 2), ("c", 3)]
+    assert list(r.items()) == [("b", 2), ("c", 3)]
+    assert list(s.items()) == [("b", 20), ("c", 3)]
+    assert list(reversed(s)) == ["c", "b"]
+    assert p.set("a", 1) is p and p.copy() is p
+    with pytest.raises(KeyError):
+        p.delete("z")
+    with pytest.raises(TypeError):
+        p["a"] = 5
+
+
+def test_versions_share_unchanged_nodes():
+    p = PersistentPyDict.fromkeys(range(1000), 0)
+    q = p.set(0, 1)
+    shared = set(map(id, p._root.array)) & set(map(id, q._root.array))
+    assert len(shared) == len(p._root.array) - 1
+    assert p[0] == 0 and q[0] == 1
+
+
+def test_against_a_dict():
+    rng = random.Random(0)
+    p, expected = PersistentPyDict(), {}
+    versions = []
+    for i in range(3000):
+        key = rng.randrange(500)
+        if key in expected and rng.random() < 0.4:
+            p = p.delete(key)
+            del expected[key]
+        else:
+            p = p.set(key, i)
+            expected[key] = i
+        if i % 500 == 0:
+            versions.append((p, dict(expected)))
+    assert len(p) == len(expected) and list(p.items()) == list(expected.items())
+    for version, items in versions:
+        assert list(version.items()) == list(items.items())
+
+
+def test_colliding_keys():
+    keys = [Colliding(i) for i in range(5)]
+    p = PersistentPyDict.fromkeys(keys, 0)
+    assert all(p[key] == 0 for key in keys) and len(p) == 5
+    q = p.delete(keys[2]).set(keys[0], 1)
+    assert keys[2] not in q and q[keys[0]] == 1 and len(q) == 4
+    assert keys[2] in p and p[keys[0]] == 0
+
+
+def test_evolver():
+    p = PersistentPyDict(a=1)
+    e = p.evolver()
+    e["b"] = 2
+    e.set("c", 3).delete("a")
+    assert len(e) == 2 and e.get("a") is None and "b" in e
+    q = e.persistent()
+    e["d"] = 4
+    del e["b"]
+    assert list(q.items()) == [("b", 2), ("c", 3)]
+    assert list(e.persistent().items()) == [("c", 3), ("d", 4)]
+    assert list(p.items()) == [("a", 1)]
+    with pytest.raises(TypeError):
+        PersistentPyDictEvolver({"a": 1})
+
+
+def test_equality_hash_and_or():
+    p = PersistentPyDict(a=1, b=2)
+    f = frozenpydict(b=2, a=1)
+    assert p == f and hash(p) == hash(f) and p == {"a": 1, "b": 2}
+    q = p.set("a", 5).set("a", 1)
+    assert hash(q) == hash(p)
+    assert hash(p.delete("b")) == hash(frozenpydict(a=1))
+    assert (p | {"c": 3}) == {"a": 1, "b": 2, "c": 3}
+    assert ({"a": 0, "z": 26} | p) == {"a": 1, "b": 2, "z": 26}
+    with pytest.raises(TypeError):
+        p |= {"c": 3}
+    with pytest.raises(TypeError):
+        class Sub(PersistentPyDict):
+            pass
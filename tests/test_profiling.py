@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, defaultpydict, frozenpydict
+
+
+@pytest.fixture
+def events():
+    "Profile into a list of events, then stop profiling."
+    events = []
+    pydict.enable_profiling(lambda event, value: events.append((event, value)))
+    yield events
+    pydict.disable_profiling()
+
+
+class Key(object):
+    "Key counting how often it's compared"
+    compares = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        Key.compares += 1
+        return isinstance(other, Key) and self.name == other.name
+
+
+def test_lookups_probe_once(events):
+    keys = [Key(i) for i in range(4)]
+    d = PyDict.fromkeys(keys, 0)
+    d[keys[2]] = 1
+    events.clear()
+    Key.compares = 0
+    assert d[Key(2)] == 1
+    # Every key shares one bucket: each node visited is compared once
+    assert events == [("lookup", Key.compares)]
+
+
+def test_misses(events):
+    d = defaultpydict(list)
+    assert d["a"] == []
+    assert ("missing", 1) in events
+    with pytest.raises(KeyError):
+        PyDict()["a"]
+    with pytest.raises(KeyError):
+        frozenpydict(a=1)["b"]
+    assert frozenpydict(a=1)["a"] == 1
+
+
+def test_profiled_classes_give_right_values(events):
+    shared = pydict.SharedKeyPyDict(a=1, b=2)
+    ints = pydict.IntPyDict({1: 10})
+    # Profile the classes loaded since profiling was enabled
+    sink = pydict.profiling._profile_sink
+    pydict.enable_profiling(sink)
+    events.clear()
+    assert shared["b"] == 2 and ints[1] == 10
+    assert [event for event, value in events] == ["lookup", "lookup"]
+    with pytest.raises(KeyError):
+        ints["x"]
+    assert events[-1] == ("missing", 1)
+
+
+def test_stats_and_disable():
+    getitem = vars(PyDict)["__getitem__"]
+    stats = pydict.enable_profiling()
+    try:
+        d = PyDict()
+        for i in range(100):
+            d[i] = i
+        for i in range(100):
+            d[i]
+        assert stats.lookups == 100 and stats.stores == 100
+        list(d)
+        0 in d.values()
+    finally:
+        pydict.disable_profiling()
+    assert stats.resizes > 0 and stats.iterators >= 1 and stats.view_scans == 1
+    lookups = stats.lookups
+    d[0]
+    assert stats.lookups == lookups
+    assert vars(PyDict)["__getitem__"] is getitem
+
+
+def test_doesnt_import_intpydict():
+    code = ("import sys, pydict; pydict.enable_profiling(); pydict.pydict(a=1)['a']; "
+            "pydict.disable_profiling(); print('pydict.intpydict' in sys.modules, 'numpy' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False", "False"]
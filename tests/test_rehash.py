@@ -0,0 +1,97 @@
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict
+
+
+def resizing(n=5000):
+    "Return a pydict of range(n) to -range(n), in the middle of an incremental resize."
+    d = PyDict()
+    for i in range(n):
+        d[i] = -i
+    assert d._rehash is not None
+    return d
+
+
+def check(d, expected):
+    "Check that d holds the items of expected, in order."
+    assert len(d) == len(expected)
+    assert list(d.items()) == list(expected.items())
+    assert all(d[key] == value for key, value in expected.items())
+    assert all(key in d for key in expected)
+
+
+def test_small_tables_resize_at_once():
+    d = PyDict()
+    for i in range(1000):
+        d[i] = i
+        assert d._rehash is None
+
+
+def test_each_change_moves_a_few_buckets():
+    d = resizing()
+    rehash = d._rehash
+    start = rehash.next
+    d[-1] = 1
+    assert rehash.next == start + pydict._REHASH_STEP
+    del d[0]
+    assert rehash.next == start + 2 * pydict._REHASH_STEP
+    # Lookups and updates of existing keys don't move any
+    d[1] = 1
+    d[2]
+    assert rehash.next == start + 2 * pydict._REHASH_STEP
+
+
+def test_operations_during_a_resize():
+    d = resizing()
+    expected = dict(d)
+    check(d, expected)
+    d[10] = "ten"
+    expected[10] = "ten"
+    del d[4000]
+    del expected[4000]
+    assert d.pop(4001) == expected.pop(4001)
+    assert d.pop(4001, None) is None
+    d.move_to_end(0)
+    expected[0] = expected.pop(0)
+    assert d.popitem() == (0, 0)
+    expected.popitem()
+    check(d, expected)
+    assert d == expected and frozenpydict(d) == expected
+    copy = d.copy()
+    copy[1] = "one"
+    assert d[1] == -1
+    check(copy, {**expected, 1: "one"})
+    with pytest.raises(KeyError):
+        d[4000]
+
+
+def test_resizes_finish():
+    d = resizing()
+    expected = dict(d)
+    i = len(d)
+    while d._rehash is not None:
+        d[i] = -i
+        expected[i] = -i
+        i += 1
+    check(d, expected)
+    chains = d.stats()["chain_lengths"]
+    assert sum(length * count for length, count in chains.items()) == len(expected)
+
+
+def test_a_resize_during_a_resize_finishes_it_first():
+    d = resizing()
+    expected = dict(d)
+    for i in range(len(d), 40000):
+        d[i] = -i
+        expected[i] = -i
+    check(d, expected)
+    assert d.stats()["resizes"] >= 2
+
+
+def test_clear_during_a_resize():
+    d = resizing()
+    d.clear()
+    assert d._rehash is None and len(d) == 0
+    d["a"] = 1
+    assert list(d.items()) == [("a", 1)]
@@ -0,0 +1,101 @@
+import pytest
+
+from pydict import SharedKeyPyDict, pydict as PyDict
+
+
+class CountedKey(object):
+    "Key counting how often it's hashed"
+    hashes = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        CountedKey.hashes += 1
+        return hash(self.name)
+
+    def __eq__(self, other):
+        return isinstance(other, CountedKey) and self.name == other.name
+
+
+def test_instances_share_keys():
+    a = SharedKeyPyDict(x=1, y=2)
+    b = SharedKeyPyDict(x=3, y=4)
+    assert a.shares_keys and b.shares_keys
+    assert a.key_layout is b.key_layout == ("x", "y")
+    assert a == {"x": 1, "y": 2} and b["y"] == 4
+    c = SharedKeyPyDict.fromvalues(["x", "y"], [5, 6])
+    assert c.key_layout is a.key_layout
+
+
+def test_layouts_and_tuples_are_reused_without_hashing():
+    keys = (CountedKey("a"), CountedKey("b"))
+    first = SharedKeyPyDict.fromvalues(keys, [1, 2])
+    CountedKey.hashes = 0
+    again = SharedKeyPyDict.fromvalues(keys, [3, 4])
+    shared = SharedKeyPyDict.fromvalues(first.key_layout, [5, 6])
+    assert CountedKey.hashes == 0
+    assert again.key_layout is shared.key_layout is first.key_layout
+    assert [again[key] for key in keys] == [3, 4]
+
+
+def test_equal_keys_of_other_types_get_their_own_index():
+    ones = SharedKeyPyDict.fromvalues((1,), ["int"])
+    trues = SharedKeyPyDict.fromvalues((True,), ["bool"])
+    floats = SharedKeyPyDict({1.0: "float"})
+    assert type(list(ones)[0]) is int
+    assert list(trues)[0] is True
+    assert type(list(floats)[0]) is float
+    assert trues.key_layout is not ones.key_layout
+
+
+def test_mappings_are_shared_without_a_pydict():
+    record = {"x": 1, "y": 2}
+    a = SharedKeyPyDict(record)
+    b = SharedKeyPyDict(PyDict(x=3, y=4))
+    c = SharedKeyPyDict(a)
+    d = SharedKeyPyDict([("x", 5), ("y", 6), ("x", 7)])
+    assert a.key_layout is b.key_layout is c.key_layout is d.key_layout
+    assert a == record and b == {"x": 3, "y": 4} and d == {"x": 7, "y": 6}
+    c["x"] = 0
+    assert a["x"] == 1
+    # A split table's keys aren't hashed again
+    keys = (CountedKey("a"), CountedKey("b"))
+    first = SharedKeyPyDict.fromvalues(keys, [1, 2])
+    CountedKey.hashes = 0
+    assert SharedKeyPyDict(first).key_layout is first.key_layout
+    assert CountedKey.hashes == 0
+
+
+def test_duplicates_and_lengths_are_checked():
+    with pytest.raises(ValueError):
+        SharedKeyPyDict.fromvalues(("a", "a"), [1, 2])
+    with pytest.raises(ValueError):
+        SharedKeyPyDict.fromvalues(("a", "b"), [1])
+
+
+@pytest.mark.parametrize("change", [
+    lambda d: d.__setitem__("z", 0),
+    lambda d: d.__delitem__("x"),
+    lambda d: d.move_to_end("x"),
+    lambda d: d.popitem(),
+])
+def test_adding_deleting_or_moving_stops_sharing(change):
+    d = SharedKeyPyDict(x=1, y=2)
+    other = SharedKeyPyDict(x=3, y=4)
+    expected = PyDict(d)
+    change(d)
+    change(expected)
+    assert not d.shares_keys and d.key_layout is None
+    assert list(d.items()) == list(expected.items())
+    assert other.shares_keys and other == {"x": 3, "y": 4}
+
+
+def test_setting_existing_keys_keeps_sharing():
+    d = SharedKeyPyDict(x=1, y=2)
+    d["x"] = 10
+    d.set_many(["y", "x"], [20, 30])
+    assert d.shares_keys and d == {"x": 30, "y": 20}
+    copy = d.copy()
+    copy["y"] = 0
+    assert copy.key_layout is d.key_layout and d["y"] == 20
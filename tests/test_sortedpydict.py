@@ -0,0 +1,79 @@
+import bisect
+import random
+
+import pytest
+
+from pydict import SortedPyDict
+from pydict import sortedpydict
+
+
+@pytest.fixture(autouse=True)
+def small_sublists(monkeypatch):
+    "Split and merge the index's sublists after a few keys."
+    monkeypatch.setattr(sortedpydict, "_SORTED_LOAD", 4)
+
+
+def test_against_a_sorted_list():
+    rng = random.Random(1)
+    d, model = SortedPyDict(), {}
+    for i in range(2000):
+        key = rng.randrange(300)
+        if key in model and rng.random() < 0.5:
+            del d[key]
+            del model[key]
+        else:
+            d[key] = i
+            model[key] = i
+        if i % 100 == 0:
+            assert list(d.items()) == sorted(model.items())
+    keys = sorted(model)
+    assert list(d) == keys and list(reversed(d)) == keys[::-1]
+    assert len(d) == len(model) and all(d[key] == model[key] for key in keys)
+    assert len(d._lists) > 1
+    for probe in range(-5, 310, 7):
+        assert d.bisect_left(probe) == bisect.bisect_left(keys, probe)
+        assert d.bisect_right(probe) == bisect.bisect_right(keys, probe)
+    assert [d.peekitem(i)[0] for i in (0, 5, -1)] == [keys[0], keys[5], keys[-1]]
+
+
+def test_range_queries():
+    d = SortedPyDict.fromkeys(range(0, 100, 10))
+    assert list(d.irange(20, 50)) == [20, 30, 40, 50]
+    assert list(d.irange(20, 50, inclusive=(False, False))) == [30, 40]
+    assert list(d.irange(15, 45, reverse=True)) == [40, 30, 20]
+    assert list(d.irange(hi=10)) == [0, 10] and list(d.irange(lo=85)) == [90]
+    assert d.floor(25) == 20 and d.ceiling(25) == 30
+    assert d.floor(20) == 20 and d.ceiling(90) == 90
+    with pytest.raises(KeyError):
+        d.floor(-1)
+    assert d.ceiling(91, None) is None
+    it = d.irange()
+    next(it)
+    d[5] = None
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_popitem_copy_and_clear():
+    d = SortedPyDict({"b": 2, "c": 3, "a": 1})
+    assert d.popitem() == ("c", 3) and d.popitem(last=False) == ("a", 1)
+    c = d.copy()
+    c["z"] = 26
+    assert list(d) == ["b"] and list(c) == ["b", "z"]
+    c.clear()
+    assert len(c) == 0 and list(c) == []
+    with pytest.raises(KeyError):
+        c.popitem()
+    c["q"] = 1
+    assert list(c.items()) == [("q", 1)]
+
+
+def test_keys_are_kept_sorted():
+    d = SortedPyDict(b=1)
+    with pytest.raises(TypeError):
+        d.move_to_end("b")
+    # A key which can't be compared leaves d unchanged
+    with pytest.raises(TypeError):
+        d[1] = 1
+    assert list(d.items()) == [("b", 1)] and 1 not in d
+    assert repr(d) == "SortedPyDict({'b': 1})"
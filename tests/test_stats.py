@@ -0,0 +1,58 @@
+from pydict import pydict as PyDict, frozenpydict
+
+
+class Colliding(object):
+    "Key whose hash code is always 0"
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and self.name == other.name
+
+
+def test_fields():
+    d = PyDict.fromkeys(range(100), 0)
+    stats = d.stats()
+    assert list(stats) == ["length", "buckets", "load_factor", "empty_buckets", "chain_lengths",
+                           "longest_chain", "tree_buckets", "resizes", "memory"]
+    assert stats["length"] == 100
+    assert stats["load_factor"] == 100 / stats["buckets"]
+    assert sum(stats["chain_lengths"].values()) == stats["buckets"]
+    assert sum(length * count for length, count in stats["chain_lengths"].items()) == 100
+    assert list(stats["chain_lengths"]) == sorted(stats["chain_lengths"])
+    assert stats["longest_chain"] == max(stats["chain_lengths"])
+    assert stats["resizes"] > 0
+    assert set(stats["memory"]) == {"index", "entries", "order"}
+
+
+def test_empty():
+    stats = PyDict().stats()
+    assert stats["length"] == 0 and stats["empty_buckets"] == 1.0
+    assert stats["longest_chain"] == 0 and stats["resizes"] == 0
+
+
+def test_collisions_and_deletions():
+    keys = [Colliding(i) for i in range(5)]
+    d = PyDict.fromkeys(keys)
+    assert d.stats()["longest_chain"] == 5
+    del d[keys[0]]
+    stats = d.stats()
+    assert stats["length"] == 4 and stats["longest_chain"] == 4
+
+
+def test_frozen():
+    f = frozenpydict.fromkeys("abc", 1)
+    stats = f.stats()
+    assert stats["length"] == 3
+    assert sum(length * count for length, count in stats["chain_lengths"].items()) == 3
+
+
+def test_finishes_incremental_resize():
+    d = PyDict.fromkeys(range(5000), 0)
+    assert d._rehash is not None
+    stats = d.stats()
+    assert d._rehash is None
+    assert sum(length * count for length, count in stats["chain_lengths"].items()) == 5000
@@ -0,0 +1,81 @@
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict
+
+# Ints whose hash code is 0
+MODULUS = (1 << 61) - 1
+ZEROS = [i * MODULUS for i in range(1, 13)]
+
+
+class Colliding(object):
+    "Unordered key whose hash code is always 0"
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and self.name == other.name
+
+
+def tree_bins(d):
+    "Return the tree bins of d's hash table."
+    return [node for node in d._hash_table if node.__class__ is pydict._TreeBin]
+
+
+@pytest.mark.parametrize("keys", [ZEROS, [Colliding(i) for i in range(12)]])
+def test_long_chains_become_tree_bins(keys):
+    d = PyDict()
+    for i, key in enumerate(keys[:pydict._TREEIFY_THRESHOLD - 1]):
+        d[key] = i
+    assert tree_bins(d) == []
+    for i, key in enumerate(keys):
+        d[key] = i
+    [tree] = tree_bins(d)
+    assert len(tree) == len(keys) and d.stats()["tree_buckets"] == 1
+    assert list(d) == keys
+    assert all(d[key] == i for i, key in enumerate(keys))
+    assert all(key in d for key in keys)
+    d[keys[3]] = "x"
+    assert d[keys[3]] == "x" and len(d) == len(keys)
+    missing = ZEROS[-1] * 2 if keys is ZEROS else Colliding("missing")
+    assert missing not in d and d.get(missing) is None
+
+
+def test_ordered_keys_are_searched_by_key():
+    d = PyDict.fromkeys(ZEROS)
+    [tree] = tree_bins(d)
+    assert tree.key_type is int
+    assert [node.key for node in tree.nodes] == sorted(ZEROS)
+    # A key of another type with the same hash code can't be ordered with them
+    d[""] = "empty"
+    assert tree.key_type is None
+    assert d[""] == "empty" and all(key in d for key in ZEROS)
+
+
+def test_short_tree_bins_become_chains():
+    d = PyDict.fromkeys(ZEROS[:9])
+    assert len(tree_bins(d)) == 1
+    for key in ZEROS[:9 - pydict._UNTREEIFY_THRESHOLD]:
+        del d[key]
+    assert tree_bins(d) == [] and d.stats()["longest_chain"] == pydict._UNTREEIFY_THRESHOLD
+    assert list(d) == ZEROS[9 - pydict._UNTREEIFY_THRESHOLD:9]
+    with pytest.raises(KeyError):
+        del d[ZEROS[0]]
+
+
+def test_tree_bins_survive_resizes_copies_and_freezing():
+    d = PyDict.fromkeys(ZEROS, 1)
+    for i in range(1000):
+        d[i] = i
+    assert len(tree_bins(d)) == 1
+    assert all(d[key] == 1 for key in ZEROS)
+    copy = d.copy()
+    copy[ZEROS[0]] = 2
+    assert d[ZEROS[0]] == 1 and copy[ZEROS[0]] == 2
+    frozen = frozenpydict(d)
+    assert frozen[ZEROS[5]] == 1 and frozen.stats()["tree_buckets"] == 1
+    assert d.pop(ZEROS[5]) == 1 and ZEROS[5] not in d
+    assert d.popitem() == (999, 999)
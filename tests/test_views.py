@@ -0,0 +1,73 @@
+import collections.abc
+import sys
+
+import pytest
+
+import pydict
+from pydict import pydict as PyDict, frozenpydict
+
+
+@pytest.mark.parametrize("cls", [pydict.PyDictKeyView, pydict.PyDictItemView, pydict.PyDictValueView,
+                                 pydict.PyDictKeyIterator, pydict.PyDictReverseItemIterator])
+def test_only_the_package_constructs_views_and_iterators(cls):
+    with pytest.raises(TypeError):
+        cls(PyDict(a=1))
+    with pytest.raises(TypeError):
+        cls(PyDict(a=1), object())
+
+
+def test_no_frame_inspection(monkeypatch):
+    def getframe(*args):
+        raise AssertionError("frame inspected")
+    monkeypatch.setattr(sys, "_getframe", getframe)
+    d = PyDict(a=1, b=2)
+    assert list(d) == ["a", "b"] and list(reversed(d)) == ["b", "a"]
+    assert list(d.keys()) == ["a", "b"]
+    assert list(d.values()) == [1, 2]
+    assert list(reversed(d.items())) == [("b", 2), ("a", 1)]
+
+
+@pytest.mark.parametrize("make", [PyDict, frozenpydict, pydict.PersistentPyDict])
+def test_views_follow_their_mapping(make):
+    d = make([("a", 1), ("b", 2), ("c", 3)])
+    keys, values, items = d.keys(), d.values(), d.items()
+    assert isinstance(keys, collections.abc.KeysView)
+    assert isinstance(items, collections.abc.ItemsView)
+    assert isinstance(values, collections.abc.ValuesView)
+    assert len(keys) == len(values) == len(items) == 3
+    assert "a" in keys and "z" not in keys
+    assert ("b", 2) in items and ("b", 3) not in items
+    assert 5 not in items
+    assert 3 in values
+    assert keys & {"a", "z"} == {"a"}
+    assert keys | {"z"} == {"a", "b", "c", "z"}
+    assert keys - {"a"} == {"b", "c"}
+    assert keys ^ {"a", "z"} == {"b", "c", "z"}
+    assert keys == {"a", "b", "c"} and keys <= {"a", "b", "c", "d"}
+    assert not keys.isdisjoint(["c"])
+    if isinstance(d, PyDict):
+        d["d"] = 4
+        del d["a"]
+        assert list(keys) == ["b", "c", "d"] and list(values) == [2, 3, 4]
+        assert list(reversed(items)) == [("d", 4), ("c", 3), ("b", 2)]
+        assert keys.mapping == {"b": 2, "c": 3, "d": 4}
+    else:
+        assert keys.mapping is d
+
+
+def test_iterators_skip_deleted_keys_and_notice_changes():
+    d = PyDict.fromkeys(range(10))
+    for key in range(0, 10, 2):
+        del d[key]
+    assert list(d) == [1, 3, 5, 7, 9]
+    assert list(reversed(d.values())) == [None] * 5
+    it = iter(d.items())
+    assert next(it) == (1, None)
+    d[10] = None
+    with pytest.raises(RuntimeError):
+        next(it)
+    it = iter(d)
+    assert iter(it) is it
+    assert list(it) == [1, 3, 5, 7, 9, 10]
+    with pytest.raises(StopIteration):
+        next(it)
@@ -0,0 +1,89 @@
+import gc
+import weakref
+
+import pytest
+
+from pydict import WeakKeyPyDict, WeakValuePyDict
+
+
+class Obj(object):
+    "Weakly referenceable object"
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Obj({self.name!r})"
+
+
+def test_dead_keys_disappear_and_are_removed_in_a_batch():
+    keys = [Obj(i) for i in range(5)]
+    d = WeakKeyPyDict((key, key.name) for key in keys)
+    assert len(d) == 5 and d[keys[1]] == 1
+    del keys[1:3]
+    gc.collect()
+    assert len(d) == 3
+    assert list(d.values()) == [0, 3, 4]
+    assert len(d._pending) == 2 and d._used == 5
+    extra = Obj("x")
+    d[extra] = "x"
+    assert d._pending == [] and d._used == 4
+    assert list(d.items()) == [(keys[0], 0), (keys[1], 3), (keys[2], 4), (extra, "x")]
+
+
+def test_keys_dying_during_iteration():
+    keys = [Obj(i) for i in range(4)]
+    d = WeakKeyPyDict.fromkeys(keys, 0)
+    it = iter(d)
+    assert next(it) is keys[0]
+    del keys[1]
+    gc.collect()
+    assert list(it) == keys[1:]
+    assert list(reversed(d)) == keys[::-1]
+
+
+def test_weak_key_methods():
+    a, b = Obj("a"), Obj("b")
+    d = WeakKeyPyDict({a: 1, b: 2})
+    assert a in d and Obj("c") not in d and 5 not in d
+    d.move_to_end(a)
+    assert list(d) == [b, a]
+    assert d.popitem() == (a, 1)
+    del d[b]
+    with pytest.raises(KeyError):
+        del d[b]
+    with pytest.raises(KeyError):
+        d[b]
+    with pytest.raises(TypeError):
+        d[5] = 5
+
+
+def test_dead_values_disappear():
+    values = [Obj(i) for i in range(3)]
+    d = WeakValuePyDict(zip("abc", values))
+    del values[0]
+    gc.collect()
+    assert "a" not in d and list(d) == ["b", "c"] and len(d) == 2
+    with pytest.raises(KeyError):
+        d["a"]
+    d.popitem(last=False)
+    assert list(d.items()) == [("c", values[1])]
+
+
+def test_reassigned_values_survive_the_old_one():
+    old, new = Obj("old"), Obj("new")
+    d = WeakValuePyDict(k=old)
+    d["k"] = new
+    del old
+    gc.collect()
+    d["other"] = new
+    assert d["k"] is new and len(d) == 2
+
+
+def test_weak_pydicts_dont_keep_themselves_alive():
+    key = Obj("k")
+    d = WeakKeyPyDict({key: 1})
+    ref = weakref.ref(d)
+    del d
+    gc.collect()
+    assert ref() is None
+    del key